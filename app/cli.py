@@ -0,0 +1,345 @@
+"""
+Command-line interface - Batch resume parsing over files and directories
+
+Usage:
+    python -m app.cli --input path/to/resumes --output output --workers 8
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from app.config import (SUPPORTED_EXTENSIONS, OUTPUT_DIR, NLP_PROFILE, NLP_PROFILES, MAX_PAGES,
+                        DOCUMENT_TIMEOUT, ISOLATE_CONVERSION, MANIFEST_MAX_RETRIES)
+from app.parser.resume_parser import ResumeParser, FIELDS, DEFAULT_FIELDS
+from app.parser.utils import is_valid_file_extension, generate_txt_output, compute_content_hash
+from app.result_cache import ResultCache
+from app.metrics import MetricsCollector, JsonLogObserver
+from app.output import JsonlSink
+from app.manifest import BatchManifest
+
+# Parser owned by the current worker process and the fields it extracts (set by _init_worker)
+_worker_parser = None
+_worker_fields = DEFAULT_FIELDS
+
+# Document records of the current worker, passed back to the main process
+# when the batch has observers
+_worker_records = []
+
+def find_resumes(input_path):
+    """
+    Find resume files to parse
+
+    Args:
+        input_path: A file, a directory (searched recursively) or a glob pattern
+
+    Yields:
+        str: Paths of files with a supported extension, in a stable order
+    """
+    if os.path.isdir(input_path):
+        for root, dirs, files in os.walk(input_path):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                if is_valid_file_extension(path, SUPPORTED_EXTENSIONS):
+                    yield path
+    elif os.path.isfile(input_path):
+        if is_valid_file_extension(input_path, SUPPORTED_EXTENSIONS):
+            yield input_path
+    else:
+        for path in sorted(glob.glob(input_path, recursive=True)):
+            if os.path.isfile(path) and is_valid_file_extension(path, SUPPORTED_EXTENSIONS):
+                yield path
+
+def input_root(input_path):
+    """
+    Directory that result file names are made relative to
+
+    Args:
+        input_path: The --input value (file, directory or glob pattern)
+
+    Returns:
+        str: The directory itself, the file's directory, or the directory
+            part of a glob pattern before its first wildcard
+    """
+    if os.path.isdir(input_path):
+        return input_path
+    if not os.path.isfile(input_path):
+        wildcards = [index for index in map(input_path.find, '*?[') if index != -1]
+        if wildcards:
+            input_path = input_path[:min(wildcards)]
+            if input_path.endswith(os.sep) or (os.altsep and input_path.endswith(os.altsep)):
+                return input_path
+    return os.path.dirname(input_path)
+
+def output_name(path, root=None):
+    """
+    Result file name of a resume, without the .json/.txt suffix
+
+    The path relative to the input root is kept, extension included, so
+    files with the same name in different directories or formats do not
+    overwrite each other's results (in/a/r.pdf -> a/r.pdf).
+
+    Args:
+        path: Resume file
+        root: Input root from input_root (None for the file name alone)
+
+    Returns:
+        str: Relative output name
+    """
+    if root is None:
+        return os.path.basename(path)
+    relative = os.path.relpath(path, root or os.curdir)
+    # Paths outside the root (e.g. through '..' in a glob) keep just their name
+    return os.path.basename(path) if relative.startswith(os.pardir) else relative
+
+def _init_worker(profile, use_cache, max_pages, timeout, isolate_conversion, instrument,
+                 fields=DEFAULT_FIELDS):
+    """Process pool initializer - build the worker's parser and load its model once"""
+    global _worker_parser, _worker_fields
+    _worker_parser = ResumeParser(profile=profile, cache=ResultCache() if use_cache else None,
+                                  max_pages=max_pages, timeout=timeout,
+                                  isolate_conversion=isolate_conversion,
+                                  observers=[_worker_records.append] if instrument else None)
+    _worker_fields = fields
+    if 'skills' in fields:
+        _worker_parser.nlp  # Load the spaCy pipeline before the first document arrives
+
+def _process_file(path, output_dir, output_format, name=None):
+    """
+    Parse one resume in a worker and write its result file
+
+    Args:
+        path: Resume file
+        output_dir: Directory for the result file, or None to send the
+            result back to the main process instead
+        output_format: 'json' or 'txt'
+        name: Result file name without suffix (see output_name); defaults
+            to the file name
+
+    Returns:
+        tuple: (path, error, record, result) where error is None on success,
+            record is the document's metrics record (None without observers)
+            and result is only set when output_dir is None
+    """
+    _worker_records.clear()
+    try:
+        result = _worker_parser.parse(path, _worker_fields, raise_errors=True)
+    except Exception as e:
+        return path, str(e) or type(e).__name__, _worker_records[-1] if _worker_records else None, None
+    record = _worker_records[-1] if _worker_records else None
+    if output_dir is None:
+        return path, None, record, result
+
+    try:
+        output_path = os.path.join(output_dir, (name or os.path.basename(path)) + '.' + output_format)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if output_format == 'json':
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=4)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(generate_txt_output(result))
+        return path, None, record, None
+    except Exception as e:
+        return path, str(e), None, None
+
+def run_batch(paths, output_dir, workers=None, profile=NLP_PROFILE, output_format='json',
+              use_cache=False, max_pages=MAX_PAGES, timeout=DOCUMENT_TIMEOUT,
+              isolate_conversion=ISOLATE_CONVERSION, observers=None, sink=None, manifest=None,
+              fields=None, root=None):
+    """
+    Parse resumes over a pool of worker processes
+
+    Each worker loads the spaCy pipeline once in its initializer (unless
+    skills are not among the fields) and then parses any number of files. Only a bounded number of files is in flight
+    at a time, so arbitrarily large inputs can be streamed through.
+
+    Args:
+        paths: Iterable of resume file paths
+        output_dir: Directory to write one result file per resume into (not
+            used when a sink is given)
+        workers: Number of worker processes (defaults to the CPU count)
+        profile: spaCy pipeline profile used by the workers
+        output_format: 'json' or 'txt'
+        use_cache: Reuse results of previously parsed identical files (see ResultCache)
+        max_pages: Only read this many pages of each PDF (None for no limit)
+        timeout: Wall-clock seconds per document (None for no limit)
+        isolate_conversion: Convert each file in a subprocess that is killed on timeout
+        observers: Callables receiving each document's metrics record (see
+            app.metrics); records are collected in the workers and passed on here
+        sink: Optional JsonlSink; results are then streamed into it, one line
+            each with the input 'path' added, instead of written as files
+        manifest: Optional BatchManifest; files it lists as completed with the
+            same content are skipped, and every outcome is recorded in it.
+            Outputs are synced before each manifest checkpoint.
+        fields: Result fields to extract (see FIELDS in app.parser.resume_parser);
+            None for the default fields
+        root: Input root (see input_root); result files mirror the paths
+            below it, otherwise they are named after the file alone
+
+    Returns:
+        dict: Summary with 'processed', 'skipped' (files the manifest had
+            already completed or given up on), 'failures' (list of (path, error))
+            and 'elapsed'
+    """
+    workers = workers or os.cpu_count() or 1
+    fields = tuple(fields or DEFAULT_FIELDS)
+    if sink is None:
+        os.makedirs(output_dir, exist_ok=True)
+    else:
+        output_dir = None
+
+    processed = 0
+    skipped = 0
+    failures = []
+    content_hashes = {}  # Hash of every file in flight, for the manifest
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(profile, use_cache, max_pages, timeout,
+                                       isolate_conversion, bool(observers), fields)) as executor:
+        pending = set()
+        paths = iter(paths)
+        exhausted = False
+
+        while pending or not exhausted:
+            # Keep every worker busy without queueing the whole input up front
+            while not exhausted and len(pending) < workers * 4:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                if manifest is not None:
+                    try:
+                        content_hash = compute_content_hash(path)
+                    except OSError as e:
+                        processed += 1
+                        failures.append((path, str(e)))
+                        continue
+                    if not manifest.should_process(path, content_hash):
+                        skipped += 1
+                        continue
+                    content_hashes[path] = content_hash
+                pending.add(executor.submit(_process_file, path, output_dir, output_format,
+                                             output_name(path, root)))
+
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, error, record, result = future.result()
+                processed += 1
+                if error:
+                    failures.append((path, error))
+                elif sink is not None:
+                    sink.write({'path': path, **result})
+                if record is not None:
+                    for observer in observers:
+                        observer(record)
+                if manifest is not None:
+                    manifest.record(path, content_hashes.pop(path), error)
+
+            if manifest is not None and manifest.checkpoint_due():
+                # Outputs must be on disk before the manifest says they are done
+                if sink is not None:
+                    sink.sync()
+                manifest.checkpoint()
+
+    if manifest is not None:
+        if sink is not None:
+            sink.sync()
+        manifest.checkpoint()
+
+    return {
+        'processed': processed,
+        'skipped': skipped,
+        'failures': failures,
+        'elapsed': time.perf_counter() - start_time
+    }
+
+def main(argv=None):
+    """Entry point for python -m app.cli"""
+    arg_parser = argparse.ArgumentParser(description="Parse resumes in bulk and write one result file per resume.")
+    arg_parser.add_argument('--input', '-i', required=True,
+                            help="Resume file, directory (searched recursively) or glob pattern")
+    arg_parser.add_argument('--output', '-o', default=OUTPUT_DIR,
+                            help="Directory for parsed results (default: output/)")
+    arg_parser.add_argument('--format', '-f', choices=['json', 'txt'], default='json',
+                            help="Output format (default: json)")
+    arg_parser.add_argument('--jsonl', default=None,
+                            help="Stream all results into this JSON Lines file instead of one file per "
+                                 "resume (.gz or .zst to compress)")
+    arg_parser.add_argument('--manifest', default=None,
+                            help="Manifest file making the run resumable: completed files are skipped "
+                                 "on the next run and failed ones retried")
+    arg_parser.add_argument('--max-retries', type=int, default=MANIFEST_MAX_RETRIES,
+                            help=f"Times a failed file is retried on later runs (default: {MANIFEST_MAX_RETRIES})")
+    arg_parser.add_argument('--workers', '-w', type=int, default=None,
+                            help="Number of worker processes (default: number of CPUs)")
+    arg_parser.add_argument('--profile', '-p', choices=sorted(NLP_PROFILES), default=NLP_PROFILE,
+                            help=f"spaCy pipeline profile (default: {NLP_PROFILE})")
+    arg_parser.add_argument('--max-pages', type=int, default=MAX_PAGES,
+                            help="Only read this many pages of each PDF (default: all pages)")
+    arg_parser.add_argument('--timeout', type=float, default=DOCUMENT_TIMEOUT,
+                            help="Seconds per document before it is returned partially parsed (default: no limit)")
+    arg_parser.add_argument('--isolate', action='store_true', default=ISOLATE_CONVERSION,
+                            help="Convert each file in a subprocess that is killed on timeout")
+    arg_parser.add_argument('--metrics', default=None,
+                            help="Write Prometheus metrics (per-stage times, sizes, failures) to this file")
+    arg_parser.add_argument('--log-json', action='store_true',
+                            help="Log one JSON record per document to stderr")
+    arg_parser.add_argument('--cache', action='store_true',
+                            help="Reuse cached results for files that were parsed before")
+    arg_parser.add_argument('--fields', default=None,
+                            help=f"Comma-separated result fields to extract, from {', '.join(FIELDS)} "
+                                 f"(default: {','.join(DEFAULT_FIELDS)}); without skills spaCy is not loaded")
+    args = arg_parser.parse_args(argv)
+
+    fields = [field.strip() for field in args.fields.split(',')] if args.fields else None
+    unknown = set(fields or ()).difference(FIELDS)
+    if unknown:
+        arg_parser.error(f"unknown fields: {', '.join(sorted(unknown))}")
+
+    collector = MetricsCollector() if args.metrics else None
+    observers = [observer for observer in (collector, JsonLogObserver() if args.log_json else None) if observer]
+
+    try:
+        # A resumed run adds to the results of the previous ones
+        sink = JsonlSink(args.jsonl, append=bool(args.manifest)) if args.jsonl else None
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    manifest = BatchManifest(args.manifest, max_retries=args.max_retries) if args.manifest else None
+    try:
+        summary = run_batch(find_resumes(args.input), args.output, workers=args.workers,
+                            profile=args.profile, output_format=args.format, use_cache=args.cache,
+                            max_pages=args.max_pages, timeout=args.timeout,
+                            isolate_conversion=args.isolate, observers=observers, sink=sink,
+                            manifest=manifest, fields=fields, root=input_root(args.input))
+    finally:
+        if sink is not None:
+            sink.close()
+        if manifest is not None:
+            manifest.close()
+    if collector is not None:
+        collector.write_prometheus(args.metrics)
+
+    processed = summary['processed']
+    failures = summary['failures']
+    elapsed = summary['elapsed']
+    rate = processed / elapsed if elapsed > 0 else 0.0
+
+    for path, error in failures:
+        print(f"FAILED {path}: {error}", file=sys.stderr)
+    print(f"Parsed {processed - len(failures)}/{processed} resumes in {elapsed:.2f}s "
+          f"({rate:.2f} docs/sec), {len(failures)} failures")
+    if summary['skipped']:
+        print(f"Skipped {summary['skipped']} unchanged resumes that were completed or are out of retries")
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,16 +9,88 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # Data directory
 DATA_DIR = os.path.join(BASE_DIR, 'app', 'data')
 
+# Default directory for parsed results written by the CLI
+OUTPUT_DIR = os.path.join(BASE_DIR, 'output')
+
+# Directory for caches that can be safely deleted at any time
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')
+
 # NLP settings
 NLP_MODEL = "en_core_web_lg"  # spaCy model to use
 
+# spaCy pipeline profiles, selectable per ResumeParser.
+# Skills extraction only needs noun chunks, which rely on the tagger,
+# parser and attribute ruler; everything else can be left out.
+#   model:   spaCy package to load (None builds a blank English tokenizer)
+#   exclude: components that are never loaded (saves load time and memory)
+#   disable: components that are loaded but not run
+NLP_PROFILES = {
+    # Complete pipeline, including NER and the lemmatizer
+    'full': {'model': NLP_MODEL, 'exclude': [], 'disable': []},
+    # Only what noun chunking needs
+    'parser-only': {'model': NLP_MODEL, 'exclude': ['ner', 'lemmatizer'], 'disable': []},
+    # No statistical components or vectors at all; skills are chunked by rules
+    'tokenizer-only': {'model': None, 'exclude': [], 'disable': []},
+    # Small model without vectors, with the same components as 'parser-only'
+    'small': {'model': 'en_core_web_sm', 'exclude': ['ner', 'lemmatizer'], 'disable': []}
+}
+NLP_PROFILE = 'full'  # Profile used when a parser does not ask for one
+
 # Supported file types
 SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.doc', '.txt']
 
+# Per-document limits enforced by ResumeParser (None disables a limit). A
+# document that hits one is returned partially parsed, with the reason under
+# 'limit_exceeded'.
+MAX_PAGES = None                            # Only the first MAX_PAGES pages of a PDF are read
+MAX_DOCUMENT_BYTES = 20 * 1024 * 1024       # Larger files are not converted at all
+MAX_DOCUMENT_CHARS = 1000000                # Converted text beyond this is dropped
+DOCUMENT_TIMEOUT = None                     # Wall-clock seconds per document
+ISOLATE_CONVERSION = False                  # Convert in a subprocess that is killed on timeout
+
+# Documents a parser works on at once in parse_async / parse_many_async
+ASYNC_MAX_IN_FLIGHT = 8
+
+# Converter backend per file type (see app/parser/backends.py). None uses the
+# fastest acceptable backend found by the last benchmark, or the default.
+CONVERTER_BACKENDS = {
+    '.pdf': None,   # 'pdfminer' or 'pypdf2'
+    '.docx': None,  # 'docx2txt' or 'python-docx'
+    '.doc': None,
+    '.txt': None
+}
+# Backends must reproduce at least this share of the default backend's words
+BACKEND_MIN_QUALITY = 0.95
+
+# JSON Lines output (app/output.py)
+JSONL_FLUSH_INTERVAL = 0.5   # Seconds before written results become visible to readers
+JSONL_FSYNC_INTERVAL = 30.0  # Seconds between forced writes to disk (None: only when closing)
+
+# Resumable batch jobs (app/manifest.py)
+MANIFEST_CHECKPOINT_INTERVAL = 5.0  # Seconds between manifest commits during a run
+MANIFEST_MAX_RETRIES = 2            # Times a failed document is retried on later runs
+
+# HTTP service (python -m app.server)
+SERVER_HOST = '127.0.0.1'
+SERVER_PORT = 8000
+SERVER_MAX_REQUEST_BYTES = 50 * 1024 * 1024  # Larger uploads are rejected with 413
+BATCH_MAX_SIZE = 16    # Documents per micro-batch
+BATCH_MAX_WAIT = 0.01  # Seconds the first document of a batch waits for more to arrive
+
 # File paths for reference data
 COMMON_SKILLS_FILE = os.path.join(DATA_DIR, 'common_skills.json')
 JOB_TITLES_FILE = os.path.join(DATA_DIR, 'job_titles.json')
 
+# Compiled matchers built from the reference data, reused across processes
+REFERENCE_CACHE_FILE = os.path.join(CACHE_DIR, 'reference_data.pickle')
+
+# Backend selection recorded by python -m app.parser.backends
+CONVERTER_BENCHMARK_FILE = os.path.join(CACHE_DIR, 'converter_backends.json')
+
+# Optional cache of parse results, keyed by file content
+RESULT_CACHE_FILE = os.path.join(CACHE_DIR, 'results.sqlite3')
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Least recently used results are evicted beyond this
+
 # Section identification settings
 SECTION_HEADERS = {
     'experience': ['experience', 'work experience', 'employment', 'work history', 'professional experience'],
@@ -0,0 +1,132 @@
+"""
+Manifest module - Resumable bookkeeping for long batch runs
+
+A manifest records every input of a batch job with its content hash, status,
+last error and number of attempts, in a SQLite file. Updates are grouped
+into transactions that are committed at checkpoints, so after a crash the
+manifest is exactly as of the last checkpoint; documents finished after it
+are simply parsed again.
+
+On a re-run, documents whose content hash matches a completed entry are
+skipped (one hash per file), failed ones are retried until they reach the
+retry limit, and changed files start over.
+"""
+import os
+import sqlite3
+import time
+from app.config import MANIFEST_CHECKPOINT_INTERVAL, MANIFEST_MAX_RETRIES
+
+DONE = 'done'
+FAILED = 'failed'
+
+class BatchManifest:
+    """Processed inputs of a batch job, checkpointed to SQLite"""
+
+    def __init__(self, path, checkpoint_interval=MANIFEST_CHECKPOINT_INTERVAL,
+                 max_retries=MANIFEST_MAX_RETRIES):
+        """
+        Open (or create) a manifest
+
+        Args:
+            path: SQLite file of the manifest
+            checkpoint_interval: Seconds between checkpoints while documents are recorded
+            max_retries: How many times a failed document is tried again on later runs
+        """
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.max_retries = max_retries
+        self._last_checkpoint = time.monotonic()
+        self._uncommitted = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Transactions are managed explicitly: one per checkpoint
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            'path TEXT PRIMARY KEY, content_hash TEXT NOT NULL, status TEXT NOT NULL, '
+            'error TEXT, attempts INTEGER NOT NULL, updated REAL NOT NULL)'
+        )
+
+    def should_process(self, path, content_hash):
+        """
+        Decide whether a document has to be parsed in this run
+
+        Args:
+            path: Input file
+            content_hash: Current content hash of the file
+
+        Returns:
+            bool: False if it was completed with the same content, or failed
+                with the same content more often than the retry limit allows
+        """
+        row = self._connection.execute(
+            'SELECT content_hash, status, attempts FROM documents WHERE path = ?',
+            (_key(path),)
+        ).fetchone()
+        if row is None or row[0] != content_hash:
+            return True
+        if row[1] == DONE:
+            return False
+        return row[2] <= self.max_retries
+
+    def record(self, path, content_hash, error=None):
+        """
+        Record the outcome of a document (committed at the next checkpoint)
+
+        Args:
+            path: Input file
+            content_hash: Content hash the document was parsed with
+            error: Error message if parsing failed, None on success
+        """
+        key = _key(path)
+        row = self._connection.execute(
+            'SELECT content_hash, attempts FROM documents WHERE path = ?', (key,)
+        ).fetchone()
+        # Attempts count the tries on the current content only
+        attempts = row[1] + 1 if row is not None and row[0] == content_hash else 1
+
+        if self._uncommitted == 0:
+            self._connection.execute('BEGIN')
+        self._connection.execute(
+            'INSERT OR REPLACE INTO documents (path, content_hash, status, error, attempts, updated) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, content_hash, FAILED if error else DONE, error, attempts, time.time())
+        )
+        self._uncommitted += 1
+
+    def checkpoint_due(self):
+        """Whether there are uncommitted records and the checkpoint interval has passed"""
+        return (self._uncommitted > 0 and
+                time.monotonic() - self._last_checkpoint >= self.checkpoint_interval)
+
+    def checkpoint(self):
+        """Atomically commit everything recorded since the last checkpoint"""
+        if self._uncommitted:
+            self._connection.execute('COMMIT')
+            self._uncommitted = 0
+        self._last_checkpoint = time.monotonic()
+
+    def summary(self):
+        """
+        Count the recorded documents by status
+
+        Returns:
+            dict: Status -> number of documents (as of the last record)
+        """
+        return dict(self._connection.execute('SELECT status, COUNT(*) FROM documents GROUP BY status'))
+
+    def close(self):
+        """Commit outstanding records and close the manifest"""
+        self.checkpoint()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _key(path):
+    """Manifest key of an input file (so relative and absolute paths match)"""
+    return os.path.abspath(path)
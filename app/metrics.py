@@ -0,0 +1,330 @@
+"""
+Metrics module - Per-document instrumentation for the resume parser
+
+A parser given observers (ResumeParser(observers=[...])) builds one record
+per document and hands it to each observer. An observer is any callable
+taking the record; two are built in:
+
+- MetricsCollector aggregates records into counters and exposes them as a
+  Prometheus text exposition (or a JSON snapshot)
+- JsonLogObserver writes every record as one line of JSON
+
+A record is a plain dict:
+    file_name: Display name of the document
+    status:    'ok', 'partial' (a limit was hit), 'cached' or 'failed'
+    failure:   Failure category for failed documents ('io', 'unsupported_format',
+               'conversion', 'extraction' or 'cache'), otherwise None
+    error:     Error message for failed documents
+    limit:     Name of the limit that was hit for partial documents
+    seconds:   Wall-clock time for the document
+    stages:    Seconds spent in each stage ('cache', 'convert', 'preprocess',
+               'sections', then one per extracted section)
+    bytes, pages, chars: Input size (None when unknown or not reached)
+    sections:  Names of the non-empty sections found
+
+Without observers none of this is computed.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds of the document duration histogram, in seconds
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Start of the converter's error messages for files it cannot handle
+_FORMAT_ERRORS = ('Unsupported file format', 'Cannot detect file format', 'Unsupported input type')
+
+class DocumentTrace:
+    """
+    Collects the record of one document while it is being parsed
+
+    Stage times are exclusive: when a stage pulls data from another one (for
+    example section identification consuming converted pages), the time
+    spent in the inner stage is only counted for the inner stage.
+    """
+
+    def __init__(self, file_name):
+        self.record = {
+            'file_name': file_name,
+            'status': None,
+            'failure': None,
+            'error': None,
+            'limit': None,
+            'seconds': None,
+            'stages': {},
+            'bytes': None,
+            'pages': None,
+            'chars': None,
+            'sections': []
+        }
+        self.stage = None
+        self._failed_stage = None
+        self._started = time.perf_counter()
+        self._stack = []
+        self._mark = None
+
+    @contextmanager
+    def timed(self, stage):
+        """Context manager timing a stage"""
+        self._enter(stage)
+        try:
+            yield
+        except BaseException:
+            self._failed(stage)
+            raise
+        finally:
+            self._exit()
+
+    def iter_timed(self, stage, iterable):
+        """Yield from an iterable, timing the work done to produce each item as a stage"""
+        iterator = iter(iterable)
+        while True:
+            self._enter(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            except BaseException:
+                self._failed(stage)
+                raise
+            finally:
+                self._exit()
+            yield item
+
+    def iter_pages(self, pages):
+        """Time conversion and count pages and characters as pages are pulled"""
+        self.record['pages'] = 0
+        self.record['chars'] = 0
+        for page in self.iter_timed('convert', pages):
+            self.record['pages'] += 1
+            self.record['chars'] += len(page)
+            yield page
+
+    def finish(self, status, error=None, result=None, sections=None):
+        """
+        Complete the record
+
+        Args:
+            status: 'ok', 'cached' or 'failed' ('ok' becomes 'partial' when
+                the result carries 'limit_exceeded')
+            error: Exception that made the document fail
+            result: Parse result
+            sections: Sections dict the result was extracted from
+
+        Returns:
+            dict: The record
+        """
+        record = self.record
+        record['seconds'] = time.perf_counter() - self._started
+        if sections:
+            record['sections'] = [section for section, text in sections.items() if text]
+        if result is not None and 'limit_exceeded' in result:
+            status = 'partial'
+            record['limit'] = result['limit_exceeded']['limit']
+        if error is not None:
+            record['failure'] = categorize_failure(error, self._failed_stage or self.stage)
+            record['error'] = str(error)
+        record['status'] = status
+        return record
+
+    def _enter(self, stage):
+        now = time.perf_counter()
+        if self._stack:
+            self._charge(now)
+        self._stack.append(stage)
+        self.stage = stage
+        self._mark = now
+
+    def _exit(self):
+        self._charge(time.perf_counter())
+        self._stack.pop()
+        # Errors raised from here on belong to the enclosing stage, if any
+        self.stage = self._stack[-1] if self._stack else None
+
+    def _failed(self, stage):
+        """Remember the innermost stage an exception was raised in"""
+        if self._failed_stage is None:
+            self._failed_stage = stage
+
+    def _charge(self, now):
+        """Add the time since the last mark to the innermost running stage"""
+        stages = self.record['stages']
+        stage = self._stack[-1]
+        stages[stage] = stages.get(stage, 0.0) + now - self._mark
+        self._mark = now
+
+def categorize_failure(error, stage):
+    """
+    Failure category for an exception raised while parsing
+
+    Args:
+        error: The exception
+        stage: Stage that was running when it was raised
+
+    Returns:
+        str: 'io', 'unsupported_format', 'conversion', 'extraction' or 'cache'
+    """
+    if isinstance(error, OSError):
+        return 'io'
+    if isinstance(error, ValueError) and str(error).startswith(_FORMAT_ERRORS):
+        return 'unsupported_format'
+    if stage == 'cache':
+        return 'cache'
+    if stage in (None, 'convert'):
+        return 'conversion'
+    return 'extraction'
+
+class MetricsCollector:
+    """
+    Observer aggregating document records into counters
+
+    Thread-safe, so one collector can be shared by parsers on several threads.
+    """
+
+    def __init__(self, prefix='resume_parser'):
+        """
+        Args:
+            prefix: Prefix of the exposed metric names
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, record):
+        """Add a document record"""
+        with self._lock:
+            _increment(self._documents, record['status'])
+            if record['failure']:
+                _increment(self._failures, record['failure'])
+            if record['limit']:
+                _increment(self._limits, record['limit'])
+            for stage, seconds in record['stages'].items():
+                _increment(self._stage_seconds, stage, seconds)
+            for section in record['sections']:
+                _increment(self._sections, section)
+            for size in ('bytes', 'pages', 'chars'):
+                if record[size]:
+                    _increment(self._sizes, size, record[size])
+
+            seconds = record['seconds'] or 0.0
+            self._duration_sum += seconds
+            self._duration_count += 1
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    self._duration_buckets[index] += 1
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._documents = {}
+            self._failures = {}
+            self._limits = {}
+            self._stage_seconds = {}
+            self._sections = {}
+            self._sizes = {}
+            self._duration_sum = 0.0
+            self._duration_count = 0
+            self._duration_buckets = [0] * len(DURATION_BUCKETS)
+
+    def snapshot(self):
+        """
+        Current totals
+
+        Returns:
+            dict: 'documents' (by status), 'failures' (by category), 'limits',
+                'stage_seconds', 'sections_found', 'input' (bytes, pages,
+                chars) and 'document_seconds' ('sum', 'count')
+        """
+        with self._lock:
+            return {
+                'documents': dict(self._documents),
+                'failures': dict(self._failures),
+                'limits': dict(self._limits),
+                'stage_seconds': dict(self._stage_seconds),
+                'sections_found': dict(self._sections),
+                'input': dict(self._sizes),
+                'document_seconds': {'sum': self._duration_sum, 'count': self._duration_count}
+            }
+
+    def to_prometheus(self):
+        """
+        Render the totals in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        prefix = self.prefix
+        with self._lock:
+            lines = []
+            _add_metric(lines, f"{prefix}_documents_total", 'counter',
+                        "Documents processed, by outcome", 'status', self._documents)
+            _add_metric(lines, f"{prefix}_failures_total", 'counter',
+                        "Failed documents, by failure category", 'category', self._failures)
+            _add_metric(lines, f"{prefix}_limits_exceeded_total", 'counter',
+                        "Partially parsed documents, by limit hit", 'limit', self._limits)
+            _add_metric(lines, f"{prefix}_stage_seconds_total", 'counter',
+                        "Time spent in each pipeline stage", 'stage', self._stage_seconds)
+            _add_metric(lines, f"{prefix}_sections_found_total", 'counter',
+                        "Documents in which each section was found", 'section', self._sections)
+            for size in ('bytes', 'pages', 'chars'):
+                _add_metric(lines, f"{prefix}_input_{size}_total", 'counter',
+                            f"Input {size} of parsed documents", None, {None: self._sizes.get(size, 0)})
+
+            name = f"{prefix}_document_seconds"
+            lines.append(f"# HELP {name} Wall-clock time per document")
+            lines.append(f"# TYPE {name} histogram")
+            for bound, count in zip(DURATION_BUCKETS, self._duration_buckets):
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{le="+Inf"}} {self._duration_count}')
+            lines.append(f"{name}_sum {self._duration_sum}")
+            lines.append(f"{name}_count {self._duration_count}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """
+        Write the exposition to a file atomically (e.g. for node_exporter's textfile collector)
+
+        Args:
+            path: Target file
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+class JsonLogObserver:
+    """
+    Observer writing every document record as one line of JSON
+    """
+
+    def __init__(self, stream=None):
+        """
+        Args:
+            stream: Text stream to write to (defaults to sys.stderr)
+        """
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        """Write a document record"""
+        line = json.dumps({'event': 'resume_parsed', **record})
+        stream = self.stream or sys.stderr
+        with self._lock:
+            stream.write(line + '\n')
+            stream.flush()
+
+def _increment(counts, key, amount=1):
+    counts[key] = counts.get(key, 0) + amount
+
+def _add_metric(lines, name, metric_type, description, label, values):
+    """Append one metric family with a sample per label value"""
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {metric_type}")
+    for value, number in sorted(values.items(), key=lambda item: str(item[0])):
+        labels = f'{{{label}="{value}"}}' if label else ''
+        lines.append(f"{name}{labels} {number}")
@@ -0,0 +1,204 @@
+"""
+Output module - Streaming JSON Lines sink for parse results
+
+Every result is written as one line of JSON as soon as it is available, so
+memory use does not grow with the number of documents and other tools can
+follow the file while a run is in progress (e.g. tail -f, or zcat on a
+gzip file, which is flushed in complete blocks).
+
+Usage:
+    with JsonlSink('results.jsonl.gz') as sink:
+        for result in parser.parse_many(paths):
+            if result is not None:
+                sink.write(result)
+"""
+import gzip
+import json
+import os
+import time
+from app.config import JSONL_FLUSH_INTERVAL, JSONL_FSYNC_INTERVAL
+
+# Compression picked from the file extension when none is given
+_EXTENSION_COMPRESSION = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+# (package name, encode function) of the JSON encoder, chosen on first use
+_json_encoder = None
+
+def encode_json(document):
+    """
+    Encode a result as compact JSON with the fastest encoder available
+
+    orjson or msgspec is used when installed, the standard library otherwise;
+    all of them produce JSON that reads back to the same values.
+
+    Args:
+        document: JSON-serialisable dict, or a record with to_dict() (see
+            app.parser.records)
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if hasattr(document, 'to_dict'):
+        document = document.to_dict()
+    return _get_json_encoder()[1](document)
+
+def json_encoder_name():
+    """Name of the package encode_json uses ('orjson', 'msgspec' or 'json')"""
+    return _get_json_encoder()[0]
+
+def _get_json_encoder():
+    """Pick the fastest installed JSON encoder (once)"""
+    global _json_encoder
+    if _json_encoder is not None:
+        return _json_encoder
+    try:
+        import orjson
+        _json_encoder = ('orjson', orjson.dumps)
+    except ImportError:
+        try:
+            import msgspec
+            _json_encoder = ('msgspec', msgspec.json.Encoder().encode)
+        except ImportError:
+            _json_encoder = ('json', lambda document: json.dumps(document).encode('utf-8'))
+    return _json_encoder
+
+class JsonlSink:
+    """
+    Appends JSON documents to a file, one per line, optionally compressed
+
+    A write flushes the data to the operating system once flush_interval
+    seconds have passed since the last flush, and forces it to disk with
+    fsync once fsync_interval seconds have passed since the last sync.
+    Closing the sink always does both.
+    """
+
+    def __init__(self, path, compression='auto', append=False, flush_interval=JSONL_FLUSH_INTERVAL,
+                 fsync_interval=JSONL_FSYNC_INTERVAL):
+        """
+        Open the sink
+
+        Args:
+            path: Output file
+            compression: None, 'gzip', 'zstd' or 'auto' (decided by the file
+                extension: .gz or .zst)
+            append: Add to an existing file instead of replacing it
+            flush_interval: Seconds between flushes (0 flushes after every line)
+            fsync_interval: Seconds between fsync calls (None only syncs on close)
+
+        Raises:
+            ValueError: If the compression is unknown or zstd is requested
+                without the zstandard package installed
+        """
+        if compression == 'auto':
+            compression = _EXTENSION_COMPRESSION.get(os.path.splitext(path)[1].lower())
+        if compression not in (None, 'gzip', 'zstd'):
+            raise ValueError(f"Unknown compression: {compression}")
+
+        self.path = path
+        self.compression = compression
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self._zstandard = None
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'ab' if append else 'wb')
+        self._stream = self._open_stream(compression)
+        self._last_flush = self._last_fsync = time.monotonic()
+
+    def _open_stream(self, compression):
+        """Wrap the raw file in a compressor (each run appends a new gzip member / zstd frame)"""
+        if compression == 'gzip':
+            return gzip.GzipFile(fileobj=self._file, mode='wb')
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                self._file.close()
+                raise ValueError("zstd compression needs the zstandard package: pip install zstandard")
+            self._zstandard = zstandard
+            return zstandard.ZstdCompressor().stream_writer(self._file, closefd=False)
+        return self._file
+
+    def write(self, document):
+        """
+        Write one document as a line of JSON
+
+        Args:
+            document: JSON-serialisable dict, or a record with to_dict()
+        """
+        self._stream.write(encode_json(document) + b'\n')
+        self.count += 1
+
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self.flush()
+            self._last_flush = now
+        if self.fsync_interval is not None and now - self._last_fsync >= self.fsync_interval:
+            self.sync()
+            self._last_fsync = now
+
+    def flush(self):
+        """Hand everything written so far to the operating system"""
+        if self._zstandard is not None:
+            self._stream.flush(self._zstandard.FLUSH_BLOCK)
+        elif self._stream is not self._file:
+            self._stream.flush()  # Ends a gzip deflate block so readers can decode it
+        self._file.flush()
+
+    def sync(self):
+        """Flush and force the data to disk"""
+        self.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Finish the compressed stream, sync and close the file"""
+        if self._file.closed:
+            return
+        if self._stream is not self._file:
+            self._stream.close()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def read_jsonl(path):
+    """
+    Read back a (possibly compressed) JSON Lines file
+
+    Args:
+        path: File written by JsonlSink
+
+    Yields:
+        dict: One document per line
+    """
+    compression = _EXTENSION_COMPRESSION.get(os.path.splitext(path)[1].lower())
+    if compression == 'gzip':
+        stream = gzip.open(path, 'rb')
+    elif compression == 'zstd':
+        import zstandard
+        stream = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True,
+                                                            closefd=True)
+    else:
+        stream = open(path, 'rb')
+    with stream:
+        buffered = stream if compression != 'zstd' else _lines(stream)
+        for line in buffered:
+            if line.strip():
+                yield json.loads(line)
+
+def _lines(stream, chunk_size=1024 * 1024):
+    """Split a binary stream without readline support into lines"""
+    pending = b''
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        pending += chunk
+        *lines, pending = pending.split(b'\n')
+        yield from lines
+    if pending:
+        yield pending
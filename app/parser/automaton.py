@@ -0,0 +1,139 @@
+"""
+Automaton module - Multi-pattern keyword matching (Aho-Corasick)
+"""
+from collections import deque
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed list of keywords
+    
+    The automaton is built once and then finds every occurrence of every
+    keyword in a single left-to-right pass over the text, so the cost of a
+    search grows with the length of the text rather than with the number of
+    keywords.
+    """
+    
+    def __init__(self, keywords, ignore_case=True, word_boundaries=True):
+        """
+        Build the automaton
+        
+        Args:
+            keywords: Iterable of keyword strings (duplicates are ignored)
+            ignore_case: Match keywords regardless of case
+            word_boundaries: Only report matches that start and end on a word
+                boundary, with the same semantics as regex \\b
+        """
+        self.keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword]
+        self.ignore_case = ignore_case
+        self.word_boundaries = word_boundaries
+        self._build()
+    
+    def _build(self):
+        """Build the trie, failure links and output sets"""
+        goto = [{}]
+        output = [[]]
+        lengths = []
+        
+        # Trie of all keywords
+        for index, keyword in enumerate(self.keywords):
+            key = self._fold(keyword)
+            lengths.append(len(key))
+            state = 0
+            for char in key:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(index)
+        
+        # Failure links, computed breadth-first so that shallower states are
+        # complete before the states that fall back to them
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state].extend(output[fail[next_state]])
+        
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(indexes) for indexes in output]
+        self._lengths = lengths
+    
+    def _fold(self, text):
+        """Case-fold text without changing its length, so offsets stay valid"""
+        if not self.ignore_case:
+            return text
+        folded = text.lower()
+        if len(folded) != len(text):
+            # A few characters lowercase to several; leave those unchanged
+            folded = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        return folded
+    
+    def find_all(self, text):
+        """
+        Find every keyword occurrence in the text
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            list: (start, end, keyword) tuples ordered by end offset, where
+                text[start:end] is the matched occurrence
+        """
+        if not text or not self.keywords:
+            return []
+        
+        haystack = self._fold(text)
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        matches = []
+        state = 0
+        
+        for position, char in enumerate(haystack):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            for index in output[state]:
+                end = position + 1
+                start = end - lengths[index]
+                if not self.word_boundaries or (_is_boundary(haystack, start) and
+                                                _is_boundary(haystack, end)):
+                    matches.append((start, end, self.keywords[index]))
+        
+        return matches
+    
+    def find_longest(self, text):
+        """
+        Find the leftmost keyword occurrence, preferring the longest keyword
+        when several start at the same offset
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            tuple: (start, end, keyword) of the best match, or None
+        """
+        best = None
+        for match in self.find_all(text):
+            if best is None or match[0] < best[0] or (match[0] == best[0] and match[1] > best[1]):
+                best = match
+        return best
+
+def _is_word_char(char):
+    """Same definition of a word character as regex \\w"""
+    return char.isalnum() or char == '_'
+
+def _is_boundary(text, position):
+    """Check whether a regex \\b would match at the given position"""
+    before = position > 0 and _is_word_char(text[position - 1])
+    after = position < len(text) and _is_word_char(text[position])
+    return before != after
@@ -0,0 +1,315 @@
+"""
+Backends module - Interchangeable text extraction libraries for each file format
+
+Every backend has the same interface: it takes a file path or a seekable
+binary stream plus an optional page limit, and yields the text page by page.
+Which backend handles a format is decided, in order, by CONVERTER_BACKENDS in
+app/config.py, by the result of the last backend benchmark, and finally by
+registration order.
+
+Benchmark the installed backends on a sample corpus with:
+    python -m app.parser.backends --corpus tests/test_data
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from collections import Counter
+from io import BytesIO, StringIO
+from app.config import CONVERTER_BACKENDS, CONVERTER_BENCHMARK_FILE, BACKEND_MIN_QUALITY
+
+# Registered backends: extension -> {backend name: (function, required module)}
+_BACKENDS = {}
+
+# Whether each backend module is installed (checked once per module)
+_module_available = {}
+
+# Selection recorded by the last benchmark run (loaded on first use)
+_benchmark_selection = None
+
+def register_backend(extensions, name, function, module=None):
+    """
+    Register a converter backend
+
+    Args:
+        extensions: File extensions the backend handles (e.g. ['.pdf'])
+        name: Backend name used in configuration and benchmark results
+        function: Callable (source, max_pages=None) yielding page texts
+        module: Top-level module the backend needs (used to check availability)
+    """
+    for extension in extensions:
+        _BACKENDS.setdefault(extension, {})[name] = (function, module)
+
+def available_backends(extension):
+    """
+    List the installed backends for a file extension, in registration order
+
+    Args:
+        extension: File extension such as '.pdf'
+
+    Returns:
+        list: Backend names whose required module can be imported
+    """
+    return [
+        name for name, (_, module) in _BACKENDS.get(extension, {}).items()
+        if module is None or _is_module_available(module)
+    ]
+
+def _is_module_available(module):
+    """Check whether a module can be imported, without importing it"""
+    if module not in _module_available:
+        _module_available[module] = importlib.util.find_spec(module) is not None
+    return _module_available[module]
+
+def select_backend(extension):
+    """
+    Decide which backend converts files with the given extension
+
+    Args:
+        extension: File extension such as '.pdf'
+
+    Returns:
+        str: Backend name
+
+    Raises:
+        ValueError: If no backend for the extension is installed, or the
+            pinned backend is unknown or not installed
+    """
+    installed = available_backends(extension)
+
+    pinned = CONVERTER_BACKENDS.get(extension)
+    if pinned:
+        if pinned not in installed:
+            raise ValueError(f"Converter backend '{pinned}' for {extension} files is not available")
+        return pinned
+
+    benchmarked = _get_benchmark_selection().get(extension)
+    if benchmarked in installed:
+        return benchmarked
+
+    if not installed:
+        raise ValueError(f"No converter backend installed for {extension} files")
+    return installed[0]
+
+def get_backend(extension, name=None):
+    """
+    Return the conversion function for a file extension
+
+    Args:
+        extension: File extension such as '.pdf'
+        name: Backend to use instead of the configured one
+
+    Returns:
+        Callable (source, max_pages=None) yielding page texts
+    """
+    name = name or select_backend(extension)
+    if name not in _BACKENDS.get(extension, {}):
+        raise ValueError(f"Unknown converter backend '{name}' for {extension} files")
+    return _BACKENDS[extension][name][0]
+
+def backend_fingerprint():
+    """Short description of the backend chosen for every format (used in cache keys)"""
+    choices = []
+    for extension in sorted(_BACKENDS):
+        try:
+            choices.append(f"{extension}={select_backend(extension)}")
+        except ValueError:
+            choices.append(f"{extension}=")
+    return ','.join(choices)
+
+def _get_benchmark_selection():
+    """Load the backends recorded by the last benchmark run"""
+    global _benchmark_selection
+    if _benchmark_selection is None:
+        selection = {}
+        try:
+            with open(CONVERTER_BENCHMARK_FILE, 'r', encoding='utf-8') as f:
+                results = json.load(f)
+            selection = {extension: result.get('selected') for extension, result in results.items()}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable converter benchmark file {CONVERTER_BENCHMARK_FILE}: {str(e)}")
+        _benchmark_selection = selection
+    return _benchmark_selection
+
+def _pdfminer_pages(source, max_pages=None):
+    """PDF pages with pdfminer.six (the same text as its extract_text)"""
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.pdfpage import PDFPage
+
+    pdf_file = open(source, 'rb') if isinstance(source, str) else source
+    try:
+        with StringIO() as output:
+            # Same pipeline as extract_text, but the text is handed out after
+            # every page instead of once at the end
+            resource_manager = PDFResourceManager()
+            device = TextConverter(resource_manager, output, laparams=LAParams())
+            interpreter = PDFPageInterpreter(resource_manager, device)
+            try:
+                for page in PDFPage.get_pages(pdf_file, maxpages=max_pages or 0):
+                    interpreter.process_page(page)
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+            finally:
+                device.close()
+    finally:
+        if pdf_file is not source:
+            pdf_file.close()
+
+def _pypdf2_pages(source, max_pages=None):
+    """PDF pages with PyPDF2"""
+    from PyPDF2 import PdfReader
+
+    pdf_reader = PdfReader(source)
+    for page_number, page in enumerate(pdf_reader.pages):
+        if max_pages and page_number >= max_pages:
+            break
+        yield page.extract_text()
+
+def _docx2txt_pages(source, max_pages=None):
+    """Word document text with docx2txt (includes headers, footers and tables)"""
+    import docx2txt
+
+    yield docx2txt.process(source)
+
+def _python_docx_pages(source, max_pages=None):
+    """Word document paragraphs with python-docx"""
+    from docx import Document
+
+    document = Document(source)
+    yield '\n'.join(paragraph.text for paragraph in document.paragraphs)
+
+def _text_pages(source, max_pages=None):
+    """Plain text files"""
+    if isinstance(source, str):  # File path
+        with open(source, 'r', encoding='utf-8', errors='ignore') as file:
+            yield file.read()
+    elif isinstance(source, BytesIO):  # In-memory buffer - decode without copying
+        with source.getbuffer() as buffer:
+            yield str(buffer, 'utf-8', 'ignore')
+    else:  # Other stream objects
+        source.seek(0)  # Ensure we're reading from the beginning
+        yield source.read().decode('utf-8', errors='ignore')
+
+# Built-in backends; the first one registered for a format is the default
+register_backend(['.pdf'], 'pdfminer', _pdfminer_pages, 'pdfminer')
+register_backend(['.pdf'], 'pypdf2', _pypdf2_pages, 'PyPDF2')
+register_backend(['.docx', '.doc'], 'docx2txt', _docx2txt_pages, 'docx2txt')
+register_backend(['.docx', '.doc'], 'python-docx', _python_docx_pages, 'docx')
+register_backend(['.txt'], 'text', _text_pages)
+
+def benchmark_backends(paths, min_quality=BACKEND_MIN_QUALITY, repeat=3):
+    """
+    Time every installed backend on sample files and pick the fastest acceptable one
+
+    Quality is the share of the words produced by the default backend that
+    a backend also produces; backends below min_quality are never selected.
+
+    Args:
+        paths: Sample resume files
+        min_quality: Minimum word recall relative to the default backend (0-1)
+        repeat: Number of timed conversions per file (the best time is kept)
+
+    Returns:
+        dict: Per extension, 'selected' backend name and per-backend 'results'
+            with 'seconds' (total over the corpus), 'quality' and 'errors'
+    """
+    samples = {}
+    for path in paths:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in _BACKENDS:
+            with open(path, 'rb') as f:
+                samples.setdefault(extension, []).append(f.read())
+
+    report = {}
+    for extension, contents in sorted(samples.items()):
+        installed = available_backends(extension)
+        if not installed:
+            continue
+        reference_backend = installed[0]
+        results = {}
+        reference_words = []
+
+        for name in installed:
+            function = _BACKENDS[extension][name][0]
+            seconds = 0.0
+            errors = 0
+            recall = []
+            for index, content in enumerate(contents):
+                try:
+                    timings = []
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        text = ''.join(function(BytesIO(content)))
+                        timings.append(time.perf_counter() - start)
+                    seconds += min(timings)
+                except Exception:
+                    errors += 1
+                    text = ''
+
+                words = Counter(text.lower().split())
+                if name == reference_backend:
+                    reference_words.append(words)
+                expected = reference_words[index] if index < len(reference_words) else Counter()
+                total = sum(expected.values())
+                recall.append(sum((words & expected).values()) / total if total else 1.0)
+
+            results[name] = {
+                'seconds': seconds,
+                'quality': sum(recall) / len(recall),
+                'errors': errors
+            }
+
+        acceptable = [name for name, result in results.items()
+                      if not result['errors'] and result['quality'] >= min_quality]
+        report[extension] = {
+            'selected': min(acceptable, key=lambda name: results[name]['seconds']) if acceptable else reference_backend,
+            'results': results
+        }
+
+    return report
+
+def save_benchmark(report, path=CONVERTER_BENCHMARK_FILE):
+    """Record a benchmark report so that its selection is used from now on"""
+    global _benchmark_selection
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+    _benchmark_selection = None
+
+def main(argv=None):
+    """Entry point for python -m app.parser.backends"""
+    from app.cli import find_resumes
+
+    arg_parser = argparse.ArgumentParser(description="Benchmark the installed converter backends.")
+    arg_parser.add_argument('--corpus', '-c', required=True,
+                            help="Sample resume file, directory or glob pattern")
+    arg_parser.add_argument('--min-quality', type=float, default=BACKEND_MIN_QUALITY,
+                            help=f"Minimum word recall against the default backend (default: {BACKEND_MIN_QUALITY})")
+    arg_parser.add_argument('--repeat', type=int, default=3,
+                            help="Timed runs per file (default: 3)")
+    arg_parser.add_argument('--dry-run', action='store_true',
+                            help="Print the results without recording the selection")
+    args = arg_parser.parse_args(argv)
+
+    report = benchmark_backends(find_resumes(args.corpus), min_quality=args.min_quality,
+                                repeat=args.repeat)
+    for extension, result in report.items():
+        print(f"{extension}: selected {result['selected']}")
+        for name, numbers in result['results'].items():
+            print(f"  {name:<12} {numbers['seconds'] * 1000:10.1f} ms  "
+                  f"quality {numbers['quality']:.3f}  errors {numbers['errors']}")
+
+    if not args.dry_run:
+        save_benchmark(report)
+        print(f"Selection recorded in {CONVERTER_BENCHMARK_FILE}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,95 +3,138 @@ Converter module - Functions for converting resumes to text
 """
 
 import os
+import zipfile
 from io import BytesIO
-from PyPDF2 import PdfReader
-from docx import Document
-from pdfminer.high_level import extract_text
+from app.parser.backends import get_backend
 
 # Supported extensions
 SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.doc', '.txt']
 
-def convert_resume_to_text(file_input):
+# File signatures used to recognise in-memory documents
+_PDF_SIGNATURE = b'%PDF-'
+_ZIP_SIGNATURE = b'PK\x03\x04'
+_OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # Legacy .doc
+
+def convert_resume_to_text(file_input, max_pages=None, backend=None):
     """
     Convert resume files to plain text
     
     Args:
-        file_input: Path to the resume file or BytesIO object
+        file_input: Path to the resume file, a bytes-like object (bytes,
+            bytearray, memoryview) or a binary file object (BytesIO,
+            Streamlit's UploadedFile, an open file, ...)
+        max_pages: Stop after this many pages (PDF only; None for no limit)
+        backend: Converter backend to use instead of the configured one
         
     Returns:
         str: Plain text content of the resume
         
     Raises:
-        ValueError: If the file format is not supported
+        ValueError: If the input type or file format is not supported
+    """
+    return ''.join(iter_resume_pages(file_input, max_pages=max_pages, backend=backend))
+
+def iter_resume_pages(file_input, max_pages=None, backend=None):
+    """
+    Convert a resume to plain text page by page
+    
+    PDF pages are converted lazily, one at a time, so memory stays bounded
+    for long documents and conversion stops as soon as the caller stops
+    consuming pages or the page limit is reached. Other formats have no
+    pages and produce their whole text at once.
+    
+    The same backend (see app.parser.backends) converts a format whether
+    the resume is given as a path or in memory.
+    
+    Args:
+        file_input: Path to the resume file, a bytes-like object or a binary file object
+        max_pages: Stop after this many pages (None for no limit)
+        backend: Converter backend to use instead of the configured one
+        
+    Yields:
+        str: Plain text of each page
+        
+    Raises:
+        ValueError: If the input type or file format is not supported
     """
-    # Determine whether file_input is a file path or in-memory file-like object
-    if isinstance(file_input, str):  # File path
+    # Determine whether file_input is a file path or in-memory content
+    if isinstance(file_input, (str, os.PathLike)):  # File path
+        file_input = os.fspath(file_input)
         file_extension = os.path.splitext(file_input)[1].lower()
-    elif isinstance(file_input, BytesIO):  # Stream object (e.g., from Streamlit)
+    else:  # Bytes or stream object (e.g., from Streamlit)
+        file_input = _as_binary_stream(file_input)
         file_extension = _detect_stream_extension(file_input)
-    else:
-        raise ValueError("Unsupported input type. Expected file path or BytesIO object.")
 
     if file_extension not in SUPPORTED_EXTENSIONS:
         raise ValueError(f"Unsupported file format: {file_extension}")
     
-    if file_extension == '.pdf':
-        return _convert_pdf_to_text(file_input)
+    # Legacy .doc files go through the Word document backends, as before
+    yield from get_backend(file_extension, backend)(file_input, max_pages)
+
+def _as_binary_stream(file_input):
+    """
+    Wrap in-memory content as a seekable binary stream positioned at the start
     
-    elif file_extension in ['.docx', '.doc']:
-        return _convert_doc_to_text(file_input)
+    Args:
+        file_input: Bytes-like object or binary file object
     
-    elif file_extension == '.txt':
-        return _read_text_file(file_input)
-
-def _convert_pdf_to_text(file_input):
-    """Convert PDF file to text"""
-    if isinstance(file_input, str):  # File path
-        return extract_text(file_input)
-    elif isinstance(file_input, BytesIO):  # Stream object
-        pdf_reader = PdfReader(file_input)
-        text = ''.join([page.extract_text() for page in pdf_reader.pages])
-        return text
-    else:
-        raise ValueError("Invalid input type for PDF conversion.")
-
-def _convert_doc_to_text(file_input):
-    """Convert DOCX/DOC file to text"""
-    try:
-        if isinstance(file_input, str):  # File path
-            import docx2txt
-            return docx2txt.process(file_input)
-        elif isinstance(file_input, BytesIO):  # Stream object
-            document = Document(file_input)
-            return '\n'.join(paragraph.text for paragraph in document.paragraphs)
-        else:
-            raise ValueError("Invalid input type for DOCX/DOC conversion.")
-    except ImportError:
-        raise ImportError("docx2txt is required for DOCX conversion. Install with: pip install docx2txt")
-
-def _read_text_file(file_input):
-    """Read plain text files"""
-    if isinstance(file_input, str):  # File path
-        with open(file_input, 'r', encoding='utf-8', errors='ignore') as file:
-            return file.read()
-    elif isinstance(file_input, BytesIO):  # Stream object
-        file_input.seek(0)  # Ensure we're reading from the beginning
-        return file_input.read().decode('utf-8', errors='ignore')
+    Returns:
+        A seekable binary stream (the input itself when it already is one)
+    """
+    if isinstance(file_input, (bytes, bytearray, memoryview)):
+        stream = BytesIO(file_input)
+    elif hasattr(file_input, 'read'):
+        if hasattr(file_input, 'seekable') and file_input.seekable():
+            file_input.seek(0)
+            return file_input
+        # Non-seekable streams (pipes, sockets) have to be buffered once
+        stream = BytesIO(file_input.read())
     else:
-        raise ValueError("Invalid input type for text file reading.")
+        raise ValueError("Unsupported input type. Expected file path, bytes or binary file object.")
+    
+    name = getattr(file_input, 'name', None)
+    if isinstance(name, str):
+        stream.name = name
+    return stream
 
 def _detect_stream_extension(file_stream):
     """
-    Detect file extension for BytesIO object
+    Detect the file format of an in-memory document
+    
+    The format is recognised from the content's signature (PDF header, ZIP
+    container holding a Word document, legacy OLE .doc); the stream's name is
+    only used when the content is not recognised.
     
     Args:
-        file_stream: BytesIO object
+        file_stream: Seekable binary stream positioned at the start
     
     Returns:
         str: File extension (e.g., '.pdf', '.docx')
     """
+    header = file_stream.read(8)
+    file_stream.seek(0)
+    
+    if header.startswith(_PDF_SIGNATURE):
+        return '.pdf'
+    if header.startswith(_OLE_SIGNATURE):
+        return '.doc'
+    if header.startswith(_ZIP_SIGNATURE):
+        try:
+            with zipfile.ZipFile(file_stream) as archive:
+                is_word_document = 'word/document.xml' in archive.namelist()
+        except zipfile.BadZipFile:
+            is_word_document = False
+        file_stream.seek(0)
+        if is_word_document:
+            return '.docx'
+        raise ValueError("Unsupported file format: ZIP archive is not a Word document")
+    
     # Use filename attribute if available (e.g., from Streamlit's UploadedFile)
-    if hasattr(file_stream, 'name'):
-        return os.path.splitext(file_stream.name)[1].lower()
-    else:
-        raise ValueError("Cannot detect file extension for in-memory stream.")
\ No newline at end of file
+    name = getattr(file_stream, 'name', None)
+    if isinstance(name, str) and os.path.splitext(name)[1]:
+        return os.path.splitext(name)[1].lower()
+    
+    # Anything else without a recognisable signature is treated as plain text
+    if b'\x00' in header:
+        raise ValueError("Cannot detect file format of in-memory document.")
+    return '.txt'
@@ -0,0 +1,177 @@
+"""
+Dates module - Single-pass scanning of dates and date ranges in resume text
+"""
+import re
+from datetime import date
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Every kind of date token, tried in a single regex pass
+_DATE_TOKEN_PATTERN = re.compile(r"""
+    \b(?P<month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|
+                aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)
+        \.?[\s,]*(?:(?P<month_year>\d{4})\b|['’](?P<month_short_year>\d{2})\b)
+  | \b(?P<numeric_month>0?[1-9]|1[0-2])/(?P<numeric_year>(?:19|20)\d{2})\b
+  | \b(?P<year>(?:19|20)\d{2})\b
+  | \b(?P<present>present|current|ongoing|now)\b
+""", re.IGNORECASE | re.VERBOSE)
+
+# What may separate the two ends of a date range
+_RANGE_SEPARATOR_PATTERN = re.compile(r"\s*(?:-|–|—|to|until|till)\s*", re.IGNORECASE)
+
+# Words that mark the date right after them as the relevant one
+_CUE_PATTERN = re.compile(
+    r"\b(graduated|completed|finished|class of|expected|exp|issued|received|earned|certified)"
+    r"(?:[\s:]+in)?[\s:]+$",
+    re.IGNORECASE
+)
+
+PRESENT = 'present'
+
+# How many years ahead a two-digit year may point (e.g. an expected graduation)
+SHORT_YEAR_FUTURE_WINDOW = 10
+
+def scan_date_tokens(text):
+    """
+    Find every individual date in a text in one pass
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        list: Dictionaries ordered by position, each with
+            'text': the date as written,
+            'start'/'end': character offsets in the text,
+            'value': ISO value ('YYYY-MM' or 'YYYY') or 'present',
+            'cue': lowercased cue word directly before the date (e.g. 'graduated') or None
+    """
+    tokens = []
+    if not text:
+        return tokens
+
+    for match in _DATE_TOKEN_PATTERN.finditer(text):
+        if match.group('month'):
+            month = _MONTHS[match.group('month')[:3].lower()]
+            if match.group('month_year'):
+                year = int(match.group('month_year'))
+            else:
+                year = expand_short_year(int(match.group('month_short_year')))
+            value = f"{year:04d}-{month:02d}"
+        elif match.group('numeric_month'):
+            value = f"{int(match.group('numeric_year')):04d}-{int(match.group('numeric_month')):02d}"
+        elif match.group('year'):
+            value = match.group('year')
+        else:
+            value = PRESENT
+
+        cue_match = _CUE_PATTERN.search(text, max(0, match.start() - 30), match.start())
+        tokens.append({
+            'text': match.group(0).strip(),
+            'start': match.start(),
+            'end': match.end(),
+            'value': value,
+            'cue': cue_match.group(1).lower() if cue_match else None
+        })
+
+    return tokens
+
+def expand_short_year(short_year, today=None):
+    """
+    Turn a two-digit year into a full year
+
+    The year is taken from the hundred years ending SHORT_YEAR_FUTURE_WINDOW
+    years after today, so near-future dates such as expected graduations
+    stay in this century ('27 is 2027 in 2026) and older ones go back to the
+    last ('98 is 1998).
+
+    Args:
+        short_year: Year from 0 to 99
+        today: Reference date (defaults to today)
+
+    Returns:
+        int: Four-digit year
+    """
+    latest = (today or date.today()).year + SHORT_YEAR_FUTURE_WINDOW
+    year = latest - latest % 100 + short_year
+    return year - 100 if year > latest else year
+
+def scan_dates(text, tokens=None):
+    """
+    Find every date and date range in a text
+
+    Consecutive date tokens joined by a dash or 'to' are combined into a
+    range. 'Present'/'Current' only counts as the end of a range.
+
+    Args:
+        text: Text to scan
+        tokens: Result of scan_date_tokens(text), if already computed
+
+    Returns:
+        list: Dictionaries ordered by position, each with
+            'text': the date or range as written,
+            'start'/'end': character offsets in the text,
+            'start_date'/'end_date': ISO values ('YYYY-MM', 'YYYY' or 'present');
+                both are the same for a single date,
+            'is_range': whether this is a range
+    """
+    if tokens is None:
+        tokens = scan_date_tokens(text)
+
+    dates = []
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token['value'] == PRESENT:
+            index += 1
+            continue
+
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        if following and _RANGE_SEPARATOR_PATTERN.fullmatch(text, token['end'], following['start']):
+            dates.append({
+                'text': text[token['start']:following['end']].strip(),
+                'start': token['start'],
+                'end': following['end'],
+                'start_date': token['value'],
+                'end_date': following['value'],
+                'is_range': True
+            })
+            index += 2
+        else:
+            dates.append({
+                'text': token['text'],
+                'start': token['start'],
+                'end': token['end'],
+                'start_date': token['value'],
+                'end_date': token['value'],
+                'is_range': False
+            })
+            index += 1
+
+    return dates
+
+def pick_single_date(tokens, cues=None):
+    """
+    Pick the most relevant single date from scanned tokens
+
+    Preference order: the first date with a month, then the first year
+    preceded by one of the cue words, then the first year.
+
+    Args:
+        tokens: Result of scan_date_tokens
+        cues: Optional collection of cue words to prefer
+
+    Returns:
+        dict: The chosen token, or None
+    """
+    dated = [token for token in tokens if token['value'] != PRESENT]
+    for token in dated:
+        if len(token['value']) > 4:
+            return token
+    if cues:
+        for token in dated:
+            if token['cue'] in cues:
+                return token
+    return dated[0] if dated else None
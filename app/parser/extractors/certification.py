@@ -2,6 +2,10 @@
 Certification Extractor - Functions for extracting certification information from resumes
 """
 import re
+from app.parser.dates import scan_date_tokens, pick_single_date
+
+# Words that mark a year as the date the certification was obtained
+_CERTIFICATION_CUES = {'issued', 'received', 'completed', 'earned', 'certified'}
 
 def extract_certifications(certifications_text):
     """
@@ -43,7 +47,8 @@ def extract_certifications(certifications_text):
             certifications.append({
                 'name': cert_name,
                 'authority': authority,
-                'date': date,
+                'date': date['text'] if date else None,
+                'date_iso': date['value'] if date else None,
                 'credential_id': credential_id
             })
     
@@ -109,25 +114,8 @@ def _extract_authority(text):
     return None
 
 def _extract_certification_date(text):
-    """Extract certification date"""
-    # Various date formats
-    date_patterns = [
-        # Month Year
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+\d{4}",
-        # Year only with context
-        r"(Issued|Received|Completed|Earned|Certified)[\s:]+in[\s:]+(\d{4})",
-        # Year only
-        r"\b(20\d{2}|19\d{2})\b"
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            if "Issued|Received|Completed|Earned|Certified" in pattern:
-                return match.group(2).strip()  # Return just the year
-            return match.group(0).strip()
-    
-    return None
+    """Extract certification date (a date token from app.parser.dates, or None)"""
+    return pick_single_date(scan_date_tokens(text), cues=_CERTIFICATION_CUES)
 
 def _extract_credential_id(text):
     """Extract credential ID"""
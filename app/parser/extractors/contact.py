@@ -0,0 +1,37 @@
+"""
+Contact Extractor - Functions for extracting contact details from resumes
+"""
+import re
+from app.parser.utils import extract_contact_info
+
+# A name line: two to four capitalised words (initials and hyphenated names allowed)
+_NAME_PATTERN = re.compile(r"[A-Z][a-zA-Z'.-]*(?: [A-Z][a-zA-Z'.-]*){1,3}")
+
+def extract_contact(header_text):
+    """
+    Extract contact details from the top of a resume
+
+    Email and phone are found by extract_contact_info (app.parser.utils).
+
+    Args:
+        header_text: Text before the first section header
+
+    Returns:
+        dict: 'name', 'email' and 'phone' (None when not found)
+    """
+    contact = {'name': None, 'email': None, 'phone': None}
+    if not header_text:
+        return contact
+
+    info = extract_contact_info(header_text)
+    contact['email'] = info['email']
+    contact['phone'] = info['phone']
+
+    # The name is usually the first line that is nothing but a name
+    for line in header_text.split('\n'):
+        line = line.strip()
+        if _NAME_PATTERN.fullmatch(line):
+            contact['name'] = line
+            break
+
+    return contact
@@ -2,6 +2,10 @@
 Education Extractor - Functions for extracting education information from resumes
 """
 import re
+from app.parser.dates import scan_date_tokens, pick_single_date
+
+# Words that mark a year as the graduation year
+_GRADUATION_CUES = {'graduated', 'completed', 'finished', 'class of', 'expected', 'exp'}
 
 def extract_education(education_text):
     """
@@ -32,7 +36,7 @@ def extract_education(education_text):
         institution = _extract_institution(entry)
         
         # Extract graduation date
-        graduation_date = _extract_graduation_date(entry)
+        graduation = _extract_graduation_date(entry)
         
         # Extract GPA
         gpa = _extract_gpa(entry)
@@ -42,7 +46,8 @@ def extract_education(education_text):
             education.append({
                 'degree': degree,
                 'institution': institution,
-                'graduation_date': graduation_date,
+                'graduation_date': graduation['text'] if graduation else None,
+                'graduation_date_iso': graduation['value'] if graduation else None,
                 'gpa': gpa
             })
     
@@ -92,25 +97,8 @@ def _extract_institution(text):
     return None
 
 def _extract_graduation_date(text):
-    """Extract graduation date"""
-    # Various date formats
-    graduation_patterns = [
-        # Month Year
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+\d{4}",
-        # Year only
-        r"(Graduated|Completed|Finished|Class of|Expected|Exp)[\s:]+(\d{4})",
-        # Just the year
-        r"\b(20\d{2}|19\d{2})\b"
-    ]
-    
-    for pattern in graduation_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            if "Graduated|Completed|Finished|Class of|Expected|Exp" in pattern:
-                return match.group(2).strip()  # Return just the year
-            return match.group(0).strip()
-    
-    return None
+    """Extract graduation date (a date token from app.parser.dates, or None)"""
+    return pick_single_date(scan_date_tokens(text), cues=_GRADUATION_CUES)
 
 def _extract_gpa(text):
     """Extract GPA information"""
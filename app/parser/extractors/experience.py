@@ -2,9 +2,8 @@
 Experience Extractor - Functions for extracting work experience from resumes
 """
 import re
-import json
-import os
-from app.config import JOB_TITLES_FILE
+from app.reference_data import get_reference_data
+from app.parser.dates import scan_dates
 
 def extract_experience(experience_text):
     """
@@ -21,9 +20,6 @@ def extract_experience(experience_text):
         
     experiences = []
     
-    # Load job titles list for better matching
-    job_titles = _load_job_titles()
-    
     # Split text into different job entries (assuming blank lines separate jobs)
     job_entries = re.split(r'\n\n+', experience_text)
     
@@ -32,13 +28,13 @@ def extract_experience(experience_text):
             continue
             
         # Extract job title
-        job_title = _extract_job_title(entry, job_titles)
+        job_title = _extract_job_title(entry)
         
         # Extract company
         company = _extract_company(entry)
         
         # Extract dates
-        dates = _extract_dates(entry)
+        date_range = _extract_date_range(entry)
         
         # Extract responsibilities/achievements
         responsibilities = _extract_responsibilities(entry)
@@ -48,21 +44,23 @@ def extract_experience(experience_text):
             experiences.append({
                 'job_title': job_title,
                 'company': company,
-                'dates': dates,
+                'dates': date_range['text'] if date_range else None,
+                'start_date': date_range['start_date'] if date_range else None,
+                'end_date': date_range['end_date'] if date_range else None,
                 'responsibilities': responsibilities
             })
     
     return experiences
 
-def _extract_job_title(text, job_titles):
+def _extract_job_title(text):
     """Extract job title from text"""
-    # Try specific job title patterns first
-    specific_pattern = '|'.join(job_titles)
-    job_title_match = re.search(rf"({specific_pattern})", text, re.IGNORECASE)
+    # Try known job titles first (leftmost, longest match)
+    job_title_match = get_reference_data().job_title_automaton.find_longest(text)
     
-    # If specific match found, return it
+    # If specific match found, return it as written in the text
     if job_title_match:
-        return job_title_match.group(1).strip()
+        start, end, _ = job_title_match
+        return text[start:end].strip()
     
     # Try general patterns
     general_patterns = [
@@ -100,26 +98,16 @@ def _extract_company(text):
             
     return None
 
-def _extract_dates(text):
-    """Extract date ranges from text"""
-    # Various date formats
-    date_patterns = [
-        # Month Year - Month Year (Jan 2020 - Dec 2021)
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+\d{4}\s*(-|–|to)\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+\d{4}",
-        # Year - Year (2020 - 2021)
-        r"(\d{4})\s*(-|–|to)\s*(\d{4}|Present|Current)",
-        # Month Year - Present
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+\d{4}\s*(-|–|to)\s*(Present|Current)",
-        # Just years in parentheses (2020-2021)
-        r"\((\d{4})\s*(-|–|to)\s*(\d{4}|Present|Current)\)"
-    ]
+def _extract_date_range(text):
+    """Extract a date range (e.g. 'Jan 2020 - Present') from text"""
+    date_ranges = [date for date in scan_dates(text) if date['is_range']]
     
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(0).strip()
-            
-    return None
+    # Ranges starting with a month are the most specific, so prefer those
+    for date_range in date_ranges:
+        if len(date_range['start_date']) > 4:
+            return date_range
+    
+    return date_ranges[0] if date_ranges else None
 
 def _extract_responsibilities(text):
     """Extract job responsibilities from text"""
@@ -151,25 +139,4 @@ def _extract_responsibilities(text):
             # New sentence in bullet format but without a bullet marker
             responsibilities.append(line)
     
-    return responsibilities
-
-def _load_job_titles():
-    """Load job titles from data file"""
-    try:
-        if os.path.exists(JOB_TITLES_FILE):
-            with open(JOB_TITLES_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
-            # Fallback to built-in list
-            return [
-                "Software Engineer", "Senior Developer", "Frontend Developer", "Backend Developer",
-                "Full Stack Developer", "Data Scientist", "Product Manager", "Project Manager",
-                "UX Designer", "UI Designer", "DevOps Engineer", "QA Engineer", "Test Engineer",
-                "Machine Learning Engineer", "Data Analyst", "Research Scientist", "IT Specialist",
-                "Network Administrator", "Systems Administrator", "Database Administrator",
-                "Business Analyst", "Technical Writer", "Scrum Master", "Agile Coach",
-                "CTO", "CEO", "CIO", "VP of Engineering", "Director of Technology"
-            ]
-    except Exception as e:
-        print(f"Error loading job titles: {str(e)}")
-        return []
\ No newline at end of file
+    return responsibilities
\ No newline at end of file
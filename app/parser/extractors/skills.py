@@ -2,17 +2,20 @@
 Skills Extractor - Functions for extracting skills from resumes
 """
 import re
-import json
-import os
-from app.config import COMMON_SKILLS_FILE
+from app.reference_data import get_reference_data
 
-def extract_skills(skills_text, nlp):
+# Tokens that end a rule-based chunk in addition to punctuation and whitespace
+_CHUNK_BREAK_TEXTS = {'•', '◦', '○', '■', '●', '|', '/'}
+_CHUNK_BREAK_WORDS = {'and', 'or', '&'}
+
+def extract_skills(skills_text, nlp, doc=None):
     """
     Extract skills from the skills section
     
     Args:
         skills_text: Text from the skills section
-        nlp: Loaded spaCy NLP model
+        nlp: Loaded spaCy NLP pipeline (any profile from NLP_PROFILES)
+        doc: Optional doc already produced from skills_text (e.g. by nlp.pipe)
         
     Returns:
         list: List of extracted skills
@@ -20,27 +23,24 @@ def extract_skills(skills_text, nlp):
     if not skills_text:
         return []
         
-    # Load common skills list
-    common_skills = _load_common_skills()
-    
-    # Find skills in the text
-    found_skills = []
-    
-    # Check for common skills
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', skills_text.lower()):
-            found_skills.append(skill)
+    # Check for common skills in a single pass over the text
+    found_skills = list(dict.fromkeys(skill for _, _, skill in find_skills(skills_text)))
+    seen_skills = {skill.lower() for skill in found_skills}
     
-    # Use NLP to find additional skills
-    doc = nlp(skills_text)
+    # Use NLP to find additional skills (spaCy refuses texts over max_length)
+    if doc is None:
+        doc = nlp(skills_text[:nlp.max_length])
     
-    # Look for noun chunks that might be skills
-    for chunk in doc.noun_chunks:
+    # Look for noun chunks that might be skills. Pipelines without a
+    # dependency parser fall back to rule-based chunking.
+    chunks = doc.noun_chunks if doc.has_annotation('DEP') else _rule_based_chunks(doc)
+    for chunk in chunks:
         skill_text = chunk.text.strip()
         if (len(skill_text) > 2 and 
-            skill_text.lower() not in [s.lower() for s in found_skills] and
+            skill_text.lower() not in seen_skills and
             not any(char.isdigit() for char in skill_text)):  # Filter out chunks with numbers
             found_skills.append(skill_text)
+            seen_skills.add(skill_text.lower())
     
     # Look for skills separated by commas or bullets
     skill_candidates = re.findall(r'[•-]?\s*([A-Za-z+#]+(?:\s[A-Za-z+#]+)*)[,.]', skills_text)
@@ -48,8 +48,9 @@ def extract_skills(skills_text, nlp):
         skill = skill.strip()
         if (skill and 
             len(skill) > 2 and 
-            skill.lower() not in [s.lower() for s in found_skills]):
+            skill.lower() not in seen_skills):
             found_skills.append(skill)
+            seen_skills.add(skill.lower())
             
     # Remove duplicates and sort
     found_skills = list(set(found_skills))
@@ -57,22 +58,33 @@ def extract_skills(skills_text, nlp):
     
     return found_skills
 
-def _load_common_skills():
-    """Load common skills from data file"""
-    try:
-        if os.path.exists(COMMON_SKILLS_FILE):
-            with open(COMMON_SKILLS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
-            # Fallback to built-in list
-            return [
-                "python", "java", "javascript", "html", "css", "react", "angular", "node.js", 
-                "sql", "git", "agile", "scrum", "project management", "leadership", 
-                "communication", "aws", "azure", "docker", "kubernetes", "machine learning",
-                "data analysis", "excel", "powerpoint", "word", "tensorflow", "pytorch",
-                "c++", "c#", "php", "ruby", "swift", "kotlin", "typescript", "rust", "golang",
-                "scala", "r", "django", "flask", "spring boot", "laravel", "ruby on rails"
-            ]
-    except Exception as e:
-        print(f"Error loading common skills: {str(e)}")
-        return []
\ No newline at end of file
+def find_skills(text):
+    """
+    Find every known skill mentioned in a text
+    
+    Args:
+        text: Text to search
+        
+    Returns:
+        list: (start, end, skill) tuples with the character offsets of each
+            mention, matched case-insensitively on word boundaries
+    """
+    return get_reference_data().skill_automaton.find_all(text)
+
+def _rule_based_chunks(doc, max_tokens=4):
+    """
+    Split a tokenized doc into short candidate phrases
+    
+    Used when the pipeline has no parser: phrases are the token runs between
+    punctuation, bullets, line breaks and coordinating words.
+    """
+    start = 0
+    for token in doc:
+        if (token.is_punct or token.is_space or
+                token.text in _CHUNK_BREAK_TEXTS or
+                token.lower_ in _CHUNK_BREAK_WORDS):
+            if 0 < token.i - start <= max_tokens:
+                yield doc[start:token.i]
+            start = token.i + 1
+    if 0 < len(doc) - start <= max_tokens:
+        yield doc[start:len(doc)]
\ No newline at end of file
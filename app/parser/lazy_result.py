@@ -0,0 +1,60 @@
+"""
+Lazy Result module - Parse results whose sections are extracted on first access
+"""
+from collections.abc import Mapping
+
+class LazyResult(Mapping):
+    """
+    Read-only parse result that runs each extractor the first time its field is read
+
+    Behaves like the dict returned by ResumeParser.parse (same keys in the
+    same order), but a field that is never read is never extracted; in
+    particular the spaCy pipeline is not loaded unless 'skills' is read.
+    Reading every field (e.g. with to_dict()) gives the same values as parse.
+    """
+
+    def __init__(self, file_name, fields, extract, limit_exceeded=None):
+        """
+        Args:
+            file_name: Display name of the document
+            fields: Result fields that can be read, in output order
+            extract: Callable taking a field name and returning its value
+            limit_exceeded: Limit the document ran into while it was prepared, if any
+        """
+        self._values = {'file_name': file_name}
+        self._keys = ('file_name', *fields)
+        if limit_exceeded is not None:
+            self._values['limit_exceeded'] = limit_exceeded
+            self._keys += ('limit_exceeded',)
+        self._extract = extract
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            if key not in self._keys:
+                raise KeyError(key)
+            self._values[key] = self._extract(key)
+            if len(self._values) == len(self._keys):
+                self._extract = None  # Everything is extracted; let go of the section texts
+        return self._values[key]
+
+    def __contains__(self, key):
+        # Answered without extracting anything
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def extracted(self):
+        """Names of the fields that have been extracted so far"""
+        return [key for key in self._keys if key in self._values]
+
+    def to_dict(self):
+        """Extract any remaining fields and return the result as a plain dict"""
+        return {key: self[key] for key in self._keys}
+
+    def __repr__(self):
+        pending = [key for key in self._keys if key not in self._values]
+        return f"LazyResult(file_name={self._values['file_name']!r}, pending={pending!r})"
@@ -0,0 +1,174 @@
+"""
+Limits module - Per-document time and size budgets
+
+A DocumentBudget tracks one document's wall-clock deadline and records the
+first limit the document runs into. Limits never raise: the parser stops the
+stage that hit the limit, keeps whatever was extracted so far and reports
+the reason under 'limit_exceeded' in the result.
+"""
+import multiprocessing
+import os
+import time
+from io import BytesIO
+from app.parser.converter import iter_resume_pages
+from app.parser.utils import picklable_input
+
+class DocumentBudget:
+    """
+    Deadline and limit bookkeeping for a single document
+    """
+
+    def __init__(self, timeout=None):
+        """
+        Args:
+            timeout: Wall-clock seconds the document may take (None for no limit)
+        """
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout if timeout else None
+        self.exceeded = None
+
+    def remaining(self):
+        """Seconds left before the deadline (None when there is no deadline)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self, stage):
+        """
+        Check the deadline, recording a timeout for the given stage when it has passed
+
+        Returns:
+            bool: True if the document is out of time
+        """
+        if self.deadline is None or time.monotonic() < self.deadline:
+            return False
+        self.exceed('timeout', stage, round(time.monotonic() - self.started, 3), self.timeout)
+        return True
+
+    def exceed(self, limit, stage, value=None, maximum=None):
+        """
+        Record that a limit was hit (only the first one is kept)
+
+        Args:
+            limit: 'timeout', 'max_bytes', 'max_pages' or 'max_chars'
+            stage: 'input', 'conversion' or 'extraction'
+            value: Measured value, if known
+            maximum: Configured limit
+        """
+        if self.exceeded is None:
+            self.exceeded = {'limit': limit, 'stage': stage, 'value': value, 'max': maximum}
+
+def input_size(file_input):
+    """
+    Size in bytes of a resume input, without reading it
+
+    Args:
+        file_input: Path to the file, bytes-like object or binary file object
+
+    Returns:
+        int: Size in bytes, or None if it cannot be determined cheaply
+    """
+    if isinstance(file_input, (str, os.PathLike)):
+        return os.path.getsize(file_input)
+    if isinstance(file_input, (bytes, bytearray)):
+        return len(file_input)
+    if isinstance(file_input, memoryview):
+        return file_input.nbytes
+    if isinstance(file_input, BytesIO):
+        return file_input.getbuffer().nbytes
+    try:
+        position = file_input.tell()
+        size = file_input.seek(0, os.SEEK_END)
+        file_input.seek(position)
+        return size
+    except Exception:
+        return None
+
+def limit_pages(pages, budget, max_pages=None, max_chars=None):
+    """
+    Pass converted pages through while they fit the document's budget
+
+    The page source should be asked for one page more than max_pages, so
+    that a document that is really longer can be told apart from one that
+    has exactly max_pages pages.
+
+    Args:
+        pages: Iterable of page texts
+        budget: DocumentBudget of the document
+        max_pages: Maximum number of pages (None for no limit)
+        max_chars: Maximum number of characters over all pages (None for no limit)
+
+    Yields:
+        str: Page texts, the last one cut short if max_chars is reached
+    """
+    chars = 0
+    for page_number, page in enumerate(pages):
+        if max_pages and page_number >= max_pages:
+            budget.exceed('max_pages', 'conversion', None, max_pages)
+            return
+        if max_chars and chars + len(page) > max_chars:
+            budget.exceed('max_chars', 'conversion', None, max_chars)
+            yield page[:max_chars - chars]
+            return
+        chars += len(page)
+        yield page
+        # Checked after handing out the page so that converted text is kept
+        if budget.expired('conversion'):
+            return
+
+def convert_isolated(file_input, budget, max_pages=None):
+    """
+    Convert a resume in a separate process that is killed when the budget runs out
+
+    Protects the caller from converters that hang or spin on malformed
+    files: whatever happens in the child, this returns within the deadline.
+
+    Args:
+        file_input: Path to the file, bytes-like object or binary file object
+        budget: DocumentBudget of the document
+        max_pages: Only convert this many pages (None for no limit)
+
+    Returns:
+        list: Page texts (empty if the conversion timed out)
+
+    Raises:
+        ValueError: If the conversion failed in the child process
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_convert_in_child,
+        args=(sender, picklable_input(file_input), max_pages),
+        daemon=True
+    )
+    process.start()
+    sender.close()  # Only the child writes; EOF then tells us it died
+
+    try:
+        if not receiver.poll(budget.remaining()):
+            process.kill()
+            budget.expired('conversion')
+            return []
+        try:
+            status, payload = receiver.recv()
+        except EOFError:
+            raise ValueError("Conversion process exited unexpectedly")
+    finally:
+        receiver.close()
+        process.join(1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    if status == 'error':
+        raise ValueError(payload)
+    return payload
+
+def _convert_in_child(connection, source, max_pages):
+    """Conversion process body: send back ('ok', pages) or ('error', message)"""
+    try:
+        connection.send(('ok', list(iter_resume_pages(source, max_pages=max_pages))))
+    except Exception as e:
+        connection.send(('error', str(e)))
+    finally:
+        connection.close()
@@ -0,0 +1,62 @@
+"""
+NLP module - Process-wide registry of loaded spaCy pipelines
+
+spaCy itself is only imported when the first pipeline is loaded, so code
+paths that never need NLP (e.g. documents without a skills section) do not
+pay for importing it.
+"""
+import threading
+from app.config import NLP_PROFILES, NLP_PROFILE
+
+# Loaded pipelines, keyed by profile name
+_models = {}
+_models_lock = threading.Lock()
+
+def get_nlp(profile=NLP_PROFILE):
+    """
+    Return the spaCy pipeline for the given profile, loading it on first use
+    
+    Each profile is loaded at most once per process and then shared by every
+    caller, so building parsers or handling requests never pays the load
+    cost again.
+    
+    Args:
+        profile: Name of a pipeline profile from NLP_PROFILES
+        
+    Returns:
+        Language: Loaded spaCy NLP pipeline
+        
+    Raises:
+        ValueError: If the profile is not defined
+    """
+    nlp = _models.get(profile)
+    if nlp is None:
+        with _models_lock:
+            # Another thread may have loaded it while we were waiting
+            nlp = _models.get(profile)
+            if nlp is None:
+                nlp = _load_profile(profile)
+                _models[profile] = nlp
+    return nlp
+
+def clear_models():
+    """Drop all loaded pipelines (mainly useful in tests and long-lived workers)"""
+    with _models_lock:
+        _models.clear()
+
+def _load_profile(profile):
+    """Load the spaCy pipeline described by a profile"""
+    if profile not in NLP_PROFILES:
+        raise ValueError(f"Unknown NLP profile: {profile}")
+    settings = NLP_PROFILES[profile]
+    
+    import spacy
+    
+    if settings.get('model') is None:
+        return spacy.blank('en')
+    
+    return spacy.load(
+        settings['model'],
+        exclude=settings.get('exclude', []),
+        disable=settings.get('disable', [])
+    )
@@ -1,12 +1,32 @@
 """
 Preprocessor module - Functions for cleaning and normalizing text
 """
-import re
+from app.config import SECTION_HEADERS
+
+# Bullet characters are moved onto a new line of their own
+_BULLET_TABLE = str.maketrans({bullet: f'\n{bullet} ' for bullet in '•◦○■●'})
+
+# Header aliases (e.g. 'work experience') mapped to their canonical header
+# ('EXPERIENCE'), taken from SECTION_HEADERS
+_HEADER_ALIASES = {
+    ' '.join(header.lower().split()): section.upper()
+    for section, headers in SECTION_HEADERS.items()
+    for header in headers
+    if header.lower() != section.lower()
+}
+_ALIAS_FIRST_WORDS = {alias.split()[0] for alias in _HEADER_ALIASES}
+_ALIAS_MAX_WORDS = max((len(alias.split()) for alias in _HEADER_ALIASES), default=0)
 
 def preprocess_text(text):
     """
     Clean and normalize text
     
+    Works through the text line by line in a single pass: whitespace within
+    a line is folded to single spaces, runs of blank lines are collapsed to
+    one blank line (the extractors split entries on them), every bullet
+    point starts a new line, and header aliases such as 'Work Experience' at
+    the start of a line are rewritten to their canonical section header.
+    
     Args:
         text: Raw text to preprocess
         
@@ -15,34 +35,34 @@ def preprocess_text(text):
     """
     if not text:
         return ""
-        
-    # Convert to lowercase
-    # text = text.lower()  # Optional - may lose information about proper nouns
-    
-    # Replace multiple spaces with a single space
-    text = re.sub(r'\s+', ' ', text)
     
-    # Normalize line breaks
-    text = re.sub(r'\n+', '\n', text)
+    lines = []
+    for line in text.translate(_BULLET_TABLE).splitlines():
+        words = line.split()
+        if not words:
+            if lines and lines[-1]:
+                lines.append('')
+            continue
+        if words[0].lower().rstrip(':') in _ALIAS_FIRST_WORDS:
+            words = _rewrite_header_alias(words)
+        lines.append(' '.join(words))
     
-    # Remove special characters (optional, be careful with this)
-    # text = re.sub(r'[^\w\s.,;:()-]', '', text)
-    
-    # Handle bullet points and dashes
-    text = text.replace('•', '\n• ')
-    text = text.replace('◦', '\n◦ ')
-    text = text.replace('○', '\n○ ')
-    text = text.replace('■', '\n■ ')
-    text = text.replace('●', '\n● ')
-    
-    # Handle common section header variations
-    text = re.sub(r'WORK\s+EXPERIENCE', 'EXPERIENCE', text, flags=re.IGNORECASE)
-    text = re.sub(r'PROFESSIONAL\s+EXPERIENCE', 'EXPERIENCE', text, flags=re.IGNORECASE)
-    text = re.sub(r'ACADEMIC\s+BACKGROUND', 'EDUCATION', text, flags=re.IGNORECASE)
-    text = re.sub(r'EDUCATIONAL\s+QUALIFICATIONS', 'EDUCATION', text, flags=re.IGNORECASE)
-    text = re.sub(r'TECHNICAL\s+SKILLS', 'SKILLS', text, flags=re.IGNORECASE)
-    text = re.sub(r'CORE\s+COMPETENCIES', 'SKILLS', text, flags=re.IGNORECASE)
-    text = re.sub(r'PROFESSIONAL\s+CERTIFICATIONS', 'CERTIFICATIONS', text, flags=re.IGNORECASE)
-    text = re.sub(r'PERSONAL\s+PROJECTS', 'PROJECTS', text, flags=re.IGNORECASE)
+    if lines and not lines[-1]:
+        lines.pop()
+    return '\n'.join(lines)
+
+def _rewrite_header_alias(words):
+    """
+    Replace a header alias at the start of a line by its canonical header
     
-    return text.strip()
\ No newline at end of file
+    The alias must make up the whole line or be followed by a colon, so that
+    ordinary sentences starting with e.g. 'Expertise in' are left alone.
+    """
+    for count in range(min(_ALIAS_MAX_WORDS, len(words)), 0, -1):
+        last_word = words[count - 1]
+        has_colon = last_word.endswith(':')
+        candidate = ' '.join(words[:count - 1] + [last_word.rstrip(':')]).lower()
+        header = _HEADER_ALIASES.get(candidate)
+        if header and (has_colon or count == len(words) or words[count].startswith(':')):
+            return [header + (':' if has_colon else '')] + words[count:]
+    return words
@@ -0,0 +1,167 @@
+"""
+Records module - Compact typed records for parse results
+
+ResumeParser returns plain dicts. For jobs that hold many results in memory,
+Resume.from_dict turns a result into slotted dataclasses, which need no
+per-instance dict and so take a fraction of the memory of the nested dicts.
+to_dict gives back exactly the dict the parser produced (same keys, same
+order), so records can be written with the existing JSON tools or with
+app.output.encode_json.
+
+Usage:
+    resume = Resume.from_dict(parser.parse("resume.pdf"))
+    titles = [job.job_title for job in resume.experience]
+"""
+from dataclasses import dataclass, field
+
+@dataclass(slots=True)
+class Experience:
+    """One job from the experience section"""
+    job_title: str | None = None
+    company: str | None = None
+    dates: str | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    responsibilities: list = field(default_factory=list)
+
+    def to_dict(self):
+        return {'job_title': self.job_title, 'company': self.company, 'dates': self.dates,
+                'start_date': self.start_date, 'end_date': self.end_date,
+                'responsibilities': list(self.responsibilities)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('job_title'), data.get('company'), data.get('dates'),
+                   data.get('start_date'), data.get('end_date'), list(data.get('responsibilities') or ()))
+
+@dataclass(slots=True)
+class Education:
+    """One degree from the education section"""
+    degree: str | None = None
+    institution: str | None = None
+    graduation_date: str | None = None
+    graduation_date_iso: str | None = None
+    gpa: str | None = None
+
+    def to_dict(self):
+        return {'degree': self.degree, 'institution': self.institution,
+                'graduation_date': self.graduation_date,
+                'graduation_date_iso': self.graduation_date_iso, 'gpa': self.gpa}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('degree'), data.get('institution'), data.get('graduation_date'),
+                   data.get('graduation_date_iso'), data.get('gpa'))
+
+@dataclass(slots=True)
+class Certification:
+    """One certification from the certifications section"""
+    name: str | None = None
+    authority: str | None = None
+    date: str | None = None
+    date_iso: str | None = None
+    credential_id: str | None = None
+
+    def to_dict(self):
+        return {'name': self.name, 'authority': self.authority, 'date': self.date,
+                'date_iso': self.date_iso, 'credential_id': self.credential_id}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('name'), data.get('authority'), data.get('date'),
+                   data.get('date_iso'), data.get('credential_id'))
+
+@dataclass(slots=True)
+class Project:
+    """One project from the projects section"""
+    title: str | None = None
+    description: str | None = None
+    technologies: list = field(default_factory=list)
+
+    def to_dict(self):
+        return {'title': self.title, 'description': self.description,
+                'technologies': list(self.technologies)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('title'), data.get('description'), list(data.get('technologies') or ()))
+
+@dataclass(slots=True)
+class Contact:
+    """Contact details from the top of the resume"""
+    name: str | None = None
+    email: str | None = None
+    phone: str | None = None
+
+    def to_dict(self):
+        return {'name': self.name, 'email': self.email, 'phone': self.phone}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('name'), data.get('email'), data.get('phone'))
+
+@dataclass(slots=True)
+class Resume:
+    """
+    A complete parse result
+
+    Fields that were not extracted (see the fields option of ResumeParser)
+    are None and left out of to_dict, as is limit_exceeded unless a limit
+    was hit. path is the input path the CLI adds to JSON Lines output; it
+    comes first in to_dict when set.
+    """
+    file_name: str | None = None
+    skills: list | None = None
+    experience: list | None = None
+    education: list | None = None
+    certifications: list | None = None
+    projects: list | None = None
+    contact: Contact | None = None
+    limit_exceeded: dict | None = None
+    path: str | None = None
+
+    def to_dict(self):
+        """Return the result as the dict ResumeParser.parse produces"""
+        data = {} if self.path is None else {'path': self.path}
+        data['file_name'] = self.file_name
+        if self.skills is not None:
+            data['skills'] = list(self.skills)
+        for name in ('experience', 'education', 'certifications', 'projects'):
+            records = getattr(self, name)
+            if records is not None:
+                data[name] = [record.to_dict() for record in records]
+        if self.contact is not None:
+            data['contact'] = self.contact.to_dict()
+        if self.limit_exceeded is not None:
+            data['limit_exceeded'] = dict(self.limit_exceeded)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a record from a parse result (or a line read back from JSON)
+
+        Args:
+            data: Result dict as returned by ResumeParser.parse, or a line
+                of the CLI's JSON Lines output (with 'path')
+
+        Returns:
+            Resume: Typed record holding the same values
+        """
+        def records(name, record_type):
+            items = data.get(name)
+            return None if items is None else [record_type.from_dict(item) for item in items]
+
+        skills = data.get('skills')
+        contact = data.get('contact')
+        return cls(
+            file_name=data.get('file_name'),
+            skills=None if skills is None else list(skills),
+            experience=records('experience', Experience),
+            education=records('education', Education),
+            certifications=records('certifications', Certification),
+            projects=records('projects', Project),
+            contact=None if contact is None else Contact.from_dict(contact),
+            limit_exceeded=data.get('limit_exceeded'),
+            path=data.get('path')
+        )
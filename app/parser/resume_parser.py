@@ -1,50 +1,608 @@
 """
 Resume Parser - Main parser class
 """
+import asyncio
 import os
-import spacy
-from app.parser.converter import convert_resume_to_text
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from app.parser.converter import iter_resume_pages
+from app.parser.limits import DocumentBudget, input_size, limit_pages, convert_isolated
+from app.parser.backends import backend_fingerprint
 from app.parser.preprocessor import preprocess_text
-from app.parser.section_extractor import identify_sections
+from app.parser.section_extractor import identify_sections_stream
 from app.parser.extractors.skills import extract_skills
 from app.parser.extractors.experience import extract_experience
 from app.parser.extractors.education import extract_education
 from app.parser.extractors.certification import extract_certifications
 from app.parser.extractors.projects import extract_projects
-from app.config import NLP_MODEL
+from app.parser.extractors.contact import extract_contact
+from app.parser.lazy_result import LazyResult
+from app.parser.nlp import get_nlp
+from app.parser.utils import compute_content_hash, picklable_input, rewindable_input
+from app.reference_data import get_reference_data
+from app.result_cache import ResultCache, make_cache_key
+from app.metrics import DocumentTrace
+from app.config import (NLP_PROFILE, MAX_PAGES, MAX_DOCUMENT_BYTES, MAX_DOCUMENT_CHARS,
+                        DOCUMENT_TIMEOUT, ISOLATE_CONVERSION, ASYNC_MAX_IN_FLIGHT)
+
+# Fields a result can hold, in output order. 'contact' (name, email and phone
+# from the top of the resume) is only extracted when asked for.
+FIELDS = ('skills', 'experience', 'education', 'certifications', 'projects', 'contact')
+DEFAULT_FIELDS = FIELDS[:5]
+
+# Extractors of the fields that come from a section of the same name
+_SECTION_EXTRACTORS = {
+    'experience': extract_experience,
+    'education': extract_education,
+    'certifications': extract_certifications,
+    'projects': extract_projects
+}
+
+# Stand-in for DocumentTrace.timed when instrumentation is off
+_UNTIMED = nullcontext()
+
+# Parsers built in process pool workers by parse_async, keyed by their settings
+_process_parsers = {}
 
 class ResumeParser:
-    """Main class for parsing resumes"""
+    """
+    Main class for parsing resumes
+    
+    A parser is meant to be built once and reused for any number of
+    documents. The spaCy pipeline is taken from the process-wide registry the
+    first time it is needed, so parsers using the same profile share a
+    single copy.
     
-    def __init__(self, file_path):
-        """Initialize the resume parser with a file path"""
+    Every document is parsed within per-document limits. A document that
+    hits one is not an error: the result holds whatever could be extracted
+    and a 'limit_exceeded' entry saying which limit stopped it, e.g.
+    {'limit': 'timeout', 'stage': 'conversion', 'value': 30.2, 'max': 30}.
+    
+    Observers (see app/metrics.py) receive a record for every document with
+    per-stage timings, input sizes and the failure category, if any.
+    
+    Callers that only need some of the result can pass fields=[...] to the
+    parse methods, or use parse_lazy to extract each field when it is first
+    read. Unless 'skills' is among the fields read, spaCy is never loaded.
+    
+    From asyncio code, use parse_async / parse_many_async, which run the
+    work in an executor so that the event loop is never blocked.
+    """
+    
+    def __init__(self, file_path=None, profile=NLP_PROFILE, cache=None, max_pages=MAX_PAGES,
+                 max_bytes=MAX_DOCUMENT_BYTES, max_chars=MAX_DOCUMENT_CHARS,
+                 timeout=DOCUMENT_TIMEOUT, isolate_conversion=ISOLATE_CONVERSION, observers=None,
+                 max_in_flight=ASYNC_MAX_IN_FLIGHT):
+        """
+        Initialize the resume parser
+        
+        Args:
+            file_path: Optional default file to parse when parse() is called without one
+            profile: Name of the spaCy pipeline profile to use (see NLP_PROFILES)
+            cache: Optional ResultCache; documents seen before are then
+                returned from the cache instead of being parsed again
+            max_pages: Only read this many pages of each PDF (None for no limit)
+            max_bytes: Skip conversion of larger inputs (None for no limit)
+            max_chars: Drop converted text beyond this many characters (None for no limit)
+            timeout: Wall-clock seconds per document (None for no limit)
+            isolate_conversion: Convert in a subprocess that is killed when the
+                timeout expires, so that a hanging converter cannot block the caller
+            observers: Optional callables that receive a record per document,
+                e.g. MetricsCollector or JsonLogObserver from app.metrics
+            max_in_flight: Maximum number of documents parse_async and
+                parse_many_async work on at once, per event loop
+        """
         self.file_path = file_path
-        self.nlp = spacy.load(NLP_MODEL)
+        self.profile = profile
+        self.cache = cache
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self.isolate_conversion = isolate_conversion
+        self.observers = list(observers or [])
+        self.max_in_flight = max_in_flight
+        self._nlp = None
+        self._semaphores = weakref.WeakKeyDictionary()
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline used for skills extraction, loaded lazily"""
+        if self._nlp is None:
+            self._nlp = get_nlp(self.profile)
+        return self._nlp
+        
+    def parse(self, file_path=None, fields=None, raise_errors=False):
+        """
+        Parse a resume and extract structured information
         
-    def parse(self):
-        """Parse the resume and extract structured information"""
+        Args:
+            file_path: Path to the resume file, bytes or binary file object
+                (defaults to the file given to the constructor)
+            fields: Result fields to extract (see FIELDS); None for DEFAULT_FIELDS
+            raise_errors: Raise the error that made parsing fail instead of
+                printing it and returning None (observers are notified either way)
+            
+        Returns:
+            dict: Extracted resume data (partial, with 'limit_exceeded', if a
+                limit was hit), or None if parsing failed
+            
+        Raises:
+            ValueError: If no file is given or a field is unknown
+        """
+        if file_path is None:
+            file_path = self.file_path
+        if file_path is None:
+            raise ValueError("No resume file given to parse.")
+        file_path = rewindable_input(file_path)
+        fields = _select_fields(fields)
+            
+        trace = DocumentTrace(_file_name(file_path)) if self.observers else None
+        sections = None
         try:
-            # Step 1: Convert resume to text
-            resume_text = convert_resume_to_text(self.file_path)
+            with trace.timed('cache') if trace else _UNTIMED:
+                cache_key = self._cache_key(file_path)
+                cached = self._cached_result(cache_key, file_path, fields)
+            if cached is not None:
+                self._notify(trace, 'cached', result=cached)
+                return cached
             
-            # Step 2: Preprocess the text
-            preprocessed_text = preprocess_text(resume_text)
+            budget = DocumentBudget(self.timeout)
+            preamble = [] if 'contact' in fields else None
+            file_name, sections = self._prepare(file_path, budget, trace, preamble)
+            result = self._extract(file_name, sections, budget=budget, trace=trace, fields=fields,
+                                   preamble=preamble)
+            with trace.timed('cache') if trace else _UNTIMED:
+                self._store_result(cache_key, result)
+            self._notify(trace, 'ok', result=result, sections=sections)
+            return result
+            
+        except Exception as e:
+            self._notify(trace, 'failed', error=e, sections=sections)
+            if raise_errors:
+                raise
+            print(f"Error processing resume {_file_name(file_path)}: {str(e)}")
+            return None
+    
+    def parse_lazy(self, file_path=None, fields=None):
+        """
+        Prepare a resume now and extract each field the first time it is read
+        
+        The document is converted and split into sections right away; the
+        extractors only run when their field is accessed on the returned
+        result. The timeout only covers the preparation, and observers see
+        the document once it is prepared, so extraction time is not part of
+        its record. Cached results are served as they are.
+        
+        Args:
+            file_path: Path to the resume file, bytes or binary file object
+                (defaults to the file given to the constructor)
+            fields: Result fields that can be read (see FIELDS); None for DEFAULT_FIELDS
             
-            # Step 3: Identify sections
-            sections = identify_sections(preprocessed_text)
+        Returns:
+            LazyResult: Read-only mapping with the same keys as parse's result,
+                or None if the document could not be prepared
             
-            # Step 4: Extract information from each section
-            resume_data = {
-                'file_name': os.path.basename(self.file_path),
-                'skills': extract_skills(sections.get('skills', ''), self.nlp),
-                'experience': extract_experience(sections.get('experience', '')),
-                'education': extract_education(sections.get('education', '')),
-                'certifications': extract_certifications(sections.get('certifications', '')),
-                'projects': extract_projects(sections.get('projects', ''))
-            }
+        Raises:
+            ValueError: If no file is given or a field is unknown
+        """
+        if file_path is None:
+            file_path = self.file_path
+        if file_path is None:
+            raise ValueError("No resume file given to parse.")
+        file_path = rewindable_input(file_path)
+        fields = _select_fields(fields)
+        
+        trace = DocumentTrace(_file_name(file_path)) if self.observers else None
+        sections = None
+        try:
+            with trace.timed('cache') if trace else _UNTIMED:
+                cached = self._cached_result(self._cache_key(file_path), file_path, fields)
+            if cached is not None:
+                self._notify(trace, 'cached', result=cached)
+                return LazyResult(cached['file_name'], fields, cached.__getitem__)
             
-            return resume_data
+            budget = DocumentBudget(self.timeout)
+            preamble = [] if 'contact' in fields else None
+            file_name, sections = self._prepare(file_path, budget, trace, preamble)
+            self._notify(trace, 'ok', result=_mark_partial({}, budget), sections=sections)
+            return LazyResult(file_name, fields,
+                              lambda field: self._extract_field(field, sections, preamble=preamble),
+                              limit_exceeded=budget.exceeded)
             
         except Exception as e:
-            print(f"Error processing resume {self.file_path}: {str(e)}")
-            return None
\ No newline at end of file
+            print(f"Error processing resume {_file_name(file_path)}: {str(e)}")
+            self._notify(trace, 'failed', error=e, sections=sections)
+            return None
+    
+    def parse_many(self, files, batch_size=32, n_process=1, fields=None):
+        """
+        Parse many resumes, batching the spaCy step
+        
+        Every document is converted and split into sections, then all skills
+        sections are streamed through nlp.pipe in batches before the regex
+        extractors run. Inputs are consumed lazily, so any iterable (including
+        a generator over a large directory) can be passed.
+        
+        The timeout only covers conversion here, since the time a document
+        spends waiting for its batch says nothing about the document itself.
+        For the same reason, observers see the batched spaCy time only as
+        part of each document's total, not as a 'skills' stage.
+        
+        Without 'skills' among the fields, spaCy is not used at all.
+        
+        Args:
+            files: Iterable of file paths, bytes or binary file objects
+            batch_size: Number of skills sections per nlp.pipe batch
+            n_process: Number of processes nlp.pipe may use
+            fields: Result fields to extract (see FIELDS); None for DEFAULT_FIELDS
+            
+        Yields:
+            dict: Extracted resume data (or None if parsing failed), in input order
+            
+        Raises:
+            ValueError: If a field is unknown
+        """
+        fields = _select_fields(fields)
+        prepared = (self._prepare_safely(file_input, fields) for file_input in files)
+        yield from self.parse_prepared(prepared, batch_size=batch_size, n_process=n_process, fields=fields)
+    
+    def prepare(self, file_input, fields=None):
+        """
+        Convert and section a resume for a later parse_prepared call
+        
+        This is the first half of parse_many: everything before spaCy. It
+        never raises for a bad document, so callers can prepare documents on
+        their own threads and hand them to a single thread that owns the
+        spaCy pipeline (see app.server).
+        
+        Args:
+            file_input: Path to the resume file, bytes or binary file object
+            fields: Result fields to extract (see FIELDS); None for DEFAULT_FIELDS
+            
+        Returns:
+            dict: Prepared document, to be passed to parse_prepared with the same fields
+            
+        Raises:
+            ValueError: If a field is unknown
+        """
+        return self._prepare_safely(file_input, _select_fields(fields))
+    
+    def parse_prepared(self, prepared, batch_size=32, n_process=1, fields=None):
+        """
+        Finish documents from prepare, batching the spaCy step
+        
+        This is the second half of parse_many: all skills sections are
+        streamed through nlp.pipe in batches before the regex extractors run.
+        
+        Args:
+            prepared: Iterable of documents returned by prepare
+            batch_size: Number of skills sections per nlp.pipe batch
+            n_process: Number of processes nlp.pipe may use
+            fields: The fields the documents were prepared with
+            
+        Yields:
+            dict: Extracted resume data (or None if parsing failed), in input order
+        """
+        fields = _select_fields(fields)
+        if 'skills' in fields:
+            max_length = self.nlp.max_length
+            # Cached and failed documents still go through the pipe (as empty
+            # text) so that results keep the input order
+            skills_texts = (
+                ((item['sections'] or {}).get('skills', '')[:max_length], item)
+                for item in prepared
+            )
+            docs = self.nlp.pipe(skills_texts, as_tuples=True, batch_size=batch_size,
+                                 n_process=n_process)
+        else:
+            docs = ((None, item) for item in prepared)
+        
+        for doc, item in docs:
+            if item['result'] is not None or item['sections'] is None:
+                yield item['result']
+                continue
+            trace = item['trace']
+            try:
+                result = self._extract(item['file_name'], item['sections'], skills_doc=doc, trace=trace,
+                                       fields=fields, preamble=item['preamble'])
+                _mark_partial(result, item['budget'])
+                with trace.timed('cache') if trace else _UNTIMED:
+                    self._store_result(item['cache_key'], result)
+                self._notify(trace, 'ok', result=result, sections=item['sections'])
+                yield result
+            except Exception as e:
+                print(f"Error processing resume {item['file_name']}: {str(e)}")
+                self._notify(trace, 'failed', error=e, sections=item['sections'])
+                yield None
+    
+    async def parse_async(self, file_path=None, executor=None, fields=None):
+        """
+        Parse a resume without blocking the event loop
+        
+        Conversion and NLP run in the executor. At most max_in_flight
+        documents are worked on at once; further calls wait for a free slot.
+        Cancelling the call (e.g. with asyncio.wait_for) returns control
+        right away and frees the slot. A document already running in a
+        thread still finishes in the background; use the timeout and
+        isolate_conversion options to stop the work itself.
+        
+        Args:
+            file_path: Path to the resume file, bytes or binary file object
+                (defaults to the file given to the constructor)
+            executor: concurrent.futures executor to run in (None uses the
+                loop's default thread pool). With a ProcessPoolExecutor each
+                worker process builds its own parser with the same settings,
+                and in-memory inputs are sent to it as bytes.
+            fields: Result fields to extract (see FIELDS); None for DEFAULT_FIELDS
+            
+        Returns:
+            dict: Extracted resume data, or None if parsing failed
+        """
+        if file_path is None:
+            file_path = self.file_path
+        if file_path is None:
+            raise ValueError("No resume file given to parse.")
+        file_path = rewindable_input(file_path)
+        fields = _select_fields(fields)
+        
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop):
+            if not isinstance(executor, ProcessPoolExecutor):
+                return await loop.run_in_executor(executor, self.parse, file_path, fields)
+            
+            result, record = await loop.run_in_executor(
+                executor, _parse_in_process, self._settings(), picklable_input(file_path), fields
+            )
+            # The worker only saw bytes for in-memory inputs
+            file_name = _file_name(file_path)
+            if result is not None:
+                result['file_name'] = file_name
+            if record is not None:
+                record['file_name'] = file_name
+                self._emit(record)
+            return result
+    
+    async def parse_many_async(self, files, executor=None, fields=None):
+        """
+        Parse many resumes without blocking the event loop
+        
+        Up to max_in_flight documents are parsed concurrently with
+        parse_async; results are yielded in input order. Leaving the loop
+        early or cancelling the consumer cancels the documents still pending.
+        
+        Args:
+            files: Iterable of file paths, bytes or binary file objects
+            executor: Executor to run in (see parse_async)
+            fields: Result fields to extract (see FIELDS); None for DEFAULT_FIELDS
+            
+        Yields:
+            dict: Extracted resume data (or None if parsing failed), in input order
+        """
+        pending = deque()
+        try:
+            for file_input in files:
+                pending.append(asyncio.ensure_future(self.parse_async(file_input, executor, fields)))
+                if len(pending) >= self.max_in_flight:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _semaphore(self, loop):
+        """Semaphore limiting the documents in flight on an event loop"""
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+        return semaphore
+    
+    def _settings(self):
+        """Constructor arguments a worker process needs to build an equivalent parser"""
+        return (
+            ('profile', self.profile),
+            ('cache', (self.cache.path, self.cache.max_bytes) if self.cache is not None else None),
+            ('max_pages', self.max_pages),
+            ('max_bytes', self.max_bytes),
+            ('max_chars', self.max_chars),
+            ('timeout', self.timeout),
+            ('isolate_conversion', self.isolate_conversion),
+            ('observe', bool(self.observers))
+        )
+    
+    def _prepare(self, file_input, budget, trace=None, preamble=None):
+        """
+        Convert, preprocess and section a resume (everything before NLP)
+        
+        The lines before the first section header are added to preamble, if given.
+        """
+        size = input_size(file_input)
+        if trace is not None:
+            trace.record['bytes'] = size
+        if self.max_bytes and size is not None and size > self.max_bytes:
+            budget.exceed('max_bytes', 'input', size, self.max_bytes)
+            return _file_name(file_input), {}
+        
+        # Step 1: Convert resume to text, page by page. One page more than
+        # allowed is requested to tell whether the document was cut short.
+        page_limit = self.max_pages + 1 if self.max_pages else None
+        if self.isolate_conversion:
+            # The child converts the whole document up front, so that is where conversion time goes
+            with trace.timed('convert') if trace else _UNTIMED:
+                pages = convert_isolated(file_input, budget, max_pages=page_limit)
+        else:
+            pages = iter_resume_pages(file_input, max_pages=page_limit)
+        pages = limit_pages(pages, budget, max_pages=self.max_pages, max_chars=self.max_chars)
+        
+        if trace is None:
+            # Step 2: Preprocess each page as it arrives
+            preprocessed_pages = (preprocess_text(page) for page in pages)
+            
+            # Step 3: Identify sections while pages are still being converted
+            sections = identify_sections_stream(preprocessed_pages, preamble)
+        else:
+            # Same steps, timing each of them while they interleave
+            preprocessed_pages = trace.iter_timed(
+                'preprocess', (preprocess_text(page) for page in trace.iter_pages(pages))
+            )
+            with trace.timed('sections'):
+                sections = identify_sections_stream(preprocessed_pages, preamble)
+        
+        return _file_name(file_input), sections
+    
+    def _prepare_safely(self, file_input, fields=DEFAULT_FIELDS):
+        """
+        Prepare a document for parse_many without raising
+        
+        Returns:
+            dict: 'file_name', 'cache_key', 'result' (set on a cache hit),
+                'sections' (None if the document could not be prepared),
+                'preamble' (when the contact field is wanted), 'budget' and 'trace'
+        """
+        file_input = rewindable_input(file_input)
+        item = {'file_name': _file_name(file_input), 'cache_key': None, 'result': None,
+                'sections': None, 'preamble': [] if 'contact' in fields else None,
+                'budget': DocumentBudget(self.timeout),
+                'trace': DocumentTrace(_file_name(file_input)) if self.observers else None}
+        trace = item['trace']
+        try:
+            with trace.timed('cache') if trace else _UNTIMED:
+                item['cache_key'] = self._cache_key(file_input)
+                item['result'] = self._cached_result(item['cache_key'], file_input, fields)
+            if item['result'] is None:
+                _, item['sections'] = self._prepare(file_input, item['budget'], trace, item['preamble'])
+            else:
+                self._notify(trace, 'cached', result=item['result'])
+        except Exception as e:
+            print(f"Error processing resume {item['file_name']}: {str(e)}")
+            self._notify(trace, 'failed', error=e)
+        return item
+    
+    def _cache_key(self, file_input):
+        """Cache key for a document, or None when caching is off"""
+        if self.cache is None:
+            return None
+        return make_cache_key(compute_content_hash(file_input), get_reference_data().version,
+                              self.profile, self.max_pages, self.max_chars, backend_fingerprint())
+    
+    def _cached_result(self, cache_key, file_input, fields=DEFAULT_FIELDS):
+        """
+        Return the cached result for a document, named after this input
+        
+        Only the requested fields are returned; a cached result that lacks
+        any of them counts as a miss.
+        """
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key, required=fields)
+        if cached is None:
+            return None
+        result = {'file_name': _file_name(file_input)}
+        for field in fields:
+            result[field] = cached[field]
+        return result
+    
+    def _store_result(self, cache_key, result):
+        """Cache a complete, freshly parsed result (if caching is on) and return it"""
+        # Partial results are not cached: a timeout may not happen next time.
+        # Neither are results without all default fields, which most lookups need.
+        if (cache_key is not None and 'limit_exceeded' not in result and
+                all(field in result for field in DEFAULT_FIELDS)):
+            self.cache.set(cache_key, result)
+        return result
+    
+    def _extract(self, file_name, sections, skills_doc=None, budget=None, trace=None,
+                 fields=DEFAULT_FIELDS, preamble=None):
+        """
+        Run the extractors of the requested fields, reusing an already processed skills doc if given
+        
+        Once the budget's deadline has passed, the remaining fields are
+        left empty.
+        """
+        # Step 4: Extract information from each section
+        resume_data = {'file_name': file_name}
+        for field in fields:
+            if budget is not None and budget.expired('extraction'):
+                resume_data[field] = self._extract_field(field, {})
+            else:
+                with trace.timed(field) if trace else _UNTIMED:
+                    resume_data[field] = self._extract_field(field, sections, skills_doc, preamble)
+        
+        return _mark_partial(resume_data, budget)
+    
+    def _extract_field(self, field, sections, skills_doc=None, preamble=None):
+        """Run the extractor of one result field (empty sections give empty values)"""
+        if field == 'contact':
+            return extract_contact('\n'.join(preamble or ()))
+        text = sections.get(field, '')
+        if field == 'skills':
+            # The pipeline is only loaded for documents that have skills to analyse
+            return extract_skills(text, self.nlp, doc=skills_doc) if text else []
+        return _SECTION_EXTRACTORS[field](text)
+    
+    def _notify(self, trace, status, error=None, result=None, sections=None):
+        """Complete a document's trace and hand the record to every observer"""
+        if trace is None:
+            return
+        self._emit(trace.finish(status, error=error, result=result, sections=sections))
+    
+    def _emit(self, record):
+        """Hand a document record to every observer"""
+        for observer in self.observers:
+            try:
+                observer(record)
+            except Exception as e:
+                print(f"Error in parse observer {observer!r}: {str(e)}")
+
+def _parse_in_process(settings, file_input, fields=None):
+    """
+    Process pool task for parse_async: parse with this worker's parser
+    
+    Returns:
+        tuple: (result, record) where record is the document's metrics
+            record if the calling parser has observers
+    """
+    if settings not in _process_parsers:
+        options = dict(settings)
+        cache = options.pop('cache')
+        records = [] if options.pop('observe') else None
+        parser = ResumeParser(cache=ResultCache(*cache) if cache else None,
+                              observers=[records.append] if records is not None else None,
+                              **options)
+        _process_parsers[settings] = (parser, records)
+    
+    parser, records = _process_parsers[settings]
+    if records is not None:
+        records.clear()
+    result = parser.parse(file_input, fields)
+    return result, records[-1] if records else None
+
+def _select_fields(fields):
+    """
+    Check the requested result fields and put them in output order
+    
+    Raises:
+        ValueError: If a field is unknown
+    """
+    if fields is None:
+        return DEFAULT_FIELDS
+    unknown = set(fields).difference(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown result fields: {', '.join(sorted(unknown))}")
+    return tuple(field for field in FIELDS if field in fields)
+
+def _mark_partial(resume_data, budget):
+    """Record the limit a document ran into, if any, in its result"""
+    if budget is not None and budget.exceeded is not None:
+        resume_data['limit_exceeded'] = budget.exceeded
+    return resume_data
+
+def _file_name(file_input):
+    """Best-effort display name for a file path or in-memory file"""
+    if isinstance(file_input, str):
+        return os.path.basename(file_input)
+    name = getattr(file_input, 'name', None)
+    return os.path.basename(name) if isinstance(name, str) else None
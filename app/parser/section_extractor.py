@@ -4,6 +4,29 @@ Section Extractor module - Functions for identifying sections in resumes
 import re
 from app.config import SECTION_HEADERS
 
+# Section lookup structures, built once from SECTION_HEADERS.
+# When a line matches headers of several sections, the section listed first wins.
+_SECTION_ORDER = {section: index for index, section in enumerate(SECTION_HEADERS)}
+_HEADER_SECTIONS = {}
+for _section, _headers in SECTION_HEADERS.items():
+    for _header in _headers:
+        _HEADER_SECTIONS.setdefault(_header.lower(), _section)
+
+_HEADER_ALTERNATION = '|'.join(re.escape(header) for header in sorted(_HEADER_SECTIONS, key=len, reverse=True))
+# Any header as a whole word, and any header anywhere (used for all-caps lines)
+_HEADER_WORD_PATTERN = re.compile(r'\b(?:' + _HEADER_ALTERNATION + r')\b')
+_HEADER_SUBSTRING_PATTERN = re.compile(_HEADER_ALTERNATION)
+
+# Keyword patterns used when no header line is found at all
+_FALLBACK_PATTERNS = [
+    # Look for common skills
+    ('skills', re.compile(r'(?:technical skills|skills|proficiencies)[\s\S]*?(?=\n\n|\Z)', re.IGNORECASE)),
+    # Look for work experience
+    ('experience', re.compile(r'(?:work experience|experience|employment)[\s\S]*?(?=\n\n|\Z)', re.IGNORECASE)),
+    # Look for education
+    ('education', re.compile(r'(?:education|academic)[\s\S]*?(?=\n\n|\Z)', re.IGNORECASE))
+]
+
 def identify_sections(text):
     """
     Identify different sections in a resume
@@ -15,91 +38,187 @@ def identify_sections(text):
         dict: Dictionary with section names as keys and section content as values
     """
     sections = {}
+    
+    for section, _, _, content_lines in _scan_sections(_iter_lines(text)):
+        sections[section] = '\n'.join(content_lines)
+        
+    # If no sections were found, try a different approach
+    if not sections:
+        sections = _fallback_section_identification(text)
+    
+    return sections
+
+def iter_sections(chunks, preamble=None):
+    """
+    Identify sections in text that arrives in chunks (e.g. page by page)
+    
+    Chunks are consumed lazily and each section is yielded as soon as the
+    next header (or the end of the input) is seen, so early sections are
+    available before the whole document has been converted. Only the lines
+    before the first header are held back, for the fallback identification.
+    
+    Args:
+        chunks: Iterable of preprocessed text chunks, each ending at a line break
+        preamble: Optional list that receives the lines before the first
+            section header (all lines if there is none)
+        
+    Yields:
+        tuple: (section name, section content) in order of appearance
+    """
+    if preamble is None:
+        preamble = []
+    found_section = False
+    
+    for section, _, _, content_lines in _scan_sections(_iter_chunk_lines(chunks), preamble):
+        found_section = True
+        yield section, '\n'.join(content_lines)
+    
+    # If no sections were found, try a different approach
+    if not found_section:
+        yield from _fallback_section_identification('\n'.join(preamble)).items()
+
+def identify_sections_stream(chunks, preamble=None):
+    """
+    Identify different sections in a resume from text chunks
+    
+    Args:
+        chunks: Iterable of preprocessed text chunks (e.g. one per page)
+        preamble: Optional list that receives the lines before the first
+            section header (all lines if there is none)
+        
+    Returns:
+        dict: Dictionary with section names as keys and section content as values
+    """
+    return dict(iter_sections(chunks, preamble))
+
+def identify_section_spans(text):
+    """
+    Locate the sections of a resume as character offsets
+    
+    Args:
+        text: Preprocessed resume text
+        
+    Returns:
+        dict: Section names mapped to (start, end) offsets of the section
+            content in text, from the line after the header to the end of
+            the section's last non-empty line
+    """
+    spans = {}
+    
+    for section, start, end, _ in _scan_sections(_iter_lines(text)):
+        spans[section] = (start, end)
+    
+    if not spans:
+        for section, match in _fallback_section_matches(text).items():
+            spans[section] = match.span()
+    
+    return spans
+
+def _iter_lines(text):
+    """Yield (start, end, line) for every line of text, with offsets into text"""
+    start = 0
+    while start <= len(text):
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+        yield start, end, text[start:end]
+        start = end + 1
+
+def _iter_chunk_lines(chunks):
+    """Yield (start, end, line) for every line of every chunk, with offsets across chunks"""
+    offset = 0
+    for chunk in chunks:
+        for start, end, line in _iter_lines(chunk):
+            yield offset + start, offset + end, line
+        offset += len(chunk) + 1
+
+def _scan_sections(lines, preamble=None):
+    """
+    Group lines into sections in a single pass
+    
+    Args:
+        lines: Iterable of (start, end, line) tuples
+        preamble: Optional list that receives the (stripped) lines that come
+            before the first section header
+        
+    Blank lines between the lines of a section are kept (one per run), since
+    the extractors use them to tell entries apart.
+        
+    Yields:
+        tuple: (section, content_start, content_end, content_lines) for each
+            section in order of appearance
+    """
     current_section = None
+    content_start = content_end = 0
     current_content = []
+    blank_pending = False
     
-    # Split text into lines
-    lines = text.split('\n')
-    
-    for line in lines:
+    for start, end, line in lines:
         line = line.strip()
         if not line:
+            blank_pending = bool(current_content)
             continue
             
         # Check if the line is a section header
-        found_section = False
-        for section, headers in SECTION_HEADERS.items():
-            # Case-insensitive matching for section headers
-            if _is_section_header(line, headers):
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content)
-                current_section = section
-                current_content = []
-                found_section = True
-                break
-                
-        if not found_section and current_section:
+        section = _classify_line(line)
+        if section:
+            if current_section:
+                yield current_section, content_start, content_end, current_content
+            current_section = section
+            content_start = content_end = end + 1
+            current_content = []
+        elif current_section:
+            if blank_pending:
+                current_content.append('')
             current_content.append(line)
+            content_end = end
+        elif preamble is not None:
+            preamble.append(line)
+        blank_pending = False
     
     # Add the last section
     if current_section:
-        sections[current_section] = '\n'.join(current_content)
-        
-    # If no sections were found, try a different approach
-    if not sections:
-        sections = _fallback_section_identification(text)
-    
-    return sections
+        yield current_section, content_start, content_end, current_content
 
-def _is_section_header(line, headers):
-    """Check if a line is a section header"""
+def _classify_line(line):
+    """
+    Return the section a line is a header for, or None
+    
+    A line is a header when it is exactly a known header (optionally followed
+    by a colon), when it is in all caps and contains a header, or when it
+    contains a header as a whole word and looks like a heading (title case,
+    ends with a colon or is short).
+    """
     line_lower = line.lower()
     
-    # Direct match
-    if any(header == line_lower for header in headers):
-        return True
+    # Direct match, with or without a colon
+    section = _HEADER_SECTIONS.get(line_lower[:-1] if line_lower.endswith(':') else line_lower)
+    if section:
+        return section
     
-    # Header with colon
-    if any(header + ':' == line_lower for header in headers):
-        return True
+    if line.isupper():
+        pattern = _HEADER_SUBSTRING_PATTERN
+    elif line.istitle() or line.endswith(':') or len(line) < 30:
+        pattern = _HEADER_WORD_PATTERN
+    else:
+        return None
     
-    # Header is a substring but prominent (all caps or at start of line)
-    if line.isupper() and any(header in line_lower for header in headers):
-        return True
-        
-    # More sophisticated check for headers
-    for header in headers:
-        pattern = r'\b' + re.escape(header) + r'\b'
-        if re.search(pattern, line_lower, re.IGNORECASE):
-            # Check if this is likely a header (based on formatting)
-            if (line.isupper() or 
-                line.istitle() or 
-                line.endswith(':') or 
-                len(line) < 30):  # Shorter lines are more likely to be headers
-                return True
-    
-    return False
+    headers = pattern.findall(line_lower)
+    if not headers:
+        return None
+    return min((_HEADER_SECTIONS[header] for header in headers), key=_SECTION_ORDER.get)
 
 def _fallback_section_identification(text):
     """Fallback method if section headers aren't clearly identified"""
-    sections = {}
-    
-    # Look for common skills
-    skills_pattern = r'(?:technical skills|skills|proficiencies)[\s\S]*?(?=\n\n|\Z)'
-    skills_match = re.search(skills_pattern, text, re.IGNORECASE)
-    if skills_match:
-        sections['skills'] = skills_match.group(0)
-    
-    # Look for work experience
-    experience_pattern = r'(?:work experience|experience|employment)[\s\S]*?(?=\n\n|\Z)'
-    experience_match = re.search(experience_pattern, text, re.IGNORECASE)
-    if experience_match:
-        sections['experience'] = experience_match.group(0)
+    return {section: match.group(0) for section, match in _fallback_section_matches(text).items()}
+
+def _fallback_section_matches(text):
+    """Find sections by keyword alone, returning the regex match for each"""
+    matches = {}
     
-    # Look for education
-    education_pattern = r'(?:education|academic)[\s\S]*?(?=\n\n|\Z)'
-    education_match = re.search(education_pattern, text, re.IGNORECASE)
-    if education_match:
-        sections['education'] = education_match.group(0)
+    for section, pattern in _FALLBACK_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            matches[section] = match
     
-    return sections
\ No newline at end of file
+    return matches
\ No newline at end of file
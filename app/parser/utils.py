@@ -1,8 +1,10 @@
 """
 Utils module - Helper functions for resume parsing
 """
+import hashlib
 import os
 import re
+from io import BytesIO
 
 def is_valid_file_extension(file_path, supported_extensions):
     """
@@ -18,6 +20,95 @@ def is_valid_file_extension(file_path, supported_extensions):
     _, ext = os.path.splitext(file_path)
     return ext.lower() in supported_extensions
 
+def compute_content_hash(file_input, chunk_size=1024 * 1024):
+    """
+    Compute the SHA-256 of a resume's raw content
+    
+    Args:
+        file_input: Path to the file, bytes-like object or binary file object
+        chunk_size: Read size used for files and streams
+        
+    Returns:
+        str: Hex digest of the content
+    """
+    digest = hashlib.sha256()
+    
+    if isinstance(file_input, (str, os.PathLike)):
+        with open(file_input, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    elif isinstance(file_input, (bytes, bytearray, memoryview)):
+        digest.update(file_input)
+    elif isinstance(file_input, BytesIO):
+        with file_input.getbuffer() as buffer:
+            digest.update(buffer)
+    elif _is_seekable(file_input):
+        file_input.seek(0)
+        for chunk in iter(lambda: file_input.read(chunk_size), b''):
+            digest.update(chunk)
+        file_input.seek(0)
+    else:
+        raise ValueError("Cannot hash a stream that is not seekable; buffer it with rewindable_input first.")
+    
+    return digest.hexdigest()
+
+def picklable_input(file_input):
+    """
+    Turn a resume input into something that can be sent to another process
+    
+    Args:
+        file_input: Path to the file, bytes-like object or binary file object
+        
+    Returns:
+        str or bytes: The path, or the content of in-memory inputs
+    """
+    if isinstance(file_input, (str, bytes)):
+        return file_input
+    if isinstance(file_input, os.PathLike):
+        return os.fspath(file_input)
+    if isinstance(file_input, (bytearray, memoryview)):
+        return bytes(file_input)
+    if isinstance(file_input, BytesIO):
+        return file_input.getvalue()
+    if not _is_seekable(file_input):
+        # The content is handed over, so there is nothing to rewind
+        return file_input.read()
+    file_input.seek(0)
+    content = file_input.read()
+    file_input.seek(0)
+    return content
+
+def rewindable_input(file_input):
+    """
+    Make sure a resume input can be read more than once
+    
+    The parser reads an input once for its content hash and again to
+    convert it. Streams that cannot seek (pipes, sockets, HTTP bodies) are
+    read into memory once; every other input is returned as it is.
+    
+    Args:
+        file_input: Path to the file, bytes-like object or binary file object
+        
+    Returns:
+        The input itself, or a BytesIO holding the rest of a non-seekable stream
+    """
+    if isinstance(file_input, (str, os.PathLike, bytes, bytearray, memoryview, BytesIO)):
+        return file_input
+    if _is_seekable(file_input):
+        return file_input
+    stream = BytesIO(file_input.read())
+    name = getattr(file_input, 'name', None)
+    if isinstance(name, str):
+        stream.name = name
+    return stream
+
+def _is_seekable(stream):
+    """True if a binary file object can be rewound"""
+    try:
+        return stream.seekable()
+    except (AttributeError, ValueError):
+        return False
+
 def clean_text(text):
     """
     Remove unwanted characters and normalize whitespace
@@ -62,10 +153,12 @@ def extract_contact_info(text):
     if email_match:
         contact_info['email'] = email_match.group(0)
     
-    # Phone number patterns
+    # Phone number patterns, tried in order (with a country code first, so
+    # that the code is not cut off by the shorter US pattern)
     phone_patterns = [
-        r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # US/Canada: 123-456-7890
-        r'\b\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'  # International: +1-123-456-7890
+        r'(?<![\w+])\+\d{1,3}[-.\s]?(?:\d{3}[-.\s]?\d{3}[-.\s]?\d{4}|\d{5}[-.\s]?\d{5})\b',  # International: +1-123-456-7890
+        r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}\b',  # US/Canada: (123) 456-7890
+        r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'  # US/Canada: 123-456-7890
     ]
     for pattern in phone_patterns:
         phone_match = re.search(pattern, text)
@@ -95,4 +188,47 @@ def extract_contact_info(text):
             contact_info['github'] = match.group(0)
             break
     
-    return contact_info
\ No newline at end of file
+    return contact_info
+
+def generate_txt_output(parsed_data):
+    """Return parsed data in text format"""
+    lines = ["=== RESUME PARSING RESULTS ===\n"]
+
+    lines.append("SKILLS:")
+    for skill in parsed_data.get('skills', []):
+        lines.append(f"- {skill}")
+    lines.append("")
+
+    lines.append("EXPERIENCE:")
+    for exp in parsed_data.get('experience', []):
+        lines.append(f"- {exp.get('job_title', 'N/A')} at {exp.get('company', 'N/A')}, {exp.get('dates', 'N/A')}")
+        for resp in exp.get('responsibilities', []):
+            lines.append(f"  • {resp}")
+    lines.append("")
+
+    lines.append("EDUCATION:")
+    for edu in parsed_data.get('education', []):
+        lines.append(f"- {edu.get('degree', 'N/A')} from {edu.get('institution', 'N/A')}, {edu.get('graduation_date', 'N/A')}")
+        if edu.get('gpa'):
+            lines.append(f"  GPA: {edu.get('gpa')}")
+    lines.append("")
+
+    lines.append("CERTIFICATIONS:")
+    for cert in parsed_data.get('certifications', []):
+        line = f"- {cert.get('name', 'N/A')}"
+        if cert.get('authority'):
+            line += f", {cert.get('authority')}"
+        if cert.get('date'):
+            line += f", {cert.get('date')}"
+        lines.append(line)
+    lines.append("")
+
+    lines.append("PROJECTS:")
+    for proj in parsed_data.get('projects', []):
+        lines.append(f"- {proj.get('title', 'N/A')}")
+        lines.append(f"  {proj.get('description', 'N/A')}")
+        if proj.get('technologies'):
+            lines.append(f"  Technologies: {', '.join(proj.get('technologies'))}")
+    lines.append("")
+
+    return "\n".join(lines)
\ No newline at end of file
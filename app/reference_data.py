@@ -0,0 +1,198 @@
+"""
+Reference data - Cached loading of the skill and job title lists
+
+The lists in app/data are read once per process and compiled into keyword
+matchers. The compiled matchers are also pickled to REFERENCE_CACHE_FILE so
+that new processes can start from the ready-made structures. Everything is
+rebuilt automatically when a data file changes.
+"""
+import hashlib
+import json
+import os
+import pickle
+import threading
+from app.config import COMMON_SKILLS_FILE, JOB_TITLES_FILE, REFERENCE_CACHE_FILE
+from app.parser.automaton import KeywordAutomaton
+
+# Bump whenever the structure of the pickled cache changes
+_CACHE_FORMAT = 1
+
+# Used when a data file is missing or unreadable
+BUILTIN_COMMON_SKILLS = [
+    "python", "java", "javascript", "html", "css", "react", "angular", "node.js",
+    "sql", "git", "agile", "scrum", "project management", "leadership",
+    "communication", "aws", "azure", "docker", "kubernetes", "machine learning",
+    "data analysis", "excel", "powerpoint", "word", "tensorflow", "pytorch",
+    "c++", "c#", "php", "ruby", "swift", "kotlin", "typescript", "rust", "golang",
+    "scala", "r", "django", "flask", "spring boot", "laravel", "ruby on rails"
+]
+
+BUILTIN_JOB_TITLES = [
+    "Software Engineer", "Senior Developer", "Frontend Developer", "Backend Developer",
+    "Full Stack Developer", "Data Scientist", "Product Manager", "Project Manager",
+    "UX Designer", "UI Designer", "DevOps Engineer", "QA Engineer", "Test Engineer",
+    "Machine Learning Engineer", "Data Analyst", "Research Scientist", "IT Specialist",
+    "Network Administrator", "Systems Administrator", "Database Administrator",
+    "Business Analyst", "Technical Writer", "Scrum Master", "Agile Coach",
+    "CTO", "CEO", "CIO", "VP of Engineering", "Director of Technology"
+]
+
+class ReferenceData:
+    """
+    Skill and job title lists together with their compiled matchers
+
+    Each access checks the data files' modification time and size (a
+    couple of stat calls); the files are only re-read when those change, and
+    the matchers are only rebuilt when the content hash changes too.
+    """
+
+    def __init__(self, skills_file=COMMON_SKILLS_FILE, job_titles_file=JOB_TITLES_FILE,
+                 cache_file=REFERENCE_CACHE_FILE):
+        """
+        Args:
+            skills_file: JSON list of common skills
+            job_titles_file: JSON list of job titles
+            cache_file: Pickle file for the compiled matchers (None disables it)
+        """
+        self.skills_file = skills_file
+        self.job_titles_file = job_titles_file
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._stamps = None
+        self._state = None
+
+    @property
+    def version(self):
+        """Short hash identifying the current content of the reference data"""
+        return self._current()['version']
+
+    @property
+    def common_skills(self):
+        """List of common skills"""
+        return self._current()['common_skills']
+
+    @property
+    def job_titles(self):
+        """List of job titles"""
+        return self._current()['job_titles']
+
+    @property
+    def skill_automaton(self):
+        """KeywordAutomaton over the common skills (word boundaries enforced)"""
+        return self._current()['skill_automaton']
+
+    @property
+    def job_title_automaton(self):
+        """KeywordAutomaton over the job titles (matched anywhere in the text)"""
+        return self._current()['job_title_automaton']
+
+    def _current(self):
+        """Return the loaded state, reloading it if a data file changed"""
+        stamps = (_file_stamp(self.skills_file), _file_stamp(self.job_titles_file))
+        if self._state is None or stamps != self._stamps:
+            with self._lock:
+                if self._state is None or stamps != self._stamps:
+                    self._state = self._load()
+                    self._stamps = stamps
+        return self._state
+
+    def _load(self):
+        """Read the data files and get compiled matchers from the cache or by building them"""
+        skills, skills_hash = _read_list(self.skills_file, BUILTIN_COMMON_SKILLS)
+        job_titles, job_titles_hash = _read_list(self.job_titles_file, BUILTIN_JOB_TITLES)
+        version = hashlib.sha256(
+            f"{_CACHE_FORMAT}:{skills_hash}:{job_titles_hash}".encode('utf-8')
+        ).hexdigest()[:16]
+
+        # Only the modification time changed - keep what we already have
+        if self._state is not None and self._state['version'] == version:
+            return self._state
+
+        state = self._read_cache(version)
+        if state is None:
+            state = {
+                'format': _CACHE_FORMAT,
+                'version': version,
+                'common_skills': skills,
+                'job_titles': job_titles,
+                'skill_automaton': KeywordAutomaton(skills),
+                'job_title_automaton': KeywordAutomaton(job_titles, word_boundaries=False)
+            }
+            self._write_cache(state)
+        return state
+
+    def _read_cache(self, version):
+        """Load the compiled state from the cache file if it matches the data version"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return None
+        try:
+            with open(self.cache_file, 'rb') as f:
+                state = pickle.load(f)
+            if state.get('format') == _CACHE_FORMAT and state.get('version') == version:
+                return state
+        except Exception as e:
+            print(f"Ignoring unreadable reference data cache {self.cache_file}: {str(e)}")
+        return None
+
+    def _write_cache(self, state):
+        """Persist the compiled state atomically; failures only cost a rebuild next time"""
+        if not self.cache_file:
+            return
+        temp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_file)
+        except Exception as e:
+            print(f"Could not write reference data cache {self.cache_file}: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+# Process-wide store shared by all extractors
+_reference_data = None
+_reference_data_lock = threading.Lock()
+
+def get_reference_data():
+    """
+    Return the process-wide reference data store
+
+    Returns:
+        ReferenceData: Shared store for the configured data files
+    """
+    global _reference_data
+    if _reference_data is None:
+        with _reference_data_lock:
+            if _reference_data is None:
+                _reference_data = ReferenceData()
+    return _reference_data
+
+def _file_stamp(path):
+    """Cheap change marker for a file: (mtime, size), or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _read_list(path, fallback):
+    """
+    Read a JSON list from a data file
+
+    Returns:
+        tuple: (items, content hash), using the fallback list if the file is
+            missing or invalid
+    """
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        items = json.loads(content.decode('utf-8'))
+        if not isinstance(items, list):
+            raise ValueError("expected a JSON list")
+    except FileNotFoundError:
+        print(f"Reference data file {path} not found, using the built-in list")
+        items, content = fallback, json.dumps(fallback).encode('utf-8')
+    except Exception as e:
+        print(f"Error loading reference data file {path}: {str(e)}; using the built-in list")
+        items, content = fallback, json.dumps(fallback).encode('utf-8')
+    return items, hashlib.sha256(content).hexdigest()
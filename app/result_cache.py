@@ -0,0 +1,171 @@
+"""
+Result cache - Content-addressed cache of parse results
+
+Results are stored in a local SQLite database, keyed by the SHA-256 of the
+document bytes together with everything else that affects the result (parser
+version, reference data version and parser settings such as the NLP profile). Least recently used
+entries are evicted once the stored results exceed a size limit. The total
+size is kept in a one-row table that every write updates in the same
+transaction, so the limit is checked without scanning the results, also
+when several processes share the cache.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from app import __version__
+from app.config import RESULT_CACHE_FILE, RESULT_CACHE_MAX_BYTES
+
+class ResultCache:
+    """Size-bounded LRU cache of parse results backed by SQLite"""
+
+    def __init__(self, path=RESULT_CACHE_FILE, max_bytes=RESULT_CACHE_MAX_BYTES):
+        """
+        Open (or create) the cache
+
+        Args:
+            path: SQLite database file (':memory:' for a private in-memory cache)
+            max_bytes: Maximum total size of the stored results
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # The connection is shared by threads; every use holds self._lock
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False,
+                                           isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+            'size INTEGER NOT NULL, accessed REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), '
+            'total INTEGER NOT NULL)'
+        )
+        self._connection.execute('INSERT OR IGNORE INTO cache_size (id, total) VALUES (0, 0)')
+
+    def get(self, key, required=()):
+        """
+        Look up a result
+
+        Args:
+            key: Cache key from make_cache_key
+            required: Keys the result must have; a stored result without
+                all of them counts as a miss (and is not marked as used)
+
+        Returns:
+            dict: The cached result, or None on a miss
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+            result = json.loads(row[0]) if row is not None else None
+            if result is None or any(name not in result for name in required):
+                self.misses += 1
+                return None
+            self._connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), key))
+            self.hits += 1
+        return result
+
+    def set(self, key, result):
+        """
+        Store a result, evicting least recently used entries if needed
+
+        Args:
+            key: Cache key from make_cache_key
+            result: JSON-serialisable parse result
+        """
+        value = json.dumps(result)
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so the running total
+            # cannot be changed by another process in between
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._connection.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)',
+                    (key, value, len(value), time.time())
+                )
+                self._connection.execute('UPDATE cache_size SET total = total + ? WHERE id = 0',
+                                         (len(value) - (row[0] if row else 0),))
+                self._evict()
+                self._connection.execute('COMMIT')
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def _evict(self):
+        """Delete the least recently used entries until the size limit is met"""
+        total_size = self._connection.execute('SELECT total FROM cache_size WHERE id = 0').fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+
+        expired = []
+        freed = 0
+        for key, size in self._connection.execute('SELECT key, size FROM results ORDER BY accessed'):
+            if total_size - freed <= self.max_bytes:
+                break
+            expired.append((key,))
+            freed += size
+        self._connection.executemany('DELETE FROM results WHERE key = ?', expired)
+        self._connection.execute('UPDATE cache_size SET total = total - ? WHERE id = 0', (freed,))
+        self.evictions += len(expired)
+
+    def stats(self):
+        """
+        Return cache statistics
+
+        Returns:
+            dict: hits, misses and evictions counted by this instance, hit rate,
+                and the current number of entries and total size in bytes
+        """
+        with self._lock:
+            entries = self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+            size = self._connection.execute('SELECT total FROM cache_size WHERE id = 0').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'size_bytes': size
+        }
+
+    def clear(self):
+        """Remove every cached result"""
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            self._connection.execute('DELETE FROM results')
+            self._connection.execute('UPDATE cache_size SET total = 0 WHERE id = 0')
+            self._connection.execute('COMMIT')
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+def make_cache_key(content_hash, reference_version, *options):
+    """
+    Build the cache key for a document
+
+    Args:
+        content_hash: SHA-256 of the document bytes
+        reference_version: Version of the skill/job title reference data
+        options: Parser settings that affect the result (NLP profile,
+            page limit, converter backends, ...)
+
+    Returns:
+        str: Cache key
+    """
+    key = ':'.join(str(part) for part in (content_hash, __version__, reference_version) + options)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
@@ -0,0 +1,298 @@
+"""
+HTTP service - Resume parsing over HTTP with a warm model and micro-batching
+
+Endpoints:
+    POST /parse    multipart/form-data upload with one or more files (any
+                   field name), or a raw document body with ?filename=...
+    GET  /health   liveness (profile, uptime, queued documents); the model is
+                   loaded before the server starts listening
+    GET  /metrics  Prometheus metrics of the parsed documents
+
+Each upload is converted and split into sections on its request thread
+(ResumeParser.prepare), so a slow document only holds up its own request.
+The prepared documents are then gathered into micro-batches so that their
+skills sections share one nlp.pipe call on a single batching thread
+(ResumeParser.parse_prepared). --timeout bounds the conversion of each
+document and --isolate makes that bound hold even for a hanging converter.
+
+Usage:
+    python -m app.server --port 8000 --profile parser-only
+"""
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import urlsplit, parse_qs
+from app.config import (NLP_PROFILE, NLP_PROFILES, SERVER_HOST, SERVER_PORT, BATCH_MAX_SIZE,
+                        BATCH_MAX_WAIT, SERVER_MAX_REQUEST_BYTES, DOCUMENT_TIMEOUT, ISOLATE_CONVERSION)
+from app.metrics import MetricsCollector
+from app.parser.resume_parser import ResumeParser
+from app.reference_data import get_reference_data
+from app.result_cache import ResultCache
+
+class MicroBatcher:
+    """
+    Gathers prepared documents submitted from many threads into batches for parse_prepared
+
+    A batch is started as soon as a document arrives and closed when it
+    holds max_batch documents or max_wait seconds have passed, whichever
+    comes first. Batches are finished one at a time on a single background
+    thread that owns the spaCy pipeline. Conversion is not part of it:
+    documents are submitted already prepared (ResumeParser.prepare), so
+    only the shared nlp.pipe call and the extractors run here.
+    """
+
+    def __init__(self, parser, max_batch=BATCH_MAX_SIZE, max_wait=BATCH_MAX_WAIT):
+        """
+        Args:
+            parser: ResumeParser to parse the batches with
+            max_batch: Maximum number of documents per batch
+            max_wait: Maximum seconds the first document of a batch waits for others
+        """
+        self.parser = parser
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, prepared):
+        """
+        Queue a prepared document for parsing
+
+        Args:
+            prepared: Document returned by the parser's prepare method
+
+        Returns:
+            Future: Resolves to the parse result (None if parsing failed)
+        """
+        future = Future()
+        self._queue.put((prepared, future))
+        return future
+
+    def pending(self):
+        """Number of documents waiting for a batch"""
+        return self._queue.qsize()
+
+    def close(self):
+        """Stop the batching thread once the queued documents are done"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)  # Finish this batch, then stop
+                    break
+                batch.append(item)
+            self._parse_batch(batch)
+
+    def _parse_batch(self, batch):
+        """Parse a batch and resolve its futures"""
+        futures = [future for _, future in batch]
+        try:
+            results = self.parser.parse_prepared((prepared for prepared, _ in batch),
+                                                 batch_size=len(batch))
+            for future, result in zip(futures, results):
+                future.set_result(result)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+class ResumeRequestHandler(BaseHTTPRequestHandler):
+    """Request handler; the server holds the batcher and the metrics collector"""
+
+    server_version = 'ResumeParser/1.0'
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/health':
+            self._send_json(200, {
+                'status': 'ok',
+                'profile': self.server.batcher.parser.profile,
+                'uptime_seconds': round(time.monotonic() - self.server.started, 3),
+                'queued': self.server.batcher.pending()
+            })
+        elif path == '/metrics':
+            self._send(200, self.server.metrics.to_prometheus().encode('utf-8'),
+                       'text/plain; version=0.0.4')
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/parse':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            self._send_json(400, {'error': 'Invalid Content-Length header'})
+            return
+        if length <= 0:
+            self._send_json(400, {'error': 'Empty request body'})
+            return
+        if length > self.server.max_request_bytes:
+            self._send_json(413, {'error': f'Request larger than {self.server.max_request_bytes} bytes'})
+            return
+        body = self.rfile.read(length)
+
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/form-data'):
+            uploads = _parse_multipart(content_type, body)
+            if not uploads:
+                self._send_json(400, {'error': 'No files in the upload'})
+                return
+        else:
+            file_name = parse_qs(url.query).get('filename', [None])[0]
+            uploads = [(file_name, body)]
+
+        # Conversion runs here, on the request's own thread
+        batcher = self.server.batcher
+        futures = []
+        for file_name, content in uploads:
+            stream = BytesIO(content)
+            stream.name = file_name
+            futures.append((file_name, batcher.submit(batcher.parser.prepare(stream))))
+
+        results = []
+        for file_name, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                result = None
+                print(f"Error processing resume {file_name}: {str(e)}")
+            results.append(result if result is not None else
+                           {'file_name': file_name, 'error': 'Could not parse the resume'})
+
+        status = 200 if any('error' not in result for result in results) else 422
+        self._send_json(status, results[0] if len(results) == 1 else results)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def _parse_multipart(content_type, body):
+    """
+    Extract the uploaded files from a multipart/form-data body
+
+    Returns:
+        list: (file name, content) for every part that carries a file
+    """
+    message = BytesParser(policy=HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+    )
+    if not message.is_multipart():
+        return []
+    return [
+        (part.get_filename(), part.get_payload(decode=True))
+        for part in message.iter_parts()
+        if part.get_filename() is not None
+    ]
+
+def create_server(host=SERVER_HOST, port=SERVER_PORT, profile=NLP_PROFILE, max_batch=BATCH_MAX_SIZE,
+                  max_wait=BATCH_MAX_WAIT, use_cache=False, quiet=False, timeout=DOCUMENT_TIMEOUT,
+                  isolate_conversion=ISOLATE_CONVERSION):
+    """
+    Build the HTTP server with a warm parser
+
+    The spaCy pipeline and the reference data are loaded before the server
+    is returned, so the first request does not pay for them.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free one)
+        profile: spaCy pipeline profile
+        max_batch: Maximum documents per micro-batch
+        max_wait: Maximum seconds a document waits for its batch to fill
+        use_cache: Reuse results of previously parsed identical files
+        quiet: Do not log every request
+        timeout: Seconds each document's conversion may take before it is
+            returned partially parsed (None for no limit)
+        isolate_conversion: Convert in a subprocess that is killed when the
+            timeout expires, so a hanging converter cannot hold a request thread
+
+    Returns:
+        ThreadingHTTPServer: Call serve_forever() on it; server.batcher.close() stops the batcher
+    """
+    metrics = MetricsCollector()
+    parser = ResumeParser(profile=profile, cache=ResultCache() if use_cache else None,
+                          timeout=timeout, isolate_conversion=isolate_conversion, observers=[metrics])
+    parser.nlp
+    get_reference_data().skill_automaton
+
+    server = ThreadingHTTPServer((host, port), ResumeRequestHandler)
+    server.daemon_threads = True
+    server.batcher = MicroBatcher(parser, max_batch=max_batch, max_wait=max_wait)
+    server.metrics = metrics
+    server.max_request_bytes = SERVER_MAX_REQUEST_BYTES
+    server.quiet = quiet
+    server.started = time.monotonic()
+    return server
+
+def main(argv=None):
+    """Entry point for python -m app.server"""
+    arg_parser = argparse.ArgumentParser(description="Serve the resume parser over HTTP.")
+    arg_parser.add_argument('--host', default=SERVER_HOST, help=f"Interface to listen on (default: {SERVER_HOST})")
+    arg_parser.add_argument('--port', type=int, default=SERVER_PORT, help=f"Port (default: {SERVER_PORT})")
+    arg_parser.add_argument('--profile', '-p', choices=sorted(NLP_PROFILES), default=NLP_PROFILE,
+                            help=f"spaCy pipeline profile (default: {NLP_PROFILE})")
+    arg_parser.add_argument('--max-batch', type=int, default=BATCH_MAX_SIZE,
+                            help=f"Maximum documents per micro-batch (default: {BATCH_MAX_SIZE})")
+    arg_parser.add_argument('--max-wait', type=float, default=BATCH_MAX_WAIT,
+                            help=f"Maximum seconds to wait for a batch to fill (default: {BATCH_MAX_WAIT})")
+    arg_parser.add_argument('--cache', action='store_true',
+                            help="Reuse cached results for files that were parsed before")
+    arg_parser.add_argument('--timeout', type=float, default=DOCUMENT_TIMEOUT,
+                            help="Seconds a document's conversion may take before it is returned "
+                                 "partially parsed (default: no limit)")
+    arg_parser.add_argument('--isolate', action='store_true', default=ISOLATE_CONVERSION,
+                            help="Convert each document in a subprocess that is killed on timeout")
+    arg_parser.add_argument('--quiet', '-q', action='store_true', help="Do not log every request")
+    args = arg_parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, profile=args.profile, max_batch=args.max_batch,
+                           max_wait=args.max_wait, use_cache=args.cache, quiet=args.quiet,
+                           timeout=args.timeout, isolate_conversion=args.isolate)
+    print(f"Serving resume parser on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
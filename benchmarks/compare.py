@@ -0,0 +1,66 @@
+"""
+Benchmark comparison - Show the change between two benchmark result files
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/<before>.json benchmarks/results/<after>.json
+"""
+import argparse
+import json
+import sys
+
+def load_report(path):
+    """Read a result file written by benchmarks.run"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def compare_reports(before, after):
+    """
+    Pair up the timings measured in both reports
+
+    Args:
+        before: Baseline report
+        after: Report to compare against the baseline
+
+    Returns:
+        list: (stage, size, before ms/doc, after ms/doc, change in percent) for
+            every stage and size present in both reports
+    """
+    rows = []
+    for stage, sizes in after['results'].items():
+        for size, timing in sizes.items():
+            baseline = before['results'].get(stage, {}).get(size)
+            if baseline is None:
+                continue
+            old, new = baseline['ms_per_doc'], timing['ms_per_doc']
+            change = (new - old) / old * 100 if old else 0.0
+            rows.append((stage, size, old, new, change))
+    return rows
+
+def main(argv=None):
+    """Entry point for python -m benchmarks.compare"""
+    arg_parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    arg_parser.add_argument('before', help="Baseline result file")
+    arg_parser.add_argument('after', help="Result file to compare with the baseline")
+    arg_parser.add_argument('--threshold', '-t', type=float, default=None,
+                            help="Exit with status 1 if any stage got slower by more than this percentage")
+    args = arg_parser.parse_args(argv)
+
+    before = load_report(args.before)
+    after = load_report(args.after)
+    print(f"before: {before['environment'].get('commit')} ({before['environment'].get('profile')})")
+    print(f"after:  {after['environment'].get('commit')} ({after['environment'].get('profile')})")
+    print(f"{'stage':<24} {'docs':>7} {'before ms/doc':>14} {'after ms/doc':>14} {'change':>9}")
+
+    regressions = []
+    for stage, size, old, new, change in compare_reports(before, after):
+        print(f"{stage:<24} {size:>7} {old:14.3f} {new:14.3f} {change:+8.1f}%")
+        if args.threshold is not None and change > args.threshold:
+            regressions.append(stage)
+
+    if regressions:
+        print(f"Slower than the threshold: {', '.join(sorted(set(regressions)))}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Load generator - Measure the latency of the HTTP parsing service
+
+Uploads sample resumes to a running service (python -m app.server) from
+several concurrent clients and reports throughput and latency percentiles.
+
+Usage:
+    python -m benchmarks.loadgen --url http://127.0.0.1:8000 --concurrency 16 --requests 500
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from itertools import cycle
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+from app.cli import find_resumes
+from benchmarks.run import DEFAULT_CORPUS
+
+def build_upload(file_name, content):
+    """
+    Build a multipart/form-data body with a single file
+
+    Returns:
+        tuple: (body, content type header)
+    """
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{file_name}"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode('utf-8') + content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return body, f'multipart/form-data; boundary={boundary}'
+
+def run_load(url, uploads, concurrency, requests, timeout=60):
+    """
+    Send requests from concurrent clients
+
+    Args:
+        url: Base URL of the service
+        uploads: List of (body, content type) pairs, sent in turn
+        concurrency: Number of concurrent clients
+        requests: Total number of requests
+        timeout: Seconds before a request counts as failed
+
+    Returns:
+        dict: 'latencies' (seconds of successful requests), 'errors' and 'elapsed'
+    """
+    uploads = cycle(uploads)
+    lock = threading.Lock()
+    latencies = []
+    errors = []
+    remaining = [requests]
+
+    def client():
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+                body, content_type = next(uploads)
+            request = Request(f"{url}/parse", data=body, headers={'Content-Type': content_type})
+            start = time.perf_counter()
+            try:
+                with urlopen(request, timeout=timeout) as response:
+                    response.read()
+                latency = time.perf_counter() - start
+                with lock:
+                    latencies.append(latency)
+            except (HTTPError, URLError, OSError) as e:
+                with lock:
+                    errors.append(str(e))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {'latencies': latencies, 'errors': errors, 'elapsed': time.perf_counter() - start}
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers (None if empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(outcome, concurrency):
+    """Throughput and latency percentiles of a load run"""
+    latencies = outcome['latencies']
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies) + len(outcome['errors']),
+        'errors': len(outcome['errors']),
+        'elapsed': outcome['elapsed'],
+        'requests_per_sec': len(latencies) / outcome['elapsed'] if outcome['elapsed'] > 0 else None,
+        'p50_ms': _ms(percentile(latencies, 0.50)),
+        'p90_ms': _ms(percentile(latencies, 0.90)),
+        'p99_ms': _ms(percentile(latencies, 0.99)),
+        'max_ms': _ms(max(latencies) if latencies else None)
+    }
+
+def _ms(seconds):
+    return seconds * 1000 if seconds is not None else None
+
+def main(argv=None):
+    """Entry point for python -m benchmarks.loadgen"""
+    arg_parser = argparse.ArgumentParser(description="Measure latency of the resume parsing service.")
+    arg_parser.add_argument('--url', default='http://127.0.0.1:8000', help="Service base URL")
+    arg_parser.add_argument('--corpus', '-c', default=DEFAULT_CORPUS,
+                            help="Sample resume file, directory or glob pattern (default: tests/test_data)")
+    arg_parser.add_argument('--concurrency', '-n', type=int, default=8, help="Concurrent clients (default: 8)")
+    arg_parser.add_argument('--requests', '-r', type=int, default=200, help="Total requests (default: 200)")
+    arg_parser.add_argument('--output', '-o', default=None, help="Also write the summary to this JSON file")
+    args = arg_parser.parse_args(argv)
+
+    uploads = []
+    for path in find_resumes(args.corpus):
+        with open(path, 'rb') as f:
+            uploads.append(build_upload(os.path.basename(path), f.read()))
+    if not uploads:
+        print(f"No resumes found in {args.corpus}", file=sys.stderr)
+        return 1
+
+    summary = summarize(run_load(args.url, uploads, args.concurrency, args.requests), args.concurrency)
+    print(f"{summary['requests']} requests, {summary['errors']} errors in {summary['elapsed']:.2f}s "
+          f"({summary['requests_per_sec'] or 0:.1f} req/s)")
+    if summary['p50_ms'] is not None:
+        print(f"latency p50 {summary['p50_ms']:.1f} ms  p90 {summary['p90_ms']:.1f} ms  "
+              f"p99 {summary['p99_ms']:.1f} ms  max {summary['max_ms']:.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4)
+    return 1 if summary['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Records benchmark - Memory and serialisation cost of result dicts versus typed records
+
+Parses the sample resumes once, then holds N copies of the results as
+nested dicts (what ResumeParser returns) and as Resume records
+(app.parser.records) and reports the memory per result, measured with
+tracemalloc, and the time to serialise them. Both representations share the
+same strings, so the memory difference is the containers alone.
+
+Usage:
+    python -m benchmarks.records --profile tokenizer-only --count 100000
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from itertools import cycle, islice
+from app.config import NLP_PROFILES
+from app.output import encode_json, json_encoder_name
+from app.parser.records import Resume
+from app.parser.resume_parser import ResumeParser
+from app.cli import find_resumes
+from benchmarks.run import DEFAULT_CORPUS
+
+def copy_containers(value):
+    """Copy the dicts and lists of a result, sharing its strings"""
+    if isinstance(value, dict):
+        return {key: copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_containers(item) for item in value]
+    return value
+
+def measure_memory(build, results):
+    """
+    Build one object per result and measure the memory they hold
+
+    Returns:
+        tuple: (objects, bytes per object)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(result) for result in results]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return objects, used / len(results)
+
+def time_per_item(function, items, repeat=3):
+    """Fastest of several runs, in microseconds per item"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(items) * 1e6
+
+def run(results, count, repeat=3):
+    """
+    Compare dicts and records for a corpus of count results
+
+    Args:
+        results: Parse results to cycle through
+        count: Number of results to hold
+        repeat: Timed runs per measurement, fastest kept
+
+    Returns:
+        dict: Bytes per result and microseconds per result for each operation
+    """
+    corpus = list(islice(cycle(results), count))
+    dicts, dict_bytes = measure_memory(copy_containers, corpus)
+    records, record_bytes = measure_memory(Resume.from_dict, corpus)
+
+    return {
+        'count': count,
+        'encoder': json_encoder_name(),
+        'bytes_per_result': {'dict': dict_bytes, 'record': record_bytes},
+        'us_per_result': {
+            'dict_json_dumps': time_per_item(json.dumps, dicts, repeat),
+            'dict_encode_json': time_per_item(encode_json, dicts, repeat),
+            'record_to_dict': time_per_item(Resume.to_dict, records, repeat),
+            'record_encode_json': time_per_item(encode_json, records, repeat),
+            'record_from_dict': time_per_item(Resume.from_dict, dicts, repeat)
+        }
+    }
+
+def main(argv=None):
+    """Entry point for python -m benchmarks.records"""
+    arg_parser = argparse.ArgumentParser(description="Compare result dicts with typed records.")
+    arg_parser.add_argument('--corpus', '-c', default=DEFAULT_CORPUS,
+                            help="Sample resume file, directory or glob pattern (default: tests/test_data)")
+    arg_parser.add_argument('--count', '-n', type=int, default=100000,
+                            help="Number of results to hold (default: 100000)")
+    arg_parser.add_argument('--profile', '-p', choices=sorted(NLP_PROFILES), default='tokenizer-only',
+                            help="spaCy pipeline profile used to parse the samples (default: tokenizer-only)")
+    arg_parser.add_argument('--repeat', '-r', type=int, default=3,
+                            help="Timed runs per measurement, fastest kept (default: 3)")
+    arg_parser.add_argument('--output', '-o', default=None, help="Also write the report to this JSON file")
+    args = arg_parser.parse_args(argv)
+
+    parser = ResumeParser(profile=args.profile)
+    results = [result for result in parser.parse_many(find_resumes(args.corpus)) if result is not None]
+    if not results:
+        print(f"No resumes could be parsed from {args.corpus}", file=sys.stderr)
+        return 1
+
+    report = run(results, args.count, repeat=args.repeat)
+    memory = report['bytes_per_result']
+    print(f"{report['count']} results, encoder: {report['encoder']}")
+    print(f"memory   dict {memory['dict']:.0f} B/result  record {memory['record']:.0f} B/result "
+          f"({memory['record'] / memory['dict']:.0%})")
+    for name, microseconds in report['us_per_result'].items():
+        print(f"{name:<20} {microseconds:8.2f} us/result")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
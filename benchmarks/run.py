@@ -0,0 +1,182 @@
+"""
+Benchmark runner - Time every stage of the parsing pipeline
+
+Each stage is timed on its own over corpora of 1, 100 and 10k documents
+built by cycling through the sample resumes in tests/test_data, followed by
+end-to-end ResumeParser.parse and parse_many. Results are written as JSON so
+that runs on two commits can be compared with benchmarks/compare.py.
+
+Usage:
+    python -m benchmarks.run --profile tokenizer-only --sizes 1,100
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from itertools import cycle, islice
+from app.config import BASE_DIR, NLP_PROFILE, NLP_PROFILES
+from app.parser.converter import convert_resume_to_text
+from app.parser.preprocessor import preprocess_text
+from app.parser.section_extractor import identify_sections
+from app.parser.extractors.skills import extract_skills
+from app.parser.extractors.experience import extract_experience
+from app.parser.extractors.education import extract_education
+from app.parser.extractors.certification import extract_certifications
+from app.parser.extractors.projects import extract_projects
+from app.parser.nlp import get_nlp
+from app.parser.resume_parser import ResumeParser
+from app.cli import find_resumes
+
+DEFAULT_CORPUS = os.path.join(BASE_DIR, 'tests', 'test_data')
+DEFAULT_SIZES = [1, 100, 10000]
+RESULTS_DIR = os.path.join(BASE_DIR, 'benchmarks', 'results')
+
+def build_stages(profile):
+    """
+    Stages to time, in pipeline order
+
+    Every stage is a pair of (name, function) where the function takes the
+    corpus - a list of per-document dicts with 'path', 'text',
+    'preprocessed' and 'sections' - and processes every document once.
+    """
+    nlp = get_nlp(profile)
+    parser = ResumeParser(profile=profile)
+
+    def section_stage(extract, section):
+        return lambda corpus: [extract(doc['sections'].get(section, '')) for doc in corpus]
+
+    return [
+        ('convert_resume_to_text', lambda corpus: [convert_resume_to_text(doc['path']) for doc in corpus]),
+        ('preprocess_text', lambda corpus: [preprocess_text(doc['text']) for doc in corpus]),
+        ('identify_sections', lambda corpus: [identify_sections(doc['preprocessed']) for doc in corpus]),
+        ('extract_skills', section_stage(lambda text: extract_skills(text, nlp), 'skills')),
+        ('extract_experience', section_stage(extract_experience, 'experience')),
+        ('extract_education', section_stage(extract_education, 'education')),
+        ('extract_certifications', section_stage(extract_certifications, 'certifications')),
+        ('extract_projects', section_stage(extract_projects, 'projects')),
+        ('parse', lambda corpus: [parser.parse(doc['path']) for doc in corpus]),
+        ('parse_many', lambda corpus: list(parser.parse_many(doc['path'] for doc in corpus)))
+    ]
+
+def prepare_samples(paths):
+    """Convert, preprocess and section each sample once, so stages can start from their own input"""
+    samples = []
+    for path in paths:
+        text = convert_resume_to_text(path)
+        preprocessed = preprocess_text(text)
+        samples.append({
+            'path': path,
+            'text': text,
+            'preprocessed': preprocessed,
+            'sections': identify_sections(preprocessed)
+        })
+    return samples
+
+def run_benchmarks(samples, stages, sizes, repeat=1):
+    """
+    Time every stage at every corpus size
+
+    Args:
+        samples: Result of prepare_samples
+        stages: Result of build_stages
+        sizes: Corpus sizes (number of documents)
+        repeat: Timed runs per stage and size (the fastest is kept)
+
+    Returns:
+        dict: stage -> size (as a string) -> 'seconds', 'ms_per_doc' and 'docs_per_sec'
+    """
+    results = {}
+    for name, function in stages:
+        function(samples[:1])  # Warm up lazily loaded data before timing
+        results[name] = {}
+        for size in sizes:
+            corpus = list(islice(cycle(samples), size))
+            seconds = min(_time(function, corpus) for _ in range(repeat))
+            results[name][str(size)] = {
+                'seconds': seconds,
+                'ms_per_doc': seconds * 1000 / size,
+                'docs_per_sec': size / seconds if seconds > 0 else None
+            }
+            print(f"{name:<24} {size:>7} docs  {seconds:9.3f}s  {seconds * 1000 / size:9.3f} ms/doc")
+    return results
+
+def _time(function, corpus):
+    """Wall-clock seconds for one call"""
+    start = time.perf_counter()
+    function(corpus)
+    return time.perf_counter() - start
+
+def environment_info(profile, corpus_paths):
+    """What a result file was measured on"""
+    return {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'profile': profile,
+        'corpus': [os.path.relpath(path, BASE_DIR) for path in corpus_paths]
+    }
+
+def _git_commit():
+    """Current commit hash, marked '-dirty' with uncommitted changes (None outside git)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=BASE_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except Exception:
+        return None
+
+def main(argv=None):
+    """Entry point for python -m benchmarks.run"""
+    arg_parser = argparse.ArgumentParser(description="Time each stage of the resume parsing pipeline.")
+    arg_parser.add_argument('--corpus', '-c', default=DEFAULT_CORPUS,
+                            help="Sample resume file, directory or glob pattern (default: tests/test_data)")
+    arg_parser.add_argument('--sizes', '-s', default=','.join(map(str, DEFAULT_SIZES)),
+                            help="Comma-separated corpus sizes (default: 1,100,10000)")
+    arg_parser.add_argument('--profile', '-p', choices=sorted(NLP_PROFILES), default=NLP_PROFILE,
+                            help=f"spaCy pipeline profile (default: {NLP_PROFILE})")
+    arg_parser.add_argument('--stages', default=None,
+                            help="Comma-separated stage names to run (default: all)")
+    arg_parser.add_argument('--repeat', '-r', type=int, default=1,
+                            help="Timed runs per stage and size, fastest kept (default: 1)")
+    arg_parser.add_argument('--output', '-o', default=None,
+                            help="Result file (default: benchmarks/results/<commit>.json)")
+    args = arg_parser.parse_args(argv)
+
+    paths = list(find_resumes(args.corpus))
+    if not paths:
+        print(f"No resumes found in {args.corpus}", file=sys.stderr)
+        return 1
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    stages = build_stages(args.profile)
+    if args.stages:
+        wanted = set(args.stages.split(','))
+        unknown = wanted - {name for name, _ in stages}
+        if unknown:
+            print(f"Unknown stages: {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 1
+        stages = [(name, function) for name, function in stages if name in wanted]
+
+    report = {
+        'environment': environment_info(args.profile, paths),
+        'sizes': sizes,
+        'results': run_benchmarks(prepare_samples(paths), stages, sizes, repeat=args.repeat)
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['environment']['commit'] or 'results'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,381 @@
+"""
+Synthetic corpus - Deterministic fake resumes with ground truth for scale testing
+
+Resumes are assembled from the vocabulary the parser already knows: the
+section headers in app/config.py, the built-in skill and job title lists and
+the degree and certification keywords the extractors look for. Names,
+companies and institutions are made up, so corpora can be shared freely.
+
+Every document is generated from (seed, index) alone, so a corpus of any
+size is reproducible and can be generated in parallel or in slices. Each
+resume is written as TXT, DOCX or PDF (both built with the standard library
+only) next to a JSON file with the values it was built from.
+
+Usage:
+    python -m tests.synthetic_corpus --output /tmp/corpus --count 1000 --seed 42 --formats txt,docx,pdf
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import zipfile
+from xml.sax.saxutils import escape
+from app.config import SECTION_HEADERS
+from app.reference_data import BUILTIN_COMMON_SKILLS, BUILTIN_JOB_TITLES
+
+FORMATS = ['txt', 'docx', 'pdf']
+
+# Entries per section, as (minimum, maximum)
+SIZES = {
+    'small': {'experience': (1, 2), 'education': (1, 1), 'skills': (4, 8),
+              'certifications': (1, 2), 'projects': (1, 1), 'bullets': (1, 3)},
+    'medium': {'experience': (2, 4), 'education': (1, 2), 'skills': (8, 16),
+               'certifications': (1, 3), 'projects': (1, 3), 'bullets': (2, 5)},
+    'large': {'experience': (6, 12), 'education': (2, 3), 'skills': (16, 30),
+              'certifications': (3, 6), 'projects': (3, 8), 'bullets': (4, 8)}
+}
+
+# Probability of each section appearing in a resume
+DEFAULT_SECTION_MIX = {
+    'experience': 1.0,
+    'education': 1.0,
+    'skills': 1.0,
+    'certifications': 0.6,
+    'projects': 0.6
+}
+
+# Degree and certification vocabulary, matching what the extractors look for
+DEGREES = ['Bachelor of Science', 'Bachelor of Arts', 'Master of Science', 'Master of Arts',
+           'Master of Business Administration', 'Associate of Science', 'PhD in', 'B.S. in',
+           'M.S. in', 'B.Tech in', 'M.Tech in', 'B.E. in', 'M.B.A. in']
+FIELDS_OF_STUDY = ['Computer Science', 'Engineering', 'Business', 'Economics', 'Finance',
+                   'Mathematics', 'Physics', 'Technology']
+CERTIFICATION_PATTERNS = ['Certified {skill} Professional', '{skill} Certified Associate',
+                          'Professional {skill} Specialist', '{skill} Expert Certification',
+                          '{skill} Developer Certificate']
+CERTIFICATION_AUTHORITIES = ['Microsoft', 'AWS', 'Google', 'Oracle', 'Cisco', 'CompTIA', 'PMI',
+                             'Scrum Alliance', 'Salesforce', 'Adobe', 'IBM', 'SAP']
+
+# Made-up names for people, companies, places and projects
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Avery',
+               'Jamie', 'Quinn', 'Robin', 'Drew', 'Kai', 'Noor', 'Ira', 'Sasha']
+LAST_NAMES = ['Rivera', 'Okafor', 'Lindqvist', 'Tanaka', 'Moreau', 'Kowalski', 'Haddad',
+              'Novak', 'Silva', 'Brennan', 'Achebe', 'Varga', 'Nakamura', 'Duarte']
+COMPANY_WORDS = ['Blue', 'North', 'Bright', 'Silver', 'Summit', 'Apex', 'Cedar', 'Harbor',
+                 'Granite', 'Copper', 'Meadow', 'Lumen']
+COMPANY_KINDS = ['Systems', 'Labs', 'Analytics', 'Software', 'Dynamics', 'Networks', 'Data',
+                 'Solutions']
+COMPANY_SUFFIXES = ['Inc.', 'LLC', 'Ltd.', 'Corp.', '']
+PLACES = ['Springfield', 'Riverton', 'Lakeside', 'Fairview', 'Westbrook', 'Ashford', 'Kingsport']
+PROJECT_SUBJECTS = ['Resume Search Engine', 'Inventory Tracker', 'Chat Service', 'Budget Planner',
+                    'Image Classifier', 'Recommendation System', 'Log Analyzer', 'Task Scheduler']
+VERBS = ['Built', 'Designed', 'Maintained', 'Migrated', 'Automated', 'Optimized', 'Led',
+         'Developed', 'Reviewed', 'Tested']
+OBJECTS = ['the billing service', 'internal dashboards', 'the data pipeline', 'a reporting API',
+           'deployment scripts', 'the search backend', 'customer onboarding flows',
+           'monitoring and alerting']
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def generate_resume(seed, index, size='medium', section_mix=None):
+    """
+    Build one synthetic resume
+
+    Args:
+        seed: Corpus seed
+        index: Position of the resume in the corpus
+        size: 'small', 'medium', 'large' or 'mixed' (one of them at random)
+        section_mix: Probability of each section appearing (defaults to DEFAULT_SECTION_MIX)
+
+    Returns:
+        tuple: (blocks, truth) where blocks is a list of paragraphs, each a
+            list of lines, and truth holds the values the resume was built from
+    """
+    rng = random.Random(f"{seed}-{index}")
+    if size == 'mixed':
+        size = rng.choice(sorted(SIZES))
+    counts = SIZES[size]
+    section_mix = DEFAULT_SECTION_MIX if section_mix is None else section_mix
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    contact = {
+        'name': name,
+        'email': f"{name.lower().replace(' ', '.')}{index}@example.com",
+        'phone': f"(555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    }
+    blocks = [[name, f"{contact['email']} | {contact['phone']}"]]
+    truth = {'size': size, 'sections': [], 'contact': contact, 'skills': [], 'experience': [],
+             'education': [], 'certifications': [], 'projects': []}
+
+    sections = [section for section in SECTION_HEADERS if rng.random() < section_mix.get(section, 0)]
+    if rng.random() < 0.3 and 'experience' in sections and 'education' in sections:
+        first, second = sections.index('experience'), sections.index('education')
+        sections[first], sections[second] = sections[second], sections[first]
+
+    for section in sections:
+        header = rng.choice(SECTION_HEADERS[section])
+        blocks.append([header.upper() if rng.random() < 0.5 else header.title()])
+        truth['sections'].append(section)
+        section_blocks = _SECTION_BUILDERS[section](rng, counts, truth[section])
+        blocks.extend(section_blocks)
+
+    return blocks, truth
+
+def _build_skills(rng, counts, truth):
+    """Skills section: known skills listed with commas, one or several lines"""
+    skills = rng.sample(BUILTIN_COMMON_SKILLS, min(rng.randint(*counts['skills']), len(BUILTIN_COMMON_SKILLS)))
+    truth.extend(skills)
+    per_line = rng.choice([4, 6, 8])
+    return [[', '.join(skills[start:start + per_line]) for start in range(0, len(skills), per_line)]]
+
+def _build_experience(rng, counts, truth):
+    """Experience section: title at company, date range and bullets per job"""
+    blocks = []
+    year = 2024
+    for _ in range(rng.randint(*counts['experience'])):
+        title = rng.choice(BUILTIN_JOB_TITLES)
+        company = _company(rng)
+        end = 'present' if not truth else f"{year:04d}-{rng.randint(1, 12):02d}"
+        year -= rng.randint(1, 4)
+        start = f"{year:04d}-{rng.randint(1, 12):02d}"
+        responsibilities = [
+            f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(BUILTIN_COMMON_SKILLS)}"
+            for _ in range(rng.randint(*counts['bullets']))
+        ]
+        truth.append({'job_title': title, 'company': company, 'start_date': start,
+                      'end_date': end, 'responsibilities': responsibilities})
+        blocks.append([f"{title} at {company}", f"{_month_year(start)} - {_month_year(end)}"] +
+                      [f"• {line}" for line in responsibilities])
+        year -= 1
+    return blocks
+
+def _build_education(rng, counts, truth):
+    """Education section: degree, institution and graduation date with GPA"""
+    blocks = []
+    year = 2020
+    for _ in range(rng.randint(*counts['education'])):
+        degree = rng.choice(DEGREES)
+        field = rng.choice(FIELDS_OF_STUDY)
+        degree = f"{degree} {field}" if degree.endswith(' in') else f"{degree} in {field}"
+        place = rng.choice(PLACES)
+        institution = rng.choice([f"University of {place}", f"{place} Institute of Technology",
+                                  f"{place} College"])
+        graduation = f"{year:04d}-{rng.choice([5, 6, 12]):02d}"
+        gpa = f"{rng.randint(28, 40) / 10:.1f}"
+        truth.append({'degree': degree, 'institution': institution,
+                      'graduation_date_iso': graduation, 'gpa': gpa})
+        blocks.append([degree, institution, f"Graduated {_month_year(graduation)}, GPA: {gpa}"])
+        year -= rng.randint(2, 4)
+    return blocks
+
+def _build_certifications(rng, counts, truth):
+    """Certifications section: one certification per line"""
+    lines = []
+    for _ in range(rng.randint(*counts['certifications'])):
+        name = rng.choice(CERTIFICATION_PATTERNS).format(skill=rng.choice(BUILTIN_COMMON_SKILLS).title())
+        authority = rng.choice(CERTIFICATION_AUTHORITIES)
+        date = f"{rng.randint(2015, 2024):04d}-{rng.randint(1, 12):02d}"
+        credential_id = f"{rng.choice('ABCDEFGHJKLMNPQRSTUVWXYZ')}{rng.randint(10000, 99999)}"
+        truth.append({'name': name, 'authority': authority, 'date_iso': date,
+                      'credential_id': credential_id})
+        lines.append(f"{name}, issued by {authority}, {_month_year(date)}, Credential ID: {credential_id}")
+    return [lines]
+
+def _build_projects(rng, counts, truth):
+    """Projects section: title, description and technologies per project"""
+    blocks = []
+    for _ in range(rng.randint(*counts['projects'])):
+        title = rng.choice(PROJECT_SUBJECTS)
+        description = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} for {rng.randint(2, 50)} teams"
+        technologies = rng.sample(BUILTIN_COMMON_SKILLS, rng.randint(2, 4))
+        truth.append({'title': title, 'description': description, 'technologies': technologies})
+        blocks.append([title, description, f"Technologies used: {', '.join(technologies)}"])
+    return blocks
+
+_SECTION_BUILDERS = {
+    'experience': _build_experience,
+    'education': _build_education,
+    'skills': _build_skills,
+    'certifications': _build_certifications,
+    'projects': _build_projects
+}
+
+def _company(rng):
+    """Made-up company name"""
+    suffix = rng.choice(COMPANY_SUFFIXES)
+    name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)}"
+    return f"{name} {suffix}" if suffix else name
+
+def _month_year(value):
+    """'2021-03' -> 'Mar 2021'; 'present' -> 'Present'"""
+    if value == 'present':
+        return 'Present'
+    year, month = value.split('-')
+    return f"{MONTHS[int(month) - 1]} {year}"
+
+def write_txt(path, blocks):
+    """Write blocks as plain text, separated by blank lines"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n\n'.join('\n'.join(lines) for lines in blocks) + '\n')
+
+def write_docx(path, blocks):
+    """Write blocks as a minimal Word document, one paragraph per block"""
+    paragraphs = ''.join(
+        '<w:p><w:r>' + '<w:br/>'.join(
+            f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in lines
+        ) + '</w:r></w:p>'
+        for lines in blocks
+    )
+    parts = {
+        '[Content_Types].xml': (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        ),
+        '_rels/.rels': (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+            '2006/relationships/officeDocument" Target="word/document.xml"/>'
+            '</Relationships>'
+        ),
+        'word/document.xml': (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{paragraphs}</w:body></w:document>'
+        )
+    }
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as docx:
+        for name, content in parts.items():
+            # Fixed timestamps keep the file byte-for-byte reproducible
+            docx.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), content)
+
+def write_pdf(path, blocks, lines_per_page=56):
+    """Write blocks as a simple text PDF (Helvetica 10pt), with blank lines between blocks"""
+    lines = []
+    for lines_in_block in blocks:
+        lines.extend(lines_in_block)
+        lines.append('')
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Page tree, filled in once the page objects are numbered
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+    ]
+    page_numbers = []
+    for page_lines in pages:
+        commands = [b"BT /F1 10 Tf 12 TL 50 800 Td"]
+        for line in page_lines:
+            text = line.encode('cp1252', 'replace')
+            text = text.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+            commands.append(b"(" + text + b") '")
+        commands.append(b"ET")
+        stream = b"\n".join(commands)
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>".encode()
+        )
+        page_numbers.append(len(objects))
+    kids = ' '.join(f"{number} 0 R" for number in page_numbers)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_numbers)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, content in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + content + b"\nendobj\n"
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+
+    with open(path, 'wb') as f:
+        f.write(output)
+
+_WRITERS = {'txt': write_txt, 'docx': write_docx, 'pdf': write_pdf}
+
+def generate_corpus(output_dir, count, seed=0, formats=('txt',), size='medium', section_mix=None,
+                    start=0, shard_size=1000):
+    """
+    Write a synthetic corpus with ground truth
+
+    Document i is written as <shard>/resume_<i>.<format>, with its ground
+    truth in <shard>/resume_<i>.json; the format cycles through formats.
+
+    Args:
+        output_dir: Directory to write into
+        count: Number of resumes
+        seed: Corpus seed; the same seed always gives the same corpus
+        formats: File formats to cycle through ('txt', 'docx', 'pdf')
+        size: 'small', 'medium', 'large' or 'mixed'
+        section_mix: Probability of each section appearing (defaults to DEFAULT_SECTION_MIX)
+        start: Index of the first resume (to generate a corpus in slices)
+        shard_size: Resumes per subdirectory
+
+    Returns:
+        list: Paths of the written resumes
+    """
+    paths = []
+    for index in range(start, start + count):
+        file_format = formats[index % len(formats)]
+        blocks, truth = generate_resume(seed, index, size=size, section_mix=section_mix)
+
+        shard_dir = os.path.join(output_dir, f"{index // shard_size:04d}")
+        os.makedirs(shard_dir, exist_ok=True)
+        stem = os.path.join(shard_dir, f"resume_{index:07d}")
+        _WRITERS[file_format](f"{stem}.{file_format}", blocks)
+
+        truth = {'file_name': os.path.basename(f"{stem}.{file_format}"), 'seed': seed, 'index': index, **truth}
+        with open(f"{stem}.json", 'w', encoding='utf-8') as f:
+            json.dump(truth, f, indent=4)
+        paths.append(f"{stem}.{file_format}")
+    return paths
+
+def _parse_section_mix(value):
+    """'experience=1,projects=0.5' -> {'experience': 1.0, 'projects': 0.5}"""
+    section_mix = {}
+    for item in value.split(','):
+        section, _, probability = item.partition('=')
+        if section not in SECTION_HEADERS:
+            raise argparse.ArgumentTypeError(f"Unknown section '{section}'")
+        section_mix[section] = float(probability) if probability else 1.0
+    return section_mix
+
+def main(argv=None):
+    """Entry point for python -m tests.synthetic_corpus"""
+    arg_parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus with ground truth.")
+    arg_parser.add_argument('--output', '-o', required=True, help="Directory to write the corpus into")
+    arg_parser.add_argument('--count', '-n', type=int, default=100, help="Number of resumes (default: 100)")
+    arg_parser.add_argument('--seed', '-s', type=int, default=0, help="Corpus seed (default: 0)")
+    arg_parser.add_argument('--start', type=int, default=0,
+                            help="Index of the first resume, to generate a corpus in slices (default: 0)")
+    arg_parser.add_argument('--formats', '-f', default='txt,docx,pdf',
+                            help="Comma-separated formats to cycle through (default: txt,docx,pdf)")
+    arg_parser.add_argument('--size', choices=sorted(SIZES) + ['mixed'], default='medium',
+                            help="Resume size (default: medium)")
+    arg_parser.add_argument('--sections', type=_parse_section_mix, default=None,
+                            help="Sections and their probability, e.g. 'experience,skills,projects=0.5' "
+                                 "(default: all sections, certifications and projects 60%%)")
+    args = arg_parser.parse_args(argv)
+
+    formats = args.formats.split(',')
+    unknown = [file_format for file_format in formats if file_format not in _WRITERS]
+    if unknown:
+        print(f"Unknown formats: {', '.join(unknown)}", file=sys.stderr)
+        return 1
+
+    paths = generate_corpus(args.output, args.count, seed=args.seed, formats=formats, size=args.size,
+                            section_mix=args.sections, start=args.start)
+    print(f"Wrote {len(paths)} resumes to {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
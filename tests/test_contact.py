@@ -0,0 +1,40 @@
+"""
+Contact tests - Name, email and phone from the top of a resume
+"""
+import pytest
+from app.parser.extractors.contact import extract_contact
+from app.parser.resume_parser import ResumeParser
+
+def test_empty_header():
+    assert extract_contact('') == {'name': None, 'email': None, 'phone': None}
+
+def test_name_email_and_phone():
+    header = "Jane Doe\njane.doe@example.com | (555) 123-4567\nBerlin, Germany"
+    assert extract_contact(header) == {'name': 'Jane Doe', 'email': 'jane.doe@example.com',
+                                       'phone': '(555) 123-4567'}
+
+@pytest.mark.parametrize('text, phone', [
+    ("Phone +91 8002157955 | mail", '+91 8002157955'),
+    ("+1-123-456-7890", '+1-123-456-7890'),
+    ("+91 98765 43210", '+91 98765 43210'),
+    ("call 123.456.7890", '123.456.7890'),
+])
+def test_phone_formats(text, phone):
+    assert extract_contact(text)['phone'] == phone
+
+@pytest.mark.parametrize('text', [
+    "ID 20192021",
+    "2019 - 2021 12345678",
+    "Student number 123456",
+])
+def test_numbers_that_are_not_phones(text):
+    assert extract_contact(text)['phone'] is None
+
+def test_name_is_the_first_line_that_is_only_a_name():
+    header = "Curriculum vitae of someone\nJohn A. Smith-Jones\nMary Major"
+    assert extract_contact(header)['name'] == 'John A. Smith-Jones'
+
+def test_contact_comes_from_the_lines_before_the_first_section():
+    text = b"Jane Doe\njane@example.com\n\nEXPERIENCE\nEngineer at Acme, call 555-123-4567\n"
+    result = ResumeParser(profile='tokenizer-only').parse(text, fields=['contact'])
+    assert result['contact'] == {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': None}
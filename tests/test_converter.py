@@ -0,0 +1,64 @@
+"""
+Converter tests - Format detection and in-memory inputs
+"""
+import io
+import os
+import zipfile
+import pytest
+from app.parser.converter import convert_resume_to_text, _detect_stream_extension
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'test_data')
+PDF_PATH = os.path.join(DATA_DIR, 'sample_resume_1.pdf')
+DOCX_PATH = os.path.join(DATA_DIR, 'sample_resume_2.docx')
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def zip_bytes(names):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name in names:
+            archive.writestr(name, '<xml/>')
+    return buffer.getvalue()
+
+def test_pdf_and_docx_are_detected_from_their_signature():
+    assert _detect_stream_extension(io.BytesIO(read_bytes(PDF_PATH))) == '.pdf'
+    assert _detect_stream_extension(io.BytesIO(read_bytes(DOCX_PATH))) == '.docx'
+
+def test_signature_wins_over_a_misleading_name():
+    stream = io.BytesIO(read_bytes(PDF_PATH))
+    stream.name = 'resume.docx'
+    assert _detect_stream_extension(stream) == '.pdf'
+    assert stream.tell() == 0
+
+def test_zip_that_is_not_a_word_document_is_rejected():
+    with pytest.raises(ValueError, match="not a Word document"):
+        convert_resume_to_text(zip_bytes(['data.csv']))
+
+def test_unknown_binary_signature_is_rejected():
+    with pytest.raises(ValueError, match="Cannot detect file format"):
+        convert_resume_to_text(b'\x7fELF\x00\x01\x02\x03 binary')
+
+def test_unknown_extension_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        convert_resume_to_text('resume.odt')
+
+def test_unsupported_input_type_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported input type"):
+        convert_resume_to_text(42)
+
+def test_plain_text_without_a_signature():
+    assert convert_resume_to_text(b'Jane Doe\nSKILLS\nPython').strip() == 'Jane Doe\nSKILLS\nPython'
+
+@pytest.mark.parametrize('path', [PDF_PATH, DOCX_PATH])
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview, io.BytesIO])
+def test_in_memory_inputs_match_the_file(path, wrap):
+    expected = convert_resume_to_text(path)
+    assert expected.strip()
+    assert convert_resume_to_text(wrap(read_bytes(path))) == expected
+
+def test_stream_is_read_from_the_start():
+    stream = io.BytesIO(read_bytes(DOCX_PATH))
+    stream.seek(100)
+    assert convert_resume_to_text(stream) == convert_resume_to_text(DOCX_PATH)
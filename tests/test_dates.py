@@ -0,0 +1,44 @@
+"""
+Date scanner tests - Dates, ranges and two-digit years
+"""
+from datetime import date
+from app.parser.dates import scan_dates, scan_date_tokens, expand_short_year
+
+def test_scan_dates_ranges():
+    dates = scan_dates("Engineer, June 2018 to Dec 2020; Analyst 03/2017 – 11/2019; BSc 2015 - 2019")
+    assert [(d['start_date'], d['end_date'], d['is_range']) for d in dates] == [
+        ('2018-06', '2020-12', True),
+        ('2017-03', '2019-11', True),
+        ('2015', '2019', True)
+    ]
+    assert dates[0]['text'] == 'June 2018 to Dec 2020'
+
+def test_scan_dates_present_only_ends_a_range():
+    assert [(d['start_date'], d['end_date']) for d in scan_dates("Jan 2019 - Present")] == [('2019-01', 'present')]
+    assert scan_dates("Present") == []
+
+def test_scan_dates_separate_years_are_not_a_range():
+    dates = scan_dates("2010 2012")
+    assert [(d['start_date'], d['is_range']) for d in dates] == [('2010', False), ('2012', False)]
+
+def test_scan_dates_short_years():
+    dates = scan_dates("Sep '98 - Jun '02")
+    assert (dates[0]['start_date'], dates[0]['end_date']) == ('1998-09', '2002-06')
+
+def test_short_year_cue():
+    token = scan_date_tokens("Expected May '27")[0]
+    assert token['cue'] == 'expected'
+    assert token['value'] == f"{expand_short_year(27)}-05"
+
+def test_expand_short_year_window():
+    today = date(2026, 10, 17)
+    assert expand_short_year(26, today) == 2026
+    assert expand_short_year(27, today) == 2027  # e.g. an expected graduation
+    assert expand_short_year(36, today) == 2036
+    assert expand_short_year(37, today) == 1937
+    assert expand_short_year(0, today) == 2000
+    assert expand_short_year(98, today) == 1998
+
+def test_expand_short_year_across_a_century():
+    assert expand_short_year(3, date(2095, 1, 1)) == 2103
+    assert expand_short_year(99, date(2095, 1, 1)) == 2099
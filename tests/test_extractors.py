@@ -0,0 +1,55 @@
+"""
+Extractor tests - Keyword automaton and skill matching
+"""
+import json
+import random
+import re
+from app.parser.automaton import KeywordAutomaton
+from app.parser.extractors.skills import find_skills
+from app.config import COMMON_SKILLS_FILE
+
+def regex_matches(keywords, text):
+    """Every (start, end, keyword) a case-insensitive \\b<keyword>\\b regex finds, overlaps included"""
+    matches = set()
+    for keyword in keywords:
+        pattern = re.compile(r'(?=(\b' + re.escape(keyword) + r'\b))', re.IGNORECASE)
+        matches.update((match.start(1), match.end(1), keyword) for match in pattern.finditer(text))
+    return matches
+
+def regex_longest(keywords, text):
+    """Leftmost match of a longest-first regex alternation, as (start, end) or None"""
+    alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    match = re.search(r'\b(?:' + alternation + r')\b', text, re.IGNORECASE)
+    return match.span() if match else None
+
+def test_find_all_matches_regex_on_random_inputs():
+    rng = random.Random(5)
+    alphabet = 'abAB +.#-'
+    for _ in range(300):
+        keywords = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)]
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        automaton = KeywordAutomaton(keywords)
+        assert set(automaton.find_all(text)) == regex_matches(automaton.keywords, text), (keywords, text)
+
+def test_find_longest_matches_regex_on_random_inputs():
+    rng = random.Random(6)
+    alphabet = 'abc d-'
+    for _ in range(300):
+        keywords = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(6)]
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        automaton = KeywordAutomaton(keywords)
+        best = automaton.find_longest(text)
+        assert (best[:2] if best else None) == regex_longest(automaton.keywords, text), (keywords, text)
+
+def test_find_all_word_boundaries_and_case():
+    automaton = KeywordAutomaton(['java', 'javascript', 'c++', 'c', 'machine learning'])
+    found = {keyword for _, _, keyword in automaton.find_all("JavaScript, C++ and Machine  Learning; javas")}
+    # 'javas' is not 'java' on a word boundary; \b after '+' needs a word character
+    assert found == {'javascript', 'c'}
+
+def test_find_skills_matches_old_regex_scan():
+    text = "Python, JavaScript (React, Node.js), SQL, machine learning and C++ / C# on AWS"
+    with open(COMMON_SKILLS_FILE, 'r', encoding='utf-8') as f:
+        skills = json.load(f)
+    expected = {skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text.lower())}
+    assert {skill for _, _, skill in find_skills(text)} == expected
@@ -0,0 +1,51 @@
+"""
+Import-time budget - Importing the parser must stay cheap
+
+Runs `python -X importtime` in a fresh interpreter and checks that the heavy
+dependencies (spaCy, the PDF and DOCX libraries) are not imported until a
+document actually needs them, and that the import stays within a time
+budget. Every CLI call and every worker process pays this cost.
+"""
+import os
+import subprocess
+import sys
+
+# Modules that must only be imported on first use
+HEAVY_MODULES = ('spacy', 'thinc', 'numpy', 'pdfminer', 'PyPDF2', 'docx', 'docx2txt')
+
+# Cumulative import time allowed for each entry point, in seconds
+IMPORT_TIME_BUDGET = 0.5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(module):
+    """
+    Import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        dict: Imported module name -> cumulative import time in seconds
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+def check_entry_point(module):
+    times = import_times(module)
+    heavy = sorted(name for name in times if name.split('.')[0] in HEAVY_MODULES)
+    assert not heavy, f"Importing {module} pulls in {', '.join(heavy)}"
+    assert times[module] < IMPORT_TIME_BUDGET, \
+        f"Importing {module} took {times[module]:.3f}s (budget {IMPORT_TIME_BUDGET}s)"
+
+def test_resume_parser_import():
+    check_entry_point('app.parser.resume_parser')
+
+def test_cli_import():
+    check_entry_point('app.cli')
@@ -0,0 +1,82 @@
+"""
+Limits tests - Page, character, size and time budgets
+"""
+import time
+import pytest
+from app.parser import limits
+from app.parser.limits import DocumentBudget, convert_isolated, limit_pages
+from app.parser.resume_parser import ResumeParser
+from tests.synthetic_corpus import generate_resume, write_pdf, write_txt
+
+@pytest.fixture(scope='module')
+def long_pdf(tmp_path_factory):
+    """A synthetic resume spread over several PDF pages"""
+    blocks, _ = generate_resume(7, 0, size='large')
+    path = tmp_path_factory.mktemp('limits') / 'resume.pdf'
+    write_pdf(str(path), blocks, lines_per_page=10)
+    return str(path)
+
+def _hang_in_child(connection, source, max_pages):
+    """Stand-in for the conversion process body that never answers"""
+    time.sleep(30)
+
+def test_limit_pages_stops_after_max_pages():
+    budget = DocumentBudget()
+    assert list(limit_pages(iter(['a', 'b', 'c']), budget, max_pages=2)) == ['a', 'b']
+    assert budget.exceeded == {'limit': 'max_pages', 'stage': 'conversion', 'value': None, 'max': 2}
+
+def test_limit_pages_with_exactly_max_pages_is_not_exceeded():
+    budget = DocumentBudget()
+    assert list(limit_pages(iter(['a', 'b']), budget, max_pages=2)) == ['a', 'b']
+    assert budget.exceeded is None
+
+def test_limit_pages_cuts_the_page_that_reaches_max_chars():
+    budget = DocumentBudget()
+    assert list(limit_pages(iter(['abc', 'def', 'ghi']), budget, max_chars=4)) == ['abc', 'd']
+    assert budget.exceeded['limit'] == 'max_chars'
+
+def test_limit_pages_stops_at_the_deadline_keeping_the_page():
+    budget = DocumentBudget(timeout=0.01)
+    time.sleep(0.02)
+    assert list(limit_pages(iter(['a', 'b']), budget)) == ['a']
+    assert budget.exceeded['limit'] == 'timeout'
+    assert budget.exceeded['stage'] == 'conversion'
+
+def test_only_the_first_limit_is_recorded():
+    budget = DocumentBudget()
+    budget.exceed('max_pages', 'conversion', None, 1)
+    budget.exceed('max_chars', 'conversion', None, 10)
+    assert budget.exceeded['limit'] == 'max_pages'
+
+def test_parser_reports_max_pages(long_pdf):
+    result = ResumeParser(profile='tokenizer-only', max_pages=1).parse(long_pdf)
+    assert result['limit_exceeded']['limit'] == 'max_pages'
+    assert 'limit_exceeded' not in ResumeParser(profile='tokenizer-only').parse(long_pdf)
+
+def test_parser_reports_max_chars(long_pdf):
+    result = ResumeParser(profile='tokenizer-only', max_chars=50).parse(long_pdf)
+    assert result['limit_exceeded'] == {'limit': 'max_chars', 'stage': 'conversion', 'value': None, 'max': 50}
+
+def test_parser_skips_inputs_over_max_bytes(tmp_path):
+    path = tmp_path / 'resume.txt'
+    write_txt(str(path), [['Jane Doe'], ['SKILLS'], ['Python, SQL']])
+    result = ResumeParser(profile='tokenizer-only', max_bytes=10).parse(str(path))
+    assert result['limit_exceeded']['limit'] == 'max_bytes'
+    assert result['limit_exceeded']['stage'] == 'input'
+    assert result['skills'] == []
+
+def test_isolated_conversion_matches_in_process(long_pdf):
+    isolated = ResumeParser(profile='tokenizer-only', isolate_conversion=True).parse(long_pdf)
+    assert isolated == ResumeParser(profile='tokenizer-only').parse(long_pdf)
+
+def test_isolated_conversion_is_killed_at_the_deadline(long_pdf, monkeypatch):
+    monkeypatch.setattr(limits, '_convert_in_child', _hang_in_child)
+    budget = DocumentBudget(timeout=0.5)
+    started = time.monotonic()
+    assert convert_isolated(long_pdf, budget) == []
+    assert time.monotonic() - started < 5
+    assert budget.exceeded['limit'] == 'timeout'
+
+def test_isolated_conversion_errors_are_raised(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        convert_isolated(str(tmp_path / 'resume.odt'), DocumentBudget(timeout=10))
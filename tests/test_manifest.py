@@ -0,0 +1,64 @@
+"""
+Manifest tests - Skipping and retry counting of resumable batch runs
+"""
+from app.cli import run_batch
+from app.manifest import BatchManifest, DONE, FAILED
+from app.parser.utils import compute_content_hash
+
+def test_completed_documents_are_skipped(tmp_path):
+    with BatchManifest(str(tmp_path / 'run.manifest')) as manifest:
+        assert manifest.should_process('a.pdf', 'hash-1')
+        manifest.record('a.pdf', 'hash-1')
+        assert not manifest.should_process('a.pdf', 'hash-1')
+        # Changed content is parsed again
+        assert manifest.should_process('a.pdf', 'hash-2')
+
+def test_failed_documents_are_retried_up_to_the_limit(tmp_path):
+    with BatchManifest(str(tmp_path / 'run.manifest'), max_retries=2) as manifest:
+        for attempt in range(3):
+            assert manifest.should_process('a.pdf', 'hash-1'), attempt
+            manifest.record('a.pdf', 'hash-1', error="broken")
+        assert not manifest.should_process('a.pdf', 'hash-1')
+        assert manifest.summary() == {FAILED: 1}
+
+def test_attempts_restart_when_content_changes(tmp_path):
+    with BatchManifest(str(tmp_path / 'run.manifest'), max_retries=0) as manifest:
+        manifest.record('a.pdf', 'hash-1', error="broken")
+        assert not manifest.should_process('a.pdf', 'hash-1')
+        manifest.record('a.pdf', 'hash-2', error="broken")
+        assert not manifest.should_process('a.pdf', 'hash-2')
+        assert manifest.should_process('a.pdf', 'hash-3')
+
+def test_relative_and_absolute_paths_match(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with BatchManifest('run.manifest') as manifest:
+        manifest.record('a.pdf', 'hash-1')
+        assert not manifest.should_process(str(tmp_path / 'a.pdf'), 'hash-1')
+
+def test_records_survive_only_from_checkpoints(tmp_path):
+    path = str(tmp_path / 'run.manifest')
+    manifest = BatchManifest(path, checkpoint_interval=3600)
+    manifest.record('a.pdf', 'hash-1')
+    manifest.checkpoint()
+    manifest.record('b.pdf', 'hash-1')
+
+    # Another reader (e.g. the next run after a crash) only sees the checkpoint
+    reader = BatchManifest(path)
+    assert not reader.should_process('a.pdf', 'hash-1')
+    assert reader.should_process('b.pdf', 'hash-1')
+    reader.close()
+
+    manifest.close()
+    with BatchManifest(path) as reopened:
+        assert reopened.summary() == {DONE: 2}
+
+def test_batch_records_the_real_error_without_observers(tmp_path):
+    broken = tmp_path / 'broken.pdf'
+    broken.write_bytes(b'not a pdf at all')
+    with BatchManifest(str(tmp_path / 'run.manifest')) as manifest:
+        summary = run_batch([str(broken)], str(tmp_path / 'out'), workers=1, profile='tokenizer-only',
+                            manifest=manifest)
+        [(path, error)] = summary['failures']
+        assert path == str(broken)
+        assert error and error != "parsing failed"
+        assert manifest.should_process(str(broken), compute_content_hash(str(broken)))
@@ -0,0 +1,51 @@
+"""
+Output tests - JSON Lines sink round trips
+"""
+import pytest
+from app.output import JsonlSink, encode_json, read_jsonl
+from app.parser.records import Resume
+
+DOCUMENTS = [
+    {'file_name': 'a.pdf', 'skills': ['python', 'c++'], 'contact': {'name': 'Zoë Ødegård', 'phone': None}},
+    {'file_name': 'b.docx', 'skills': [], 'experience': [{'job_title': 'Engineer', 'responsibilities': []}]},
+    {'file_name': 'c.txt', 'limit_exceeded': {'limit': 'timeout', 'stage': 'conversion', 'value': 1.5, 'max': 1}}
+]
+
+EXTENSIONS = ['.jsonl', '.jsonl.gz', '.jsonl.zst']
+
+def zstd_available(extension):
+    if extension.endswith('.zst'):
+        pytest.importorskip('zstandard')
+
+@pytest.mark.parametrize('extension', EXTENSIONS)
+def test_round_trip(tmp_path, extension):
+    zstd_available(extension)
+    path = str(tmp_path / f'results{extension}')
+    with JsonlSink(path) as sink:
+        for document in DOCUMENTS:
+            sink.write(document)
+    assert sink.count == len(DOCUMENTS)
+    assert list(read_jsonl(path)) == DOCUMENTS
+
+@pytest.mark.parametrize('extension', EXTENSIONS)
+def test_appending_runs_are_read_back_in_order(tmp_path, extension):
+    zstd_available(extension)
+    path = str(tmp_path / f'results{extension}')
+    with JsonlSink(path) as sink:
+        sink.write(DOCUMENTS[0])
+    with JsonlSink(path, append=True) as sink:
+        for document in DOCUMENTS[1:]:
+            sink.write(document)
+    assert list(read_jsonl(path)) == DOCUMENTS
+
+def test_records_are_written_as_their_dicts(tmp_path):
+    path = str(tmp_path / 'results.jsonl')
+    result = {'file_name': 'a.pdf', 'skills': ['python'], 'contact': {'name': 'Jane', 'email': None, 'phone': None}}
+    with JsonlSink(path) as sink:
+        sink.write(Resume.from_dict(result))
+    assert list(read_jsonl(path)) == [result]
+    assert encode_json(Resume.from_dict(result)) == encode_json(result)
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown compression"):
+        JsonlSink(str(tmp_path / 'results.jsonl'), compression='brotli')
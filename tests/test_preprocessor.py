@@ -0,0 +1,33 @@
+"""
+Preprocessor tests - Line-oriented normalisation of resume text
+"""
+from app.parser.preprocessor import preprocess_text
+
+def test_empty_text():
+    assert preprocess_text("") == ""
+    assert preprocess_text(None) == ""
+
+def test_whitespace_is_folded_and_blank_runs_collapsed():
+    assert preprocess_text("  a   b \n\n\n c\t d") == "a b\n\nc d"
+    assert preprocess_text("\n \na\n \t \nb\n\n") == "a\n\nb"
+
+def test_windows_line_endings():
+    assert preprocess_text("line one\r\nline two\r\n") == "line one\nline two"
+
+def test_bullets_start_new_lines():
+    assert preprocess_text("Python • Java ◦ Go") == "Python\n• Java\n◦ Go"
+
+def test_header_alias_on_its_own_line():
+    assert preprocess_text("Work Experience\nAcme") == "EXPERIENCE\nAcme"
+    assert preprocess_text("Technical Skills:") == "SKILLS:"
+
+def test_header_alias_followed_by_colon():
+    assert preprocess_text("work experience: 5 years") == "EXPERIENCE: 5 years"
+    assert preprocess_text("Work Experience : x") == "EXPERIENCE : x"
+
+def test_sentences_starting_with_an_alias_are_left_alone():
+    assert preprocess_text("Expertise in Python") == "Expertise in Python"
+    assert preprocess_text("Core Competencies\tPython") == "Core Competencies Python"
+
+def test_canonical_headers_are_not_rewritten():
+    assert preprocess_text("Experience") == "Experience"
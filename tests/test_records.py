@@ -0,0 +1,32 @@
+"""
+Records tests - Round trips between parse results and typed records
+"""
+import json
+from app.output import encode_json
+from app.parser.records import Resume
+from app.parser.resume_parser import ResumeParser, FIELDS
+from tests.synthetic_corpus import generate_resume
+
+def parse_synthetic(fields=None):
+    blocks, _ = generate_resume(11, 0)
+    text = '\n\n'.join('\n'.join(lines) for lines in blocks).encode('utf-8')
+    return ResumeParser(profile='tokenizer-only').parse(text, fields=fields)
+
+def test_full_result_round_trips():
+    result = parse_synthetic(FIELDS)
+    assert result['experience'] and result['contact']
+    assert Resume.from_dict(result).to_dict() == result
+
+def test_jsonl_line_with_path_round_trips():
+    # What the CLI writes to --jsonl: the result with the input path in front
+    line = json.loads(encode_json({'path': 'in/cv.pdf', **parse_synthetic()}))
+    resume = Resume.from_dict(line)
+    assert resume.path == 'in/cv.pdf'
+    assert resume.to_dict() == line
+    assert list(resume.to_dict())[:2] == ['path', 'file_name']
+    assert Resume.from_dict(resume.to_dict()) == resume
+
+def test_missing_fields_stay_missing():
+    result = {'file_name': 'cv.pdf', 'education': [],
+              'limit_exceeded': {'limit': 'timeout', 'stage': 'conversion', 'value': 2.0, 'max': 1}}
+    assert Resume.from_dict(result).to_dict() == result
@@ -0,0 +1,62 @@
+"""
+Result cache tests - LRU eviction, running size total and partial results
+"""
+import itertools
+import json
+import pytest
+from app import result_cache
+from app.result_cache import ResultCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Give every write and lookup its own, increasing access time"""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(result_cache.time, 'time', lambda: float(next(ticks)))
+
+def size_of(result):
+    return len(json.dumps(result))
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    entry = {'skills': ['x' * 40]}
+    cache = ResultCache(str(tmp_path / 'cache.db'), max_bytes=3 * size_of(entry))
+    for key in ('a', 'b', 'c'):
+        cache.set(key, entry)
+    assert cache.get('a') == entry  # 'b' is now the least recently used
+    cache.set('d', entry)
+
+    assert cache.get('b') is None
+    assert all(cache.get(key) == entry for key in ('a', 'c', 'd'))
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['entries'] == 3
+
+def test_running_total_follows_writes_replacements_and_evictions(tmp_path, clock):
+    small, large = {'skills': ['a']}, {'skills': ['b' * 100]}
+    cache = ResultCache(str(tmp_path / 'cache.db'), max_bytes=size_of(large) + size_of(small))
+    cache.set('one', small)
+    cache.set('two', small)
+    assert cache.stats()['size_bytes'] == 2 * size_of(small)
+
+    cache.set('two', large)  # Replacing counts the difference only
+    assert cache.stats()['size_bytes'] == size_of(small) + size_of(large)
+
+    cache.set('three', small)  # Over the limit: 'one' goes
+    assert cache.get('one') is None
+    assert cache.stats()['size_bytes'] == size_of(large) + size_of(small)
+
+    cache.clear()
+    assert cache.stats()['size_bytes'] == 0
+
+def test_running_total_is_shared_between_connections(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    first, second = ResultCache(path), ResultCache(path)
+    first.set('a', {'skills': []})
+    second.set('b', {'skills': ['python']})
+    assert first.stats()['size_bytes'] == size_of({'skills': []}) + size_of({'skills': ['python']})
+
+def test_result_missing_required_keys_is_a_miss(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+    cache.set('partial', {'file_name': 'cv.pdf', 'skills': ['python']})
+
+    assert cache.get('partial', required=('skills', 'experience')) is None
+    assert cache.get('partial', required=('skills',)) == {'file_name': 'cv.pdf', 'skills': ['python']}
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,74 @@
+"""
+Resume parser tests - Field selection and lazily extracted results
+"""
+import pytest
+from app.parser import resume_parser
+from app.parser.resume_parser import ResumeParser, DEFAULT_FIELDS
+from tests.synthetic_corpus import generate_resume
+
+@pytest.fixture(scope='module')
+def resume():
+    blocks, _ = generate_resume(3, 0)
+    return '\n\n'.join('\n'.join(lines) for lines in blocks).encode('utf-8')
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record which extractors run"""
+    calls = []
+
+    def recording(name, extractor):
+        def extract(*args, **kwargs):
+            calls.append(name)
+            return extractor(*args, **kwargs)
+        return extract
+
+    extractors = {name: recording(name, extractor)
+                  for name, extractor in resume_parser._SECTION_EXTRACTORS.items()}
+    monkeypatch.setattr(resume_parser, '_SECTION_EXTRACTORS', extractors)
+    monkeypatch.setattr(resume_parser, 'extract_skills', recording('skills', resume_parser.extract_skills))
+    monkeypatch.setattr(resume_parser, 'extract_contact', recording('contact', resume_parser.extract_contact))
+    return calls
+
+def test_subset_returns_only_the_requested_fields(resume, calls):
+    result = ResumeParser(profile='tokenizer-only').parse(resume, fields=['education', 'contact'])
+    assert list(result) == ['file_name', 'education', 'contact']
+    assert sorted(calls) == ['contact', 'education']
+
+def test_fields_are_returned_in_output_order(resume):
+    result = ResumeParser(profile='tokenizer-only').parse(resume, fields=['projects', 'skills'])
+    assert list(result) == ['file_name', 'skills', 'projects']
+
+def test_subset_matches_the_full_parse(resume):
+    parser = ResumeParser(profile='tokenizer-only')
+    full = parser.parse(resume)
+    assert list(full) == ['file_name', *DEFAULT_FIELDS]
+    assert parser.parse(resume, fields=['experience']) == {'file_name': None, 'experience': full['experience']}
+
+def test_parse_many_without_skills_does_not_load_spacy(resume, monkeypatch):
+    parser = ResumeParser(profile='tokenizer-only')
+    monkeypatch.setattr(resume_parser, 'get_nlp', lambda profile: pytest.fail("spaCy was loaded"))
+    [result] = parser.parse_many([resume], fields=['education'])
+    assert list(result) == ['file_name', 'education']
+
+def test_unknown_fields_are_rejected(resume):
+    with pytest.raises(ValueError, match="Unknown result fields: salary"):
+        ResumeParser(profile='tokenizer-only').parse(resume, fields=['skills', 'salary'])
+
+def test_lazy_result_extracts_each_field_on_first_read(resume, calls):
+    result = ResumeParser(profile='tokenizer-only').parse_lazy(resume)
+    assert list(result) == ['file_name', *DEFAULT_FIELDS]
+    assert 'experience' in result and calls == []
+
+    experience = result['experience']
+    assert calls == ['experience']
+    assert result['experience'] is experience  # Extracted once
+    assert calls == ['experience']
+    assert result.extracted() == ['file_name', 'experience']
+
+    with pytest.raises(KeyError):
+        result['contact']
+
+def test_lazy_result_reads_back_the_same_values_as_parse(resume):
+    parser = ResumeParser(profile='tokenizer-only')
+    fields = ['skills', 'education', 'contact']
+    assert parser.parse_lazy(resume, fields=fields).to_dict() == parser.parse(resume, fields=fields)
@@ -0,0 +1,52 @@
+"""
+Section extractor tests - Header classification and section offsets
+"""
+from app.parser.section_extractor import _classify_line, identify_sections, identify_section_spans
+from app.parser.preprocessor import preprocess_text
+from app.parser.extractors.experience import extract_experience
+
+RESUME = "Jane Doe\nSKILLS\nPython, Go\n\nExperience:\nEngineer at Acme\n2019 - 2021\n"
+
+def test_classify_line_exact_and_alias_headers():
+    assert _classify_line("Skills:") == 'skills'
+    assert _classify_line("Professional Experience") == 'experience'
+    assert _classify_line("Certificates") == 'certifications'
+
+def test_classify_line_prefers_section_listed_first():
+    assert _classify_line("PROFESSIONAL CERTIFICATIONS AND PROJECTS") == 'certifications'
+    assert _classify_line("Projects And Experience") == 'experience'
+    assert _classify_line("EXPERIENCE & SKILLS") == 'experience'
+
+def test_classify_line_all_caps_matches_inside_words():
+    assert _classify_line("WORKEXPERIENCE") == 'experience'
+
+def test_classify_line_rejects_body_text():
+    assert _classify_line("Experienced engineer") is None
+    assert _classify_line("I have experience with many tools and worked on several projects") is None
+
+def test_section_spans_cover_the_content():
+    spans = identify_section_spans(RESUME)
+    assert {section: RESUME[start:end] for section, (start, end) in spans.items()} == {
+        'skills': "Python, Go",
+        'experience': "Engineer at Acme\n2019 - 2021"
+    }
+
+def test_section_spans_agree_with_identify_sections():
+    sections = identify_sections(RESUME)
+    for section, (start, end) in identify_section_spans(RESUME).items():
+        assert RESUME[start:end].strip() == sections[section]
+
+def test_section_spans_of_an_empty_section():
+    text = "Education\nSkills\nPython"
+    assert identify_section_spans(text) == {'education': (10, 10), 'skills': (17, 23)}
+
+def test_section_spans_fallback_without_headers():
+    text = "I have done a lot of things with my time\nmy technical skills include python\n\nand more"
+    start, end = identify_section_spans(text)['skills']
+    assert text[start:end] == "technical skills include python"
+
+def test_blank_lines_inside_a_section_are_kept():
+    text = "EXPERIENCE\n\nDeveloper at Acme\n2019 - 2021\n\n\nAnalyst at Initech\n2016 - 2019\n\nEDUCATION\nBSc"
+    sections = identify_sections(preprocess_text(text))
+    assert sections['experience'] == "Developer at Acme\n2019 - 2021\n\nAnalyst at Initech\n2016 - 2019"
+    assert len(extract_experience(sections['experience'])) == 2
@@ -0,0 +1,71 @@
+"""
+HTTP service tests - Uploads, micro-batching and request errors
+"""
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+from app.server import create_server
+
+RESUME = b"Jane Doe\n\nSKILLS\nPython, SQL\n"
+
+@pytest.fixture
+def server():
+    server = create_server(port=0, profile='tokenizer-only', max_wait=0.05, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.batcher.close()
+
+def post(server, body, filename='resume.txt', headers=None):
+    """POST a raw document and return (status, JSON payload)"""
+    url = f"http://127.0.0.1:{server.server_address[1]}/parse?filename={filename}"
+    request = urllib.request.Request(url, data=body, headers=headers or {}, method='POST')
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_raw_upload_is_parsed(server):
+    status, result = post(server, RESUME)
+    assert status == 200
+    assert result['file_name'] == 'resume.txt'
+    assert result == server.batcher.parser.parse(RESUME) | {'file_name': 'resume.txt'}
+
+def test_slow_conversion_does_not_hold_up_other_requests(server, monkeypatch):
+    parser = server.batcher.parser
+    prepare = parser.prepare
+
+    def slow_prepare(file_input, fields=None):
+        if file_input.name == 'slow.txt':
+            time.sleep(1)
+        return prepare(file_input, fields)
+
+    monkeypatch.setattr(parser, 'prepare', slow_prepare)
+    finished = {}
+
+    def upload(name):
+        post(server, RESUME, filename=name)
+        finished[name] = time.monotonic()
+
+    slow = threading.Thread(target=upload, args=('slow.txt',))
+    slow.start()
+    time.sleep(0.1)
+    upload('fast.txt')
+    slow.join()
+    assert finished['fast.txt'] < finished['slow.txt']
+
+def test_invalid_content_length_is_a_bad_request(server):
+    with socket.create_connection(server.server_address, timeout=10) as connection:
+        connection.sendall(b"POST /parse HTTP/1.1\r\nHost: localhost\r\nContent-Length: ten\r\n"
+                           b"Connection: close\r\n\r\n")
+        response = b''.join(iter(lambda: connection.recv(4096), b''))
+    head, _, body = response.partition(b'\r\n\r\n')
+    assert head.split()[1] == b'400'
+    assert json.loads(body) == {'error': 'Invalid Content-Length header'}
@@ -0,0 +1,50 @@
+"""
+Utils tests - Content hashing and inputs that cannot seek
+"""
+import io
+import pytest
+from app.parser.resume_parser import ResumeParser
+from app.parser.utils import compute_content_hash, picklable_input, rewindable_input
+from app.result_cache import ResultCache
+
+CONTENT = b"Jane Doe\n\nSKILLS\nPython, SQL\n"
+
+class Pipe(io.RawIOBase):
+    """Readable stream without seek, like a pipe or an HTTP body"""
+
+    def __init__(self, content, name=None):
+        self._content = io.BytesIO(content)
+        if name is not None:
+            self.name = name
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._content.readinto(buffer)
+
+def test_seekable_streams_are_hashed_from_the_start_and_rewound():
+    stream = io.BufferedReader(io.BytesIO(CONTENT))
+    stream.read(5)
+    assert compute_content_hash(stream) == compute_content_hash(CONTENT)
+    assert stream.tell() == 0
+
+def test_non_seekable_streams_are_not_rewound():
+    with pytest.raises(ValueError, match="not seekable"):
+        compute_content_hash(Pipe(CONTENT))
+    assert picklable_input(Pipe(CONTENT)) == CONTENT
+
+def test_rewindable_input_buffers_only_non_seekable_streams():
+    stream = io.BytesIO(CONTENT)
+    assert rewindable_input(stream) is stream
+    assert rewindable_input('resume.pdf') == 'resume.pdf'
+
+    buffered = rewindable_input(Pipe(CONTENT, name='resume.txt'))
+    assert buffered.getvalue() == CONTENT
+    assert buffered.name == 'resume.txt'
+
+def test_parser_reads_a_non_seekable_stream_once(tmp_path):
+    parser = ResumeParser(profile='tokenizer-only', cache=ResultCache(str(tmp_path / 'cache.db')))
+    result = parser.parse(Pipe(CONTENT, name='resume.txt'))
+    assert result == parser.parse(CONTENT) | {'file_name': 'resume.txt'}
+    assert 'python' in result['skills']